@@ -0,0 +1,56 @@
+"""
+P1 - Sinais e sistemas discretos.
+
+Importar o pacote não executa nenhum exemplo nem carrega matplotlib, scipy
+ou sympy: os submódulos são importados no primeiro acesso
+(P1.polos_zeros, P1.resposta_frequencia, ...) e, dentro deles, as
+bibliotecas pesadas só são carregadas quando usadas (ver importacao_tardia).
+
+Os exemplos de cada módulo ficam em `if __name__ == "__main__":` e rodam a
+partir da raiz do repositório com:
+    python -m P1.magnintude_e_fase_z
+"""
+import importlib
+
+_SUBMODULOS = (
+    'cache_fracoes',
+    'calc_direto_mag_e_fase',
+    'calc_periodo',
+    'convolucao',
+    'degrau',
+    'edo_1_grau',
+    'eq_parciais',
+    'expandir_polinomio',
+    'funcao_atraso',
+    'graficos_decimados',
+    'importacao_tardia',
+    'impulse',
+    'lfilter',
+    'lote_fracoes',
+    'mag_e_fase',
+    'magnintude_e_fase_z',
+    'media_movel',
+    'plano_z',
+    'polos_zeros',
+    'rampa',
+    'regime_permanente',
+    'relatorios',
+    'resposta_frequencia',
+    'salto_recorrencia',
+    'solve_edo_homogenea_2_grau',
+    'solve_eq_parciais',
+    'subplot',
+    'z_inversa',
+)
+
+__all__ = list(_SUBMODULOS)
+
+
+def __getattr__(nome):
+    if nome in _SUBMODULOS:
+        return importlib.import_module(f'.{nome}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULOS))
@@ -0,0 +1,324 @@
+import shelve
+from collections import OrderedDict
+from fractions import Fraction
+import numpy as np
+from .importacao_tardia import modulo_tardio
+from .solve_eq_parciais import _formatar_numero, _formatar_polinomio, decomposicao_fracao_parcial
+
+sp = modulo_tardio('sympy')
+sympy_parser = modulo_tardio('sympy.parsing.sympy_parser')
+
+def _normalizar_numericos(num, den, racional, casas=12):
+    """
+    Coeficientes numéricos divididos pelo coeficiente líder do denominador,
+    sem zeros à esquerda e arredondados (floats) ou convertidos em frações
+    (racional=True, como no caminho simbólico), e os coeficientes sem
+    normalizar (sem zeros à esquerda).
+    """
+    num = np.trim_zeros(np.atleast_1d(np.asarray(num, dtype=complex)), 'f')
+    den = np.trim_zeros(np.atleast_1d(np.asarray(den, dtype=complex)), 'f')
+    if len(den) == 0:
+        raise ValueError("Denominador não pode ser zero")
+
+    def chave(c):
+        if racional and c.imag == 0:
+            f = Fraction(float(c.real)).limit_denominator()
+            return (f.numerator, f.denominator)
+        return (round(c.real, casas) + 0.0, round(c.imag, casas) + 0.0)
+
+    return tuple(chave(c) for c in num / den[0]), tuple(chave(c) for c in den / den[0]), num, den
+
+
+def _forma_canonica(expressao, numerador, denominador, variavel, racional):
+    """
+    Chave canônica (ver chave_canonica) e os coeficientes da própria
+    consulta: ('numerica', num, den) com arrays complexos ou
+    ('simbolica', coef_num, coef_den) com coeficientes do sympy.
+    """
+    if numerador is not None and denominador is not None \
+            and not isinstance(numerador, str) and not isinstance(denominador, str):
+        chave_num, chave_den, num, den = _normalizar_numericos(numerador, denominador, racional)
+        return ('numerica', chave_num, chave_den), ('numerica', num, den)
+
+    var = sp.symbols(variavel)
+    if expressao is not None:
+        numer, denom = sympy_parser.parse_expr(expressao, local_dict={variavel: var}).as_numer_denom()
+    else:
+        numer = sympy_parser.parse_expr(numerador, local_dict={variavel: var})
+        denom = sympy_parser.parse_expr(denominador, local_dict={variavel: var})
+    coef_num = sp.Poly(numer, var).all_coeffs()
+    coef_den = sp.Poly(denom, var).all_coeffs()
+
+    try:
+        num = [complex(c) for c in coef_num]
+        den = [complex(c) for c in coef_den]
+    except TypeError:
+        # Coeficientes com outros símbolos: normaliza simbolicamente
+        lider = coef_den[0]
+        chave = ('simbolica',
+                 tuple(str(sp.simplify(c / lider)) for c in coef_num),
+                 tuple(str(sp.simplify(c / lider)) for c in coef_den))
+        return chave, ('simbolica', coef_num, coef_den)
+    chave_num, chave_den, num, den = _normalizar_numericos(num, den, racional)
+    return ('numerica', chave_num, chave_den), ('numerica', num, den)
+
+
+def chave_canonica(expressao=None, numerador=None, denominador=None, variavel='x',
+                   racional=False, tol=1e-4):
+    """
+    Forma canônica de uma fração racional, usada como chave do cache.
+
+    Expressões iguais a menos de formatação ou de um fator de escala
+    ("2/(2*x - 2)", "2 / (2*x-2)" e "1/(x - 1)", ou [2], [2, -2] e "2",
+    "2*x - 2") têm a mesma chave: coeficientes do Poly do numerador e do
+    denominador divididos pelo coeficiente líder do denominador, mais as
+    opções que mudam o resultado (variavel, racional e tol).
+
+    Parâmetros:
+    -----------
+    expressao, numerador, denominador, variavel, racional, tol :
+        Como em decomposicao_fracao_parcial
+
+    Retorna:
+    --------
+    chave : tuple
+        Tupla hashable (e serializável) que identifica a fração
+    """
+    chave, _ = _forma_canonica(expressao, numerador, denominador, variavel, racional)
+    return chave + (variavel, bool(racional), tol)
+
+
+def _coeficientes_sympy(consulta, racional):
+    """Coeficientes da consulta como números do sympy (frações se racional)."""
+    tipo, num, den = consulta
+    if tipo == 'simbolica':
+        return list(num), list(den)
+
+    # Coeficientes numéricos só chegam aqui com racional=True (sem ele o
+    # caminho é o numérico)
+    def para_sympy(c):
+        if c.imag:
+            return sp.sympify(complex(c))
+        f = Fraction(float(c.real)).limit_denominator()
+        return sp.Rational(f.numerator, f.denominator)
+
+    return [para_sympy(c) for c in num], [para_sympy(c) for c in den]
+
+
+def _decompor_sem_escala(consulta, variavel, racional, tol):
+    """
+    Decomposição da consulta com numerador e denominador divididos pelo
+    coeficiente líder do denominador (denominador mônico), que vale para
+    todas as consultas com a mesma chave.
+    """
+    tipo, num, den = consulta
+    if tipo == 'numerica' and not racional:
+        return decomposicao_fracao_parcial(numerador=np.real_if_close(num / den[0]),
+                                           denominador=np.real_if_close(den / den[0]),
+                                           variavel=variavel, tol=tol)
+    var = sp.symbols(variavel)
+    coef_num, coef_den = _coeficientes_sympy(consulta, racional)
+    lider = coef_den[0]
+    numer = sp.Poly([sp.simplify(c / lider) for c in coef_num], var).as_expr()
+    denom = sp.Poly([sp.simplify(c / lider) for c in coef_den], var).as_expr()
+    return decomposicao_fracao_parcial(numerador=str(numer), denominador=str(denom),
+                                       variavel=variavel, racional=racional, tol=tol)
+
+
+def _na_escala(resultado, consulta, variavel, racional):
+    """
+    Resultado sem escala (ver _decompor_sem_escala) com os campos que
+    dependem da escala refeitos para a consulta: 'original', 'simplificada',
+    'denominador_fatorado' e 'houve_simplificacao'. A decomposição não muda.
+    """
+    resultado = dict(resultado)
+    tipo, num, den = consulta
+
+    if resultado['metodo'] == 'numerico':
+        num, den = np.real_if_close(num), np.real_if_close(den)
+        lider = den[0]
+        original = f"({_formatar_polinomio(num, variavel)})/({_formatar_polinomio(den, variavel)})"
+        resultado['original'] = resultado['original_str'] = original
+        if resultado['houve_simplificacao']:
+            num_simp = lider * resultado['num_simplificado']
+            den_simp = lider * resultado['den_simplificado']
+            simplificada = f"({_formatar_polinomio(num_simp, variavel)})/({_formatar_polinomio(den_simp, variavel)})"
+        else:
+            num_simp, den_simp = num, den
+            simplificada = original
+        resultado['simplificada'] = resultado['simplificada_str'] = simplificada
+        resultado['num_simplificado'], resultado['den_simplificado'] = num_simp, den_simp
+        if lider != 1:
+            if len(resultado['polos']):
+                resultado['denominador_fatorado'] = f"{_formatar_numero(lider)}*{resultado['denominador_fatorado']}"
+            else:
+                resultado['denominador_fatorado'] = _formatar_numero(lider)
+        return resultado
+
+    var = sp.symbols(variavel)
+    coef_num, coef_den = _coeficientes_sympy(consulta, racional)
+    numer = sp.Poly(coef_num, var).as_expr()
+    denom = sp.Poly(coef_den, var).as_expr()
+    resultado['original'] = numer / denom
+    resultado['original_str'] = f"({numer})/({denom})"
+    resultado['houve_simplificacao'] = resultado['original'] != resultado['simplificada']
+    return resultado
+
+
+def _congelar(resultado):
+    """
+    Marca como somente leitura os arrays de um resultado guardado no cache,
+    que são compartilhados entre as consultas (como em tabelas_kernel). O
+    pickle do shelve devolve arrays graváveis, então vale também para o disco.
+    """
+    for valor in resultado.values():
+        if isinstance(valor, np.ndarray):
+            valor.setflags(write=False)
+    return resultado
+
+
+class CacheDecomposicoes:
+    """
+    Cache de decomposicao_fracao_parcial com LRU em memória e, opcionalmente,
+    armazenamento em disco (shelve).
+
+    Há dois níveis de atalho:
+    - apelidos: texto exato da chamada -> chave canônica e coeficientes da
+      consulta. Uma string já vista nem passa pelo parse do sympy;
+    - resultados: chave canônica -> decomposição com o denominador mônico.
+      Expressões que só diferem na formatação ou por um fator de escala
+      reaproveitam o mesmo resultado; os campos que dependem da escala
+      ('original', 'simplificada', 'denominador_fatorado' e
+      'houve_simplificacao') são refeitos a cada consulta a partir dos
+      coeficientes dela.
+
+    Cada consulta devolve um dicionário novo, mas os arrays do caminho
+    numérico ('residuos', 'polos', ...) são compartilhados entre as chamadas
+    e ficam somente leitura (use .copy() para alterá-los).
+
+    Parâmetros:
+    -----------
+    tamanho_max : int
+        Número máximo de resultados (e de apelidos) em memória (padrão: 1024)
+    arquivo : str ou None
+        Caminho do arquivo shelve. Se None, o cache fica só em memória
+
+    Exemplo:
+    --------
+    >>> cache = CacheDecomposicoes(arquivo='fracoes.db')
+    >>> r = cache.decompor("(x**2)/(x**2 - 0.9*x + 0.9)")
+    >>> cache.estatisticas()['taxa_acerto']
+    """
+
+    def __init__(self, tamanho_max=1024, arquivo=None):
+        self.tamanho_max = tamanho_max
+        self._resultados = OrderedDict()
+        self._apelidos = OrderedDict()
+        self._disco = shelve.open(arquivo) if arquivo is not None else None
+        self.acertos_memoria = 0
+        self.acertos_disco = 0
+        self.faltas = 0
+
+    def _guardar(self, tabela, chave, valor):
+        tabela[chave] = valor
+        tabela.move_to_end(chave)
+        if len(tabela) > self.tamanho_max:
+            tabela.popitem(last=False)
+
+    def _chave(self, expressao, numerador, denominador, variavel, racional, tol):
+        # Só entradas em texto têm apelido: listas de coeficientes já são
+        # normalizadas sem sympy
+        if numerador is not None and not isinstance(numerador, str):
+            chave, consulta = _forma_canonica(expressao, numerador, denominador, variavel, racional)
+            return chave + (variavel, bool(racional), tol), consulta
+
+        apelido = (expressao, numerador, denominador, variavel, bool(racional), tol)
+        forma = self._apelidos.get(apelido)
+        if forma is None:
+            chave, consulta = _forma_canonica(expressao, numerador, denominador, variavel, racional)
+            forma = (chave + (variavel, bool(racional), tol), consulta)
+        self._guardar(self._apelidos, apelido, forma)
+        return forma
+
+    def decompor(self, expressao=None, numerador=None, denominador=None, variavel='x',
+                 racional=False, tol=1e-4):
+        """
+        Mesma interface e mesmo retorno de decomposicao_fracao_parcial,
+        consultando o cache antes de calcular.
+        """
+        try:
+            chave, consulta = self._chave(expressao, numerador, denominador, variavel, racional, tol)
+        except Exception:
+            # Entrada inválida: a própria função monta a mensagem de erro
+            return decomposicao_fracao_parcial(expressao, numerador, denominador, variavel, racional, tol)
+
+        resultado = self._resultados.get(chave)
+        if resultado is not None:
+            self.acertos_memoria += 1
+            self._resultados.move_to_end(chave)
+            return _na_escala(resultado, consulta, variavel, racional)
+
+        if self._disco is not None:
+            resultado = self._disco.get(repr(chave))
+            if resultado is not None:
+                self.acertos_disco += 1
+                self._guardar(self._resultados, chave, _congelar(resultado))
+                return _na_escala(resultado, consulta, variavel, racional)
+
+        self.faltas += 1
+        resultado = _decompor_sem_escala(consulta, variavel, racional, tol)
+        if 'erro' in resultado:
+            return decomposicao_fracao_parcial(expressao, numerador, denominador, variavel, racional, tol)
+        self._guardar(self._resultados, chave, _congelar(resultado))
+        if self._disco is not None:
+            self._disco[repr(chave)] = resultado
+        return _na_escala(resultado, consulta, variavel, racional)
+
+    def estatisticas(self):
+        """
+        Retorna:
+        --------
+        dict com 'acertos_memoria', 'acertos_disco', 'faltas', 'consultas',
+        'taxa_acerto' (fração de consultas atendidas pelo cache) e 'tamanho'
+        (resultados em memória)
+        """
+        consultas = self.acertos_memoria + self.acertos_disco + self.faltas
+        acertos = self.acertos_memoria + self.acertos_disco
+        return {
+            'acertos_memoria': self.acertos_memoria,
+            'acertos_disco': self.acertos_disco,
+            'faltas': self.faltas,
+            'consultas': consultas,
+            'taxa_acerto': acertos / consultas if consultas else 0.0,
+            'tamanho': len(self._resultados),
+        }
+
+    def limpar(self):
+        """Esvazia o cache em memória e zera as estatísticas (o disco é mantido)."""
+        self._resultados.clear()
+        self._apelidos.clear()
+        self.acertos_memoria = self.acertos_disco = self.faltas = 0
+
+    def fechar(self):
+        """Grava e fecha o arquivo em disco, se houver."""
+        if self._disco is not None:
+            self._disco.close()
+            self._disco = None
+
+
+# Cache padrão do módulo, só em memória
+_cache_padrao = CacheDecomposicoes()
+
+
+def decomposicao_em_cache(expressao=None, numerador=None, denominador=None, variavel='x',
+                          racional=False, tol=1e-4):
+    """
+    decomposicao_fracao_parcial com o cache padrão do módulo (só memória).
+    Para guardar em disco ou controlar o tamanho, crie um CacheDecomposicoes.
+    """
+    return _cache_padrao.decompor(expressao, numerador, denominador, variavel, racional, tol)
+
+
+def estatisticas_cache():
+    """Estatísticas do cache padrão (ver CacheDecomposicoes.estatisticas)."""
+    return _cache_padrao.estatisticas()
@@ -1,70 +1,210 @@
+import multiprocessing
+from functools import lru_cache
 import numpy as np
-import matplotlib.pyplot as plt
-import sympy as sp
-
-# 1. Definição do Sistema
-num = [0.038, 0.034]
-den = [1, -1.63, 0.70]
-
-# 2. Definição do Sinal de Entrada Senoidal
-A_in = 1
-omega_0 = np.pi / 4
-phi_in = 0
-
-print(f"Sinal de Entrada: x[n] = {A_in:.2f} * cos({omega_0:.2f}*n + {phi_in:.2f})\n")
-
-# 3. Cálculo da Resposta em Frequência para ω0
-z = np.exp(1j * omega_0)
-H_em_omega_0 = np.polyval(num, z) / np.polyval(den, z)
-
-# 4. Amplitude e fase da resposta numéricas
-mag_H = np.abs(H_em_omega_0)
-fase_H = np.angle(H_em_omega_0)
-
-print(f"Na frequência Ω₀ = {omega_0:.2f} rad/amostra:")
-print(f"   - Ganho de Amplitude |H(e^jΩ₀)| = {mag_H:.4f}")
-print(f"   - Deslocamento de Fase ∠H(e^jΩ₀) = {fase_H:.4f} rad\n")
-
-# 5. Cálculo simbólico das expressões de magnitude e fase
-omega = sp.symbols('omega', real=True)
-z_sym = sp.exp(sp.I * omega)
-
-num_poly = sum(num[i] * z_sym**(len(num) - 1 - i) for i in range(len(num)))
-den_poly = sum(den[i] * z_sym**(len(den) - 1 - i) for i in range(len(den)))
-H_sym = sp.simplify(num_poly / den_poly)
-
-# Expressões simbólicas de magnitude e fase
-mag_expr = sp.simplify(sp.Abs(H_sym))
-fase_expr = sp.simplify(sp.arg(H_sym))
-
-print("Expressão simbólica da magnitude:")
-sp.pprint(mag_expr)
-print("\nExpressão simbólica da fase (radianos):")
-sp.pprint(fase_expr)
-print()
-
-# 6. Sinal de saída previsto
-A_out = A_in * mag_H
-phi_out = phi_in + fase_H
-
-print(f"Sinal de Saída Previsto: y[n] = {A_out:.2f} * cos({omega_0:.2f}*n + {phi_out:.2f})")
-
-# 7. Geração e plotagem dos sinais
-n = np.arange(0, 51)
-x_n = A_in * np.cos(omega_0 * n + phi_in)
-y_n = A_out * np.cos(omega_0 * n + phi_out)
-
-# Plot
-plt.figure(figsize=(8, 4))
-plt.plot(n, x_n, 'b-o', label='Sinal de Entrada x[n]', linewidth=1.5)
-plt.plot(n, y_n, 'r-s', label='Sinal de Saída y[n]', linewidth=1.5)
-plt.title('Resposta do Sistema a uma Entrada Senoidal')
-plt.xlabel('Amostra (n)')
-plt.ylabel('Amplitude')
-plt.legend()
-plt.grid(True)
-plt.tight_layout()
-plt.show()
+from .importacao_tardia import modulo_tardio
+from .regime_permanente import regime_permanente
+
+plt = modulo_tardio('matplotlib.pyplot')
+sp = modulo_tardio('sympy')
+
+
+def simplificar_com_limite(expr, tempo_limite=5.0):
+    """
+    Aplica sp.simplify com limite de tempo.
+
+    O simplify roda num processo separado, que só existe durante a chamada
+    (o with encerra o processo na saída); se não terminar em tempo_limite
+    segundos a expressão volta sem simplificar (ela continua correta, só
+    mais longa).
+
+    Parâmetros:
+    -----------
+    expr : sympy.Expr
+        Expressão a simplificar
+    tempo_limite : float ou None
+        Tempo máximo em segundos. Se None, simplifica no próprio processo, sem limite
+
+    Retorna:
+    --------
+    sympy.Expr
+        Expressão simplificada, ou a original se o tempo acabar
+    """
+    if tempo_limite is None:
+        return sp.simplify(expr)
+
+    with multiprocessing.Pool(1) as processo:
+        try:
+            return processo.apply_async(sp.simplify, (expr,)).get(timeout=tempo_limite)
+        except multiprocessing.TimeoutError:
+            return expr
+
+
+def _avaliar_H(num, den, w):
+    """H(e^jω) = Σ num[i] z^(M-i) / Σ den[i] z^(N-i) em z = e^jω, por np.polyval."""
+    z = np.exp(1j * np.asarray(w, dtype=float))
+    return np.polyval(num, z) / np.polyval(den, z)
+
+
+@lru_cache(maxsize=128)
+def _mag_fase_polyval(num, den, simplificar, tempo_limite):
+    omega = sp.symbols('omega', real=True)
+    z_sym = sp.exp(sp.I * omega)
+
+    num_poly = sum(num[i] * z_sym**(len(num) - 1 - i) for i in range(len(num)))
+    den_poly = sum(den[i] * z_sym**(len(den) - 1 - i) for i in range(len(den)))
+    H_sym = num_poly / den_poly
+
+    mag_expr = sp.Abs(H_sym)
+    fase_expr = sp.arg(H_sym)
+    if simplificar:
+        mag_expr = simplificar_com_limite(mag_expr, tempo_limite)
+        fase_expr = simplificar_com_limite(fase_expr, tempo_limite)
+
+    # As expressões servem só para exibição: os valores saem de np.polyval
+    # em e^jω, ~10x mais rápido que Abs/arg compilados com lambdify
+    def mag_func(w):
+        return np.abs(_avaliar_H(num, den, w))
+
+    def fase_func(w):
+        return np.angle(_avaliar_H(num, den, w))
+
+    return mag_func, fase_func, mag_expr, fase_expr
+
+
+def funcoes_mag_fase(num, den, simplificar=False, tempo_limite=5.0):
+    """
+    Monta |H(e^jω)| e ∠H(e^jω) simbolicamente, para exibição, e as funções
+    numéricas correspondentes.
+
+    H(z) = Σ num[i] z^(M-i) / Σ den[i] z^(N-i) (potências decrescentes de z,
+    como em np.polyval). As funções avaliam H por np.polyval em e^jω
+    (vetorizadas; o sympy não entra no cálculo dos valores). Tudo fica em
+    cache por (num, den, simplificar, tempo_limite): a segunda chamada com o
+    mesmo sistema não passa pelo sympy.
+
+    Parâmetros:
+    -----------
+    num : array_like
+        Coeficientes do numerador
+    den : array_like
+        Coeficientes do denominador
+    simplificar : bool
+        Se True, aplica simplify nas expressões (lento; só muda a forma
+        impressa, não os valores). Padrão: False
+    tempo_limite : float ou None
+        Limite de tempo de cada simplify, em segundos (ver simplificar_com_limite)
+
+    Retorna:
+    --------
+    mag_func, fase_func : callable
+        Funções de ω (escalar ou ndarray) que retornam magnitude e fase (rad)
+    mag_expr, fase_expr : sympy.Expr
+        Expressões simbólicas correspondentes
+    """
+    num = tuple(float(c) for c in num)
+    den = tuple(float(c) for c in den)
+    return _mag_fase_polyval(num, den, simplificar, tempo_limite)
+
+
+def calcular_mag_fase(num, den, w):
+    """
+    Avalia magnitude e fase de H(e^jω) numa grade ω por np.polyval em e^jω,
+    sem montar as expressões simbólicas.
+
+    Parâmetros:
+    -----------
+    num, den : array_like
+        Coeficientes de H(z) (potências decrescentes de z)
+    w : float ou ndarray
+        Frequências em rad/amostra
+
+    Retorna:
+    --------
+    mag : ndarray
+        Magnitude em cada ω
+    fase : ndarray
+        Fase em radianos em cada ω
+    """
+    num = np.asarray(num, dtype=float)
+    den = np.asarray(den, dtype=float)
+    H = _avaliar_H(num, den, w)
+    return np.abs(H), np.angle(H)
+
+
+
+if __name__ == "__main__":
+    # 1. Definição do Sistema
+    num = [0.038, 0.034]
+    den = [1, -1.63, 0.70]
+
+    # 2. Definição do Sinal de Entrada Senoidal
+    A_in = 1
+    omega_0 = np.pi / 4
+    phi_in = 0
+
+    print(f"Sinal de Entrada: x[n] = {A_in:.2f} * cos({omega_0:.2f}*n + {phi_in:.2f})\n")
+
+    # 3. Cálculo da Resposta em Frequência para ω0
+    z = np.exp(1j * omega_0)
+    H_em_omega_0 = np.polyval(num, z) / np.polyval(den, z)
+
+    # 4. Amplitude e fase da resposta numéricas
+    mag_H = np.abs(H_em_omega_0)
+    fase_H = np.angle(H_em_omega_0)
+
+    print(f"Na frequência Ω₀ = {omega_0:.2f} rad/amostra:")
+    print(f"   - Ganho de Amplitude |H(e^jΩ₀)| = {mag_H:.4f}")
+    print(f"   - Deslocamento de Fase ∠H(e^jΩ₀) = {fase_H:.4f} rad\n")
+
+    # 5. Cálculo simbólico das expressões de magnitude e fase
+    # (só para exibição; o simplify só melhora a forma impressa)
+    mag_func, fase_func, mag_expr, fase_expr = funcoes_mag_fase(num, den, simplificar=True)
+
+    print("Expressão simbólica da magnitude:")
+    sp.pprint(mag_expr)
+    print("\nExpressão simbólica da fase (radianos):")
+    sp.pprint(fase_expr)
+    print()
+
+    # As funções numéricas reproduzem o cálculo do item 4
+    print(f"Verificação numérica: |H| = {mag_func(omega_0):.4f}, ∠H = {fase_func(omega_0):.4f} rad\n")
+
+    # 6. Sinal de saída previsto
+    A_out = A_in * mag_H
+    phi_out = phi_in + fase_H
+
+    print(f"Sinal de Saída Previsto: y[n] = {A_out:.2f} * cos({omega_0:.2f}*n + {phi_out:.2f})")
+
+    # 7. Geração e plotagem dos sinais
+    n = np.arange(0, 51)
+    x_n = A_in * np.cos(omega_0 * n + phi_in)
+    y_n = A_out * np.cos(omega_0 * n + phi_out)
+
+    # Plot
+    plt.figure(figsize=(8, 4))
+    plt.plot(n, x_n, 'b-o', label='Sinal de Entrada x[n]', linewidth=1.5)
+    plt.plot(n, y_n, 'r-s', label='Sinal de Saída y[n]', linewidth=1.5)
+    plt.title('Resposta do Sistema a uma Entrada Senoidal')
+    plt.xlabel('Amostra (n)')
+    plt.ylabel('Amplitude')
+    plt.legend()
+    plt.grid(True)
+    plt.tight_layout()
+    plt.show()
+
+    # 8. Entrada com vários tons: x[n] = cos(π/4 n) + 0.5 cos(3π/4 n), período 8.
+    # O regime permanente sai da DFT de um período (regime_permanente), sem
+    # simular o transitório. num/den estão em potências de z: em z^-1,
+    # o numerador ganha zeros à esquerda até o tamanho do denominador
+    b = np.concatenate([np.zeros(len(den) - len(num)), num])
+    n_periodo = np.arange(8)
+    x_periodo = np.cos(np.pi / 4 * n_periodo) + 0.5 * np.cos(3 * np.pi / 4 * n_periodo)
+    y_periodo = regime_permanente(b, den, x_periodo)
+    print(f"\nRegime permanente para dois tons (um período): {np.round(y_periodo, 4)}")
+
+    # Só com o primeiro tom, coincide com a previsão do item 6
+    y_um_tom = regime_permanente(b, den, np.cos(omega_0 * n_periodo + phi_in))
+    print(f"Diferença para A_out cos(ω0 n + φ_out): {np.max(np.abs(y_um_tom - y_n[:8])):.2e}")
 
 
 
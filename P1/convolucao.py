@@ -1,5 +1,8 @@
 import numpy as np
-import matplotlib.pyplot as plt
+from .graficos_decimados import stem_decimado
+from .importacao_tardia import modulo_tardio
+
+plt = modulo_tardio('matplotlib.pyplot')
 
 def convolucao(x, h):
     result = [0] * (len(x) + len(h) - 1)
@@ -11,37 +14,38 @@ def convolucao(x, h):
     print(result)
     return result
 
-n_samples=4
-n=np.arange(n_samples)
-x = 500*np.ones(n_samples)
-x[0]=9000
+if __name__ == "__main__":
+    n_samples=4
+    n=np.arange(n_samples)
+    x = 500*np.ones(n_samples)
+    x[0]=9000
 
 
-h = (1.01)**n;    
+    h = (1.01)**n;    
 
-y=convolucao(x,h)
+    y=convolucao(x,h)
 
 
 
-fig, axs = plt.subplots(3, 1, figsize=(6, 4), sharex=True)
-t = np.arange(0, max(len(x), len(h)),1)
+    fig, axs = plt.subplots(3, 1, figsize=(6, 4), sharex=True)
+    t = np.arange(0, max(len(x), len(h)),1)
 
-axs[0].stem(t[:len(x)], x, linefmt='red', markerfmt='ro', basefmt='k')
-axs[0].set_title('Entrada')
-axs[0].grid(True)
+    stem_decimado(axs[0], t[:len(x)], x, linefmt='red', markerfmt='ro', basefmt='k')
+    axs[0].set_title('Entrada')
+    axs[0].grid(True)
 
-axs[1].stem(t[:len(h)], h, linefmt='blue', markerfmt='bo', basefmt='k')
-axs[1].set_title('H')
-axs[1].grid(True)
+    stem_decimado(axs[1], t[:len(h)], h, linefmt='blue', markerfmt='bo', basefmt='k')
+    axs[1].set_title('H')
+    axs[1].grid(True)
 
-axs[2].stem(np.arange(len(y)), y, linefmt='green', markerfmt='go', basefmt='k')
-axs[2].set_title('Convolução')
-axs[2].grid(True)
+    stem_decimado(axs[2], np.arange(len(y)), y, linefmt='green', markerfmt='go', basefmt='k')
+    axs[2].set_title('Convolução')
+    axs[2].grid(True)
 
-plt.xlabel('Tempo (n)')
-plt.tight_layout()
-plt.show()
+    plt.xlabel('Tempo (n)')
+    plt.tight_layout()
+    plt.show()
 
 
 
-  
\ No newline at end of file
+  
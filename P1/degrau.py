@@ -8,6 +8,6 @@ def degrau(n):
             array.append(0)
     return array
 
-print(degrau(1))
-print(degrau(3))
-
+if __name__ == "__main__":
+    print(degrau(1))
+    print(degrau(3))
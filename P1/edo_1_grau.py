@@ -1,20 +1,156 @@
 import numpy as np
-import matplotlib.pyplot as plt
+from .importacao_tardia import modulo_tardio
 
-tau=1
-k=0
-a=-1/tau
-b=-k/tau
+plt = modulo_tardio('matplotlib.pyplot')
 
-vo=5
+def resposta_1_grau(tau, k, v0, t):
+    """
+    Solução de τ y'(t) + y(t) = k com y(0) = v0:
+        y(t) = k + (v0 - k) e^(-t/τ)
 
-c=vo-k
+    tau, k e v0 são combinados por broadcasting (formato S) e cada
+    combinação é avaliada em todos os instantes de t.
 
-t=np.arange(50)
-e=np.exp
-y=(b/a)+np.multiply(c,np.exp(np.multiply(a,t)))
+    Parâmetros:
+    -----------
+    tau, k, v0 : número ou array_like
+        Constante de tempo, valor final e valor inicial
+    t : array_like
+        Instantes (1D, L elementos)
 
+    Retorna:
+    --------
+    y : ndarray
+        Formato S + (L,)
+    """
+    tau, k, v0 = np.broadcast_arrays(*(np.asarray(p, dtype=float) for p in (tau, k, v0)))
+    t = np.asarray(t, dtype=float)
+    return k[..., None] + (v0 - k)[..., None] * np.exp(-t / tau[..., None])
 
 
-plt.plot(t,y)
-plt.show()
\ No newline at end of file
+def estatisticas_1_grau(tau, k, v0, tolerancia=0.02, banda=None):
+    """
+    Estatísticas da resposta de primeira ordem pela forma fechada, sem
+    calcular nenhuma trajetória.
+
+    - tempo de acomodação: |y(t) - k| <= tolerancia·|v0 - k| a partir de
+      t = τ ln(1/tolerancia), ou, com banda absoluta, |y(t) - k| <= banda a
+      partir de t = τ ln(|v0 - k|/banda) (0 se já começa na banda);
+    - tempo de subida (10% a 90% do degrau): τ ln 9;
+    - meia-vida (metade do caminho até k): τ ln 2.
+
+    Com τ <= 0 o sistema não converge: os tempos valem inf (e o valor
+    final, nan), a menos que v0 = k.
+
+    Parâmetros:
+    -----------
+    tau, k, v0 : número ou array_like
+        Combinados por broadcasting
+    tolerancia : float
+        Faixa relativa ao tamanho do degrau |v0 - k| (padrão: 0.02)
+    banda : float ou None
+        Faixa absoluta em torno de k; se informada, substitui tolerancia
+
+    Retorna:
+    --------
+    estatisticas : dict
+        'valor_final', 'tempo_acomodacao', 'tempo_subida' e 'meia_vida',
+        cada um com o formato do broadcasting de tau, k e v0
+    """
+    tau, k, v0 = np.broadcast_arrays(*(np.asarray(p, dtype=float) for p in (tau, k, v0)))
+    degrau = np.abs(v0 - k)
+    estavel = (tau > 0) | (degrau == 0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if banda is None:
+            acomodacao = tau * np.log(1 / tolerancia)
+        else:
+            acomodacao = tau * np.maximum(np.log(degrau / banda), 0)
+        acomodacao = np.where(degrau == 0, 0.0, acomodacao)
+
+    def tempo(valor):
+        return np.where(estavel, np.where(degrau == 0, 0.0, valor), np.inf)
+
+    return {
+        'valor_final': np.where(estavel, k, np.nan),
+        'tempo_acomodacao': tempo(acomodacao),
+        'tempo_subida': tempo(tau * np.log(9)),
+        'meia_vida': tempo(tau * np.log(2)),
+    }
+
+
+def varrer_parametros(tau, k, v0, t, reducao=None, tamanho_bloco=1 << 16):
+    """
+    Avalia y(t) para todas as combinações de tau, k e v0 em blocos, para
+    que varreduras de milhões de combinações não precisem de uma matriz
+    (combinações × instantes) inteira na memória.
+
+    Parâmetros:
+    -----------
+    tau, k, v0 : número ou array_like
+        Combinados por broadcasting (formato S)
+    t : array_like
+        Instantes (1D, L elementos)
+    reducao : callable ou None
+        Função aplicada a cada bloco de trajetórias, de formato (B, L), que
+        devolve um valor por trajetória, por exemplo
+        lambda y: np.max(np.abs(y), axis=-1). Se None, devolve as
+        trajetórias completas (formato S + (L,))
+    tamanho_bloco : int
+        Número de combinações por bloco (padrão: 65536)
+
+    Retorna:
+    --------
+    ndarray
+        Formato S (com reducao) ou S + (L,)
+    """
+    tau, k, v0 = np.broadcast_arrays(*(np.asarray(p, dtype=float) for p in (tau, k, v0)))
+    forma = tau.shape
+    tau, k, v0 = tau.ravel(), k.ravel(), v0.ravel()
+    t = np.asarray(t, dtype=float)
+
+    if reducao is None:
+        saida = np.empty((tau.size, t.size))
+    else:
+        saida = None
+    for inicio in range(0, tau.size, tamanho_bloco):
+        fatia = slice(inicio, inicio + tamanho_bloco)
+        y = resposta_1_grau(tau[fatia], k[fatia], v0[fatia], t)
+        if reducao is None:
+            saida[fatia] = y
+            continue
+        valores = np.asarray(reducao(y))
+        if saida is None:
+            saida = np.empty((tau.size,) + valores.shape[1:], dtype=valores.dtype)
+        saida[fatia] = valores
+
+    if saida is None:
+        return np.empty(forma)
+    return saida.reshape(forma + saida.shape[1:])
+
+
+if __name__ == "__main__":
+    tau=1
+    k=0
+    vo=5
+
+    t=np.arange(50)
+    y=resposta_1_grau(tau,k,vo,t)
+
+    plt.plot(t,y)
+    plt.show()
+
+    # Varredura de sensibilidade: 1 milhão de combinações (τ, k, v0)
+    rng = np.random.default_rng(0)
+    taus = rng.uniform(0.5, 5, 1_000_000)
+    ks = rng.uniform(-1, 1, 1_000_000)
+    v0s = rng.uniform(0, 10, 1_000_000)
+
+    estatisticas = estatisticas_1_grau(taus, ks, v0s, banda=0.05)
+    print(f"Tempo de acomodação (banda 0.05): média {estatisticas['tempo_acomodacao'].mean():.3f}, "
+          f"máximo {estatisticas['tempo_acomodacao'].max():.3f}")
+
+    # y(10) de cada combinação, em blocos, sem guardar as trajetórias
+    grade = np.linspace(0, 10, 50)
+    y_final = varrer_parametros(taus, ks, v0s, grade, reducao=lambda y: y[:, -1])
+    print(f"y(10): média {y_final.mean():.4f}, desvio {y_final.std():.4f}")
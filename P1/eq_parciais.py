@@ -1,13 +1,16 @@
-from sympy import symbols, apart
+from .importacao_tardia import modulo_tardio
 
-# 1. Definir a variável simbólica
-x = symbols('x')
+sp = modulo_tardio('sympy')
 
-# 2. Definir a expressão
-expressao = x**2 / (x**2 - 0.9*x + 0.9)
+if __name__ == "__main__":
+    # 1. Definir a variável simbólica
+    x = sp.symbols('x')
 
-# 3. Decompor em frações parciais
-fracoes_parciais = apart(expressao)
+    # 2. Definir a expressão
+    expressao = x**2 / (x**2 - 0.9*x + 0.9)
 
-# 4. Imprimir o resultado
-print(fracoes_parciais)
\ No newline at end of file
+    # 3. Decompor em frações parciais
+    fracoes_parciais = sp.apart(expressao)
+
+    # 4. Imprimir o resultado
+    print(fracoes_parciais)
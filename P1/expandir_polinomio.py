@@ -1,8 +1,170 @@
-from sympy import symbols, expand, factor
+from fractions import Fraction
+import numpy as np
+from .importacao_tardia import modulo_tardio
 
-x = symbols('x')
-expr = (x - 2)*(x - 3)
+sp = modulo_tardio('sympy')
 
-print("Forma fatorada:", expr)
-print("Forma expandida:", expand(expr))
+def _multiplicar_exato(a, b):
+    """Produto de dois polinômios com coeficientes Fraction (convolução direta)."""
+    produto = [Fraction(0)] * (len(a) + len(b) - 1)
+    for i, ai in enumerate(a):
+        if ai == 0:
+            continue
+        for j, bj in enumerate(b):
+            produto[i + j] += ai * bj
+    return produto
 
+
+def multiplicar_polinomios(a, b, limiar_fft=None):
+    """
+    Multiplica dois polinômios (coeficientes em potências decrescentes).
+
+    Por padrão usa np.convolve (O(n·m)). Se limiar_fft for dado e os dois
+    polinômios tiverem pelo menos esse tamanho, usa FFT (O((n+m) log(n+m))),
+    com rfft quando os dois são reais. O erro da FFT é absoluto, da ordem de
+    eps vezes o maior coeficiente: coeficientes pequenos (o termo constante
+    de um Butterworth de ordem alta, por exemplo) são perdidos. Só use a FFT
+    quando a faixa dinâmica dos coeficientes for pequena.
+
+    Parâmetros:
+    -----------
+    a, b : array_like
+        Coeficientes dos polinômios
+    limiar_fft : int ou None
+        Tamanho do menor polinômio a partir do qual usa FFT
+        (padrão: None, nunca usa FFT)
+
+    Retorna:
+    --------
+    produto : ndarray
+        Coeficientes do produto (len(a) + len(b) - 1 elementos)
+    """
+    a = np.atleast_1d(np.asarray(a))
+    b = np.atleast_1d(np.asarray(b))
+    if limiar_fft is None or min(len(a), len(b)) < limiar_fft:
+        return np.convolve(a, b)
+
+    n = len(a) + len(b) - 1
+    tamanho = 1 << (n - 1).bit_length()
+    if np.isrealobj(a) and np.isrealobj(b):
+        return np.fft.irfft(np.fft.rfft(a, tamanho) * np.fft.rfft(b, tamanho), tamanho)[:n]
+    return np.fft.ifft(np.fft.fft(a, tamanho) * np.fft.fft(b, tamanho))[:n]
+
+
+def expandir_produto(fatores, exato=False, limiar_fft=None):
+    """
+    Expande o produto de vários polinômios por uma árvore de produtos balanceada.
+
+    Multiplica os fatores dois a dois, depois os resultados dois a dois, e
+    assim por diante, com np.convolve em todos os níveis. O erro relativo de
+    cada coeficiente fica na ordem do de np.poly, inclusive nos coeficientes
+    muito pequenos. Com limiar_fft, os últimos níveis usam FFT (custo
+    O(n log² n) para n fatores de grau 1), ao preço de perder os coeficientes
+    pequenos (ver multiplicar_polinomios).
+
+    Parâmetros:
+    -----------
+    fatores : list
+        Lista de polinômios (coeficientes em potências decrescentes),
+        por exemplo seções de segunda ordem [b0, b1, b2]
+    exato : bool
+        Se True, usa aritmética racional exata (Fraction); os coeficientes
+        podem ser int, Fraction ou strings como '1/3' (padrão: False)
+    limiar_fft : int ou None
+        Repassado para multiplicar_polinomios
+
+    Retorna:
+    --------
+    coeficientes : ndarray
+        Coeficientes do produto, prontos para usar como num/den em freqz,
+        lfilter etc. No modo exato, array de objetos Fraction
+        (use .astype(float) para converter)
+    """
+    if exato:
+        nivel = [[Fraction(c) for c in np.atleast_1d(f)] for f in fatores]
+    else:
+        nivel = [np.atleast_1d(np.asarray(f)) for f in fatores]
+    if not nivel:
+        return np.array([Fraction(1)], dtype=object) if exato else np.ones(1)
+
+    while len(nivel) > 1:
+        proximo = []
+        for i in range(0, len(nivel) - 1, 2):
+            if exato:
+                proximo.append(_multiplicar_exato(nivel[i], nivel[i + 1]))
+            else:
+                proximo.append(multiplicar_polinomios(nivel[i], nivel[i + 1], limiar_fft))
+        if len(nivel) % 2:
+            proximo.append(nivel[-1])
+        nivel = proximo
+
+    if exato:
+        return np.array(nivel[0], dtype=object)
+    return nivel[0]
+
+
+def expandir_raizes(raizes, ganho=1, exato=False, limiar_fft=None):
+    """
+    Coeficientes de ganho · Π (x - r_k), como np.poly, pela árvore de produtos.
+
+    Raízes complexas em pares conjugados são agrupadas em fatores reais de
+    grau 2 (x² - 2Re(r)x + |r|²), então o resultado é real sempre que o
+    conjunto de raízes é fechado por conjugação (polos de Butterworth etc.).
+
+    Parâmetros:
+    -----------
+    raizes : array_like
+        Raízes do polinômio
+    ganho : número
+        Coeficiente líder (padrão: 1)
+    exato : bool
+        Se True, raízes racionais (int, Fraction, '1/3') em aritmética exata
+    limiar_fft : int ou None
+        Repassado para multiplicar_polinomios
+
+    Retorna:
+    --------
+    coeficientes : ndarray
+        Coeficientes em potências decrescentes (len(raizes) + 1 elementos)
+    """
+    if exato:
+        fatores = [[1, -Fraction(r)] for r in raizes]
+        return expandir_produto([[Fraction(ganho)]] + fatores, exato=True)
+
+    raizes = np.atleast_1d(np.asarray(raizes))
+    reais = raizes[np.abs(np.imag(raizes)) <= 1e-12 * np.maximum(1, np.abs(raizes))]
+    complexas = raizes[np.abs(np.imag(raizes)) > 1e-12 * np.maximum(1, np.abs(raizes))]
+
+    superiores = np.sort_complex(complexas[np.imag(complexas) > 0])
+    inferiores = np.sort_complex(np.conj(complexas[np.imag(complexas) < 0]))
+    pares = len(superiores) == len(inferiores) and np.allclose(superiores, inferiores)
+
+    if pares:
+        fatores = [[1.0, -np.real(r)] for r in reais]
+        fatores += [[1.0, -2 * np.real(r), np.abs(r) ** 2] for r in superiores]
+    else:
+        fatores = [[1.0, -r] for r in raizes]
+
+    return ganho * expandir_produto(fatores, limiar_fft=limiar_fft)
+
+
+if __name__ == "__main__":
+    x = sp.symbols('x')
+    expr = (x - 2)*(x - 3)
+
+    print("Forma fatorada:", expr)
+    print("Forma expandida:", sp.expand(expr))
+
+    # Mesmo produto, numérico e exato
+    print("Numérico:", expandir_raizes([2, 3]))
+    print("Exato:", expandir_raizes([2, 3], exato=True))
+
+    # Denominador de um Butterworth de ordem 128 a partir dos polos; os
+    # coeficientes vão de ~1 a ~1e-35, então o erro é medido coeficiente a
+    # coeficiente
+    from scipy import signal
+    z, p, k = signal.butter(128, 0.3, output='zpk')
+    den = expandir_raizes(p)
+    referencia = np.real(np.poly(p))
+    print("Maior erro relativo por coeficiente para np.poly:",
+          np.max(np.abs(den - referencia) / np.abs(referencia)))
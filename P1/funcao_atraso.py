@@ -1,6 +1,9 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from impulse import impulse
+from .impulse import impulse
+from .graficos_decimados import stem_decimado
+from .importacao_tardia import modulo_tardio
+
+plt = modulo_tardio('matplotlib.pyplot')
 
 # Função atraso
 def atraso(array, k):
@@ -13,25 +16,25 @@ def atraso(array, k):
     return newarray
 
 
-#SE FOR USAR ATERASO COMO IMPORT, COMENTAR ESSE PLOT
-# Parâmetros
-n = 3
-k = 2
-x_impulso = impulse(n)
-x_atrasado = atraso(x_impulso, k)
-t = np.arange(-n, len(x_impulso) - n)
+if __name__ == "__main__":
+    # Parâmetros
+    n = 3
+    k = 2
+    x_impulso = impulse(n)
+    x_atrasado = atraso(x_impulso, k)
+    t = np.arange(-n, len(x_impulso) - n)
 
-# Subplots
-fig, axs = plt.subplots(2, 1, figsize=(6, 4), sharex=True)
+    # Subplots
+    fig, axs = plt.subplots(2, 1, figsize=(6, 4), sharex=True)
 
-axs[0].stem(t, x_impulso, linefmt='red', markerfmt='ro', basefmt='k')
-axs[0].set_title('Impulso original')
-axs[0].grid(True)
+    stem_decimado(axs[0], t, x_impulso, linefmt='red', markerfmt='ro', basefmt='k')
+    axs[0].set_title('Impulso original')
+    axs[0].grid(True)
 
-axs[1].stem(t, x_atrasado, linefmt='blue', markerfmt='bo', basefmt='k')
-axs[1].set_title(f'Impulso atrasado de {k} unidades')
-axs[1].grid(True)
+    stem_decimado(axs[1], t, x_atrasado, linefmt='blue', markerfmt='bo', basefmt='k')
+    axs[1].set_title(f'Impulso atrasado de {k} unidades')
+    axs[1].grid(True)
 
-plt.xlabel('Tempo (n)')
-plt.tight_layout()
-plt.show()
\ No newline at end of file
+    plt.xlabel('Tempo (n)')
+    plt.tight_layout()
+    plt.show()
@@ -0,0 +1,191 @@
+import re
+import numpy as np
+from .importacao_tardia import modulo_tardio
+
+mcollections = modulo_tardio('matplotlib.collections')
+mcolors = modulo_tardio('matplotlib.colors')
+
+def envelope_min_max(x, y, n_baldes):
+    """
+    Reduz um sinal longo a envelopes de mínimo e máximo por balde.
+
+    Divide o eixo x (crescente) em n_baldes intervalos iguais e, em cada um,
+    guarda só o menor e o maior valor de y. Desenhar esses 2*n_baldes pontos
+    com um balde por pixel dá a mesma imagem que desenhar o sinal inteiro.
+
+    Parâmetros:
+    -----------
+    x : ndarray
+        Eixo (tempo ou índice), em ordem crescente
+    y : ndarray
+        Valores do sinal
+    n_baldes : int
+        Número de baldes (tipicamente a largura do gráfico em pixels)
+
+    Retorna:
+    --------
+    x_env : ndarray
+        Centro de cada balde não vazio, repetido duas vezes
+    y_env : ndarray
+        Mínimo e máximo intercalados: [min0, max0, min1, max1, ...]
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(x) == 0:
+        return x, y
+
+    bordas = np.linspace(x[0], x[-1], n_baldes + 1)
+    inicios = np.unique(np.searchsorted(x, bordas[:-1], side='left'))
+    inicios = inicios[inicios < len(x)]
+
+    minimos = np.minimum.reduceat(y, inicios)
+    maximos = np.maximum.reduceat(y, inicios)
+    fins = np.append(inicios[1:], len(x)) - 1
+    centros = (x[inicios] + x[fins]) / 2
+
+    x_env = np.repeat(centros, 2)
+    y_env = np.empty(2 * len(inicios), dtype=np.result_type(minimos, float))
+    y_env[0::2] = minimos
+    y_env[1::2] = maximos
+    return x_env, y_env
+
+
+def _largura_em_pixels(ax):
+    return max(int(ax.bbox.width), 100)
+
+
+def _trecho_visivel(ax, x, y):
+    """Retorna a parte de (x, y) dentro dos limites atuais do eixo x."""
+    xmin, xmax = sorted(ax.get_xlim())
+    i0 = max(np.searchsorted(x, xmin, side='left') - 1, 0)
+    i1 = np.searchsorted(x, xmax, side='right') + 1
+    return x[i0:i1], y[i0:i1]
+
+
+def _cor_do_formato(fmt):
+    """
+    Extrai a cor de um formato do matplotlib ('r-', '^r', 'red', 'C1--', ...).
+
+    Segue a regra do ax.plot: o formato inteiro pode ser uma cor; senão, a
+    cor é 'C<n>' ou uma das letras 'bgrcmykw' em qualquer posição (nenhum
+    marcador ou estilo de linha usa essas letras). Sem cor, usa 'C0'.
+    """
+    if mcolors.is_color_like(fmt):
+        return fmt
+    ciclo = re.search(r'C\d+', fmt)
+    if ciclo:
+        return ciclo.group()
+    for letra in fmt:
+        if letra in 'bgrcmykw':
+            return letra
+    return 'C0'
+
+
+def plotar_decimado(ax, x, y, *args, max_pontos=None, **kwargs):
+    """
+    Substituto de ax.plot para sinais longos.
+
+    Se o sinal tem mais pontos que 2 * largura do gráfico em pixels (ou
+    max_pontos), desenha só o envelope mínimo/máximo por pixel. Ao dar zoom
+    ou mover o gráfico, o trecho visível é decimado de novo, então o custo
+    depende da largura da tela e não do tamanho do sinal.
+
+    Parâmetros:
+    -----------
+    ax : Axes
+        Eixo do matplotlib
+    x, y : array_like
+        Sinal a desenhar (x crescente)
+    *args, **kwargs :
+        Repassados para ax.plot (formato, cor, label, ...)
+    max_pontos : int ou None
+        Acima desse número de pontos, decima. Se None, usa 2 * largura em pixels
+
+    Retorna:
+    --------
+    linha : Line2D
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    limite = max_pontos or 2 * _largura_em_pixels(ax)
+
+    if len(x) <= limite:
+        return ax.plot(x, y, *args, **kwargs)[0]
+
+    linha, = ax.plot(*envelope_min_max(x, y, limite // 2), *args, **kwargs)
+
+    def redecimar(ax):
+        x_vis, y_vis = _trecho_visivel(ax, x, y)
+        if len(x_vis) <= limite:
+            linha.set_data(x_vis, y_vis)
+        else:
+            linha.set_data(*envelope_min_max(x_vis, y_vis, limite // 2))
+
+    ax.callbacks.connect('xlim_changed', redecimar)
+    return linha
+
+
+def _segmentos_stem(x, y, limite):
+    """Segmentos verticais (de 0 até o mínimo/máximo) de cada balde."""
+    x_env, y_env = envelope_min_max(x, y, limite // 2)
+    centros = x_env[0::2]
+    baixo = np.minimum(y_env[0::2], 0)
+    alto = np.maximum(y_env[1::2], 0)
+    return np.stack([np.column_stack([centros, baixo]), np.column_stack([centros, alto])], axis=1)
+
+
+def stem_decimado(ax, x, y, linefmt='C0-', markerfmt='C0o', basefmt='k-',
+                  label=None, alpha=None, max_pontos=None):
+    """
+    Substituto de ax.stem para sinais longos.
+
+    Para sinais curtos chama ax.stem normalmente. Para sinais longos (mais
+    pontos que 2 * largura em pixels, ou max_pontos), em vez de um artista
+    por amostra desenha uma única LineCollection com uma haste por pixel,
+    indo de 0 até o mínimo e o máximo das amostras daquele pixel, e refaz a
+    decimação ao dar zoom.
+
+    Parâmetros:
+    -----------
+    ax : Axes
+        Eixo do matplotlib
+    x, y : array_like
+        Sinal discreto (x crescente)
+    linefmt, markerfmt, basefmt, label :
+        Como em ax.stem (no modo decimado só a cor de linefmt é usada)
+    alpha : float ou None
+        Transparência das hastes e marcadores
+    max_pontos : int ou None
+        Acima desse número de pontos, decima. Se None, usa 2 * largura em pixels
+
+    Retorna:
+    --------
+    StemContainer (sinal curto) ou LineCollection (sinal decimado)
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    limite = max_pontos or 2 * _largura_em_pixels(ax)
+
+    if len(x) <= limite:
+        container = ax.stem(x, y, linefmt=linefmt, markerfmt=markerfmt,
+                            basefmt=basefmt, label=label)
+        if alpha is not None:
+            container.markerline.set_alpha(alpha)
+            container.stemlines.set_alpha(alpha)
+        return container
+
+    hastes = mcollections.LineCollection(_segmentos_stem(x, y, limite),
+                                         colors=_cor_do_formato(linefmt),
+                                         label=label, alpha=alpha)
+    ax.add_collection(hastes)
+    ax.axhline(0, color=_cor_do_formato(basefmt), linewidth=1)
+    ax.update_datalim([[x[0], np.min(y)], [x[-1], np.max(y)]])
+    ax.autoscale_view()
+
+    def redecimar(ax):
+        x_vis, y_vis = _trecho_visivel(ax, x, y)
+        if len(x_vis) > 0:
+            hastes.set_segments(_segmentos_stem(x_vis, y_vis, limite))
+
+    ax.callbacks.connect('xlim_changed', redecimar)
+    return hastes
@@ -0,0 +1,54 @@
+import importlib
+
+class ModuloTardio:
+    """
+    Representa um módulo que só é importado no primeiro acesso a um atributo.
+
+    matplotlib.pyplot, scipy.signal e sympy levam centenas de milissegundos
+    (ou segundos) para importar. Com o proxy, importar um módulo deste pacote
+    custa só o numpy; a biblioteca pesada é carregada quando uma função que
+    realmente a usa for chamada:
+    >>> plt = modulo_tardio('matplotlib.pyplot')
+    >>> plt.figure()   # matplotlib.pyplot é importado aqui
+
+    Parâmetros:
+    -----------
+    nome : str
+        Nome completo do módulo (ex.: 'scipy.signal')
+    """
+
+    def __init__(self, nome):
+        self._nome = nome
+        self._modulo = None
+
+    def _carregar(self):
+        if self._modulo is None:
+            self._modulo = importlib.import_module(self._nome)
+        return self._modulo
+
+    def __getattr__(self, atributo):
+        # Só é chamado para atributos que não existem no proxy
+        return getattr(self._carregar(), atributo)
+
+    def __dir__(self):
+        return dir(self._carregar())
+
+    def __repr__(self):
+        estado = 'carregado' if self._modulo is not None else 'não carregado'
+        return f"<módulo tardio '{self._nome}' ({estado})>"
+
+
+def modulo_tardio(nome):
+    """
+    Devolve um ModuloTardio para o módulo nome (ver ModuloTardio).
+
+    Parâmetros:
+    -----------
+    nome : str
+        Nome completo do módulo (ex.: 'matplotlib.pyplot', 'scipy.signal', 'sympy')
+
+    Retorna:
+    --------
+    ModuloTardio
+    """
+    return ModuloTardio(nome)
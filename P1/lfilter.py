@@ -1,56 +1,147 @@
 import numpy as np
-from scipy.signal import lfilter
-import matplotlib.pyplot as plt
-
-# --- 1. Definição da Função de Transferência H(z) ---
-# A função de transferência H(z) é uma razão de polinômios em z⁻¹:
-#        b[0] + b[1]z⁻¹ + b[2]z⁻² + ...
-# H(z) = ------------------------------------
-#        a[0] + a[1]z⁻¹ + a[2]z⁻² + ...
-#
-# Exemplo: H(z) = (0.5 + 0.5z⁻¹) / (1 - 0.8z⁻¹)
-#
-# Coeficientes do numerador (b)
-b = [1]
-# Coeficientes do denominador (a)
-a = [1, -1.01]
-
-# --- 2. Definição do Sinal de Entrada x[n] no tempo ---
-# Vamos usar um sinal degrau unitário (step function) como entrada.
-# O sinal terá 30 amostras de tempo.
-n_samples = 4
-# Cria um vetor de tempo discreto de 0 a 29
-n = np.arange(n_samples)
-# O sinal de entrada x[n] é 1 para todo n >= 0
-x = 500*np.ones(n_samples)
-x[0] = 0
-# Alternativa: Para um impulso unitário (delta de Kronecker)
-x1 = np.zeros(n_samples)
-# x[0] = 1
-
-# --- 3. Aplicação do Filtro para Obter a Resposta y[n] ---
-# A função lfilter(b, a, x) calcula a saída y[n] do sistema.
-y = lfilter(b, a, x)
-
-# --- 4. Exibição dos Resultados ---
-print("Função de Transferência:")
-print(f"  Numerador (b): {b}")
-print(f"  Denominador (a): {a}\n")
-
-print("Sinal de Entrada x[n] (primeiras 10 amostras):")
-print(f"  {x[:10]}\n")
-
-print("Sinal de Saída (Resposta) y[n] (primeiras 10 amostras):")
-print(f"  {np.round(y[:10], 4)}\n") # Arredondando para 4 casas decimais
-
-
-# --- 5. Visualização Gráfica ---
-plt.figure(figsize=(12, 6))
-plt.stem(n, x, 'b', markerfmt='bo', basefmt=" ", label='Entrada x[n] (Degrau)')
-plt.stem(n, y, 'r', markerfmt='ro', basefmt=" ", label='Saída y[n] (Resposta)')
-plt.title('Resposta do Sistema ao Degrau Unitário')
-plt.xlabel('Amostra de Tempo (n)')
-plt.ylabel('Amplitude')
-plt.grid(True)
-plt.legend()
-plt.show()
\ No newline at end of file
+from .importacao_tardia import modulo_tardio
+
+plt = modulo_tardio('matplotlib.pyplot')
+signal = modulo_tardio('scipy.signal')
+
+def _matriz_condicoes(coeficientes, K):
+    """
+    Matriz T (K, n) com T[m, j] = c[m + 1 + j] (zero fora do polinômio), de
+    forma que T @ [v[-1], v[-2], ...] = Σ_j c[m+1+j] v[-1-j], como no lfiltic.
+    """
+    n = len(coeficientes) - 1
+    indices = np.arange(K)[:, None] + 1 + np.arange(n)[None, :]
+    validos = indices <= n
+    return np.where(validos, coeficientes[np.minimum(indices, n)], 0)
+
+
+def estado_inicial(b, a, condicoes_y, condicoes_x=None):
+    """
+    Estado zi do lfilter (forma direta II transposta) a partir das condições
+    iniciais, como signal.lfiltic, mas vetorizado sobre vários conjuntos:
+        zi[m] = (Σ_j b[m+1+j] x[-1-j] - Σ_j a[m+1+j] y[-1-j]) / a[0]
+
+    Parâmetros:
+    -----------
+    b, a : array_like
+        Numerador e denominador (potências de z^-1)
+    condicoes_y : array_like
+        [y[-1], y[-2], ...], formato (..., n) (faltando termos, valem zero)
+    condicoes_x : array_like ou None
+        [x[-1], x[-2], ...], formato (..., n) (None: zeros)
+
+    Retorna:
+    --------
+    zi : ndarray
+        Formato (..., K), K = max(len(a), len(b)) - 1
+    """
+    b = np.atleast_1d(np.asarray(b))
+    a = np.atleast_1d(np.asarray(a))
+    if a[0] == 0:
+        raise ValueError("O primeiro coeficiente do denominador deve ser não nulo.")
+    K = max(len(a), len(b)) - 1
+
+    condicoes_y = np.asarray(condicoes_y)[..., :len(a) - 1]
+    zi = -condicoes_y @ _matriz_condicoes(a, K)[:, :condicoes_y.shape[-1]].T
+    if condicoes_x is not None:
+        condicoes_x = np.asarray(condicoes_x)[..., :len(b) - 1]
+        zi = zi + condicoes_x @ _matriz_condicoes(b, K)[:, :condicoes_x.shape[-1]].T
+    return zi / a[0]
+
+
+def filtrar_com_condicoes(b, a, x, condicoes_y, condicoes_x=None):
+    """
+    Resposta completa (entrada nula + estado nulo) de
+        a0 y[n] + ... + aN y[n-N] = b0 x[n] + ... + bM x[n-M]
+    para vários conjuntos de entradas e condições iniciais, numa única
+    passada do lfilter: as condições viram o estado inicial zi
+    (estado_inicial) e a recursão já sai com as duas parcelas somadas.
+
+    Parâmetros:
+    -----------
+    b, a : array_like
+        Numerador e denominador (potências de z^-1)
+    x : array_like
+        Entradas x[0..L-1], formato (..., L)
+    condicoes_y : array_like
+        [y[-1], y[-2], ...], formato (..., N)
+    condicoes_x : array_like ou None
+        [x[-1], x[-2], ...], formato (..., M) (None: zeros)
+
+    Os formatos de lote (...) de x e das condições são combinados por
+    broadcasting: uma entrada para muitas condições, ou o contrário.
+
+    Retorna:
+    --------
+    y : ndarray
+        Formato lote + (L,)
+    """
+    x = np.asarray(x)
+    zi = estado_inicial(b, a, condicoes_y, condicoes_x)
+    lote = np.broadcast_shapes(x.shape[:-1], zi.shape[:-1])
+    x = np.broadcast_to(x, lote + x.shape[-1:])
+    zi = np.broadcast_to(zi, lote + zi.shape[-1:])
+    if zi.shape[-1] == 0:
+        return signal.lfilter(b, a, x, axis=-1)
+    y, _ = signal.lfilter(b, a, x, axis=-1, zi=zi)
+    return y
+
+if __name__ == "__main__":
+    # --- 1. Definição da Função de Transferência H(z) ---
+    # A função de transferência H(z) é uma razão de polinômios em z⁻¹:
+    #        b[0] + b[1]z⁻¹ + b[2]z⁻² + ...
+    # H(z) = ------------------------------------
+    #        a[0] + a[1]z⁻¹ + a[2]z⁻² + ...
+    #
+    # Exemplo: H(z) = (0.5 + 0.5z⁻¹) / (1 - 0.8z⁻¹)
+    #
+    # Coeficientes do numerador (b)
+    b = [1]
+    # Coeficientes do denominador (a)
+    a = [1, -1.01]
+
+    # --- 2. Definição do Sinal de Entrada x[n] no tempo ---
+    # Vamos usar um sinal degrau unitário (step function) como entrada.
+    # O sinal terá 30 amostras de tempo.
+    n_samples = 4
+    # Cria um vetor de tempo discreto de 0 a 29
+    n = np.arange(n_samples)
+    # O sinal de entrada x[n] é 1 para todo n >= 0
+    x = 500*np.ones(n_samples)
+    x[0] = 0
+    # Alternativa: Para um impulso unitário (delta de Kronecker)
+    x1 = np.zeros(n_samples)
+    # x[0] = 1
+
+    # --- 3. Aplicação do Filtro para Obter a Resposta y[n] ---
+    # A função lfilter(b, a, x) calcula a saída y[n] do sistema.
+    y = signal.lfilter(b, a, x)
+
+    # --- 4. Exibição dos Resultados ---
+    print("Função de Transferência:")
+    print(f"  Numerador (b): {b}")
+    print(f"  Denominador (a): {a}\n")
+
+    print("Sinal de Entrada x[n] (primeiras 10 amostras):")
+    print(f"  {x[:10]}\n")
+
+    print("Sinal de Saída (Resposta) y[n] (primeiras 10 amostras):")
+    print(f"  {np.round(y[:10], 4)}\n") # Arredondando para 4 casas decimais
+
+
+    # --- 5. Visualização Gráfica ---
+    plt.figure(figsize=(12, 6))
+    plt.stem(n, x, 'b', markerfmt='bo', basefmt=" ", label='Entrada x[n] (Degrau)')
+    plt.stem(n, y, 'r', markerfmt='ro', basefmt=" ", label='Saída y[n] (Resposta)')
+    plt.title('Resposta do Sistema ao Degrau Unitário')
+    plt.xlabel('Amostra de Tempo (n)')
+    plt.ylabel('Amplitude')
+    plt.grid(True)
+    plt.legend()
+    plt.show()
+
+    # --- 6. Resposta completa em lote ---
+    # Mesmo sistema, com 5 saldos iniciais y[-1] diferentes: uma única passada
+    y_lote = filtrar_com_condicoes(b, a, x, [[0], [100], [200], [300], [400]])
+    print("Resposta completa para y[-1] = 0, 100, ..., 400:")
+    print(f"  {np.round(y_lote, 2)}")
@@ -0,0 +1,186 @@
+import os
+import time
+import multiprocessing
+from multiprocessing.connection import wait
+from .importacao_tardia import modulo_tardio
+from .solve_eq_parciais import decomposicao_fracao_parcial, decomposicao_numerica, _coeficientes_numericos
+
+sp = modulo_tardio('sympy')
+
+def _expressoes_como_texto(resultado):
+    """
+    Troca as expressões sympy do resultado por texto. Desserializar certas
+    expressões (RootOf, RootSum) refaz cálculos no processo principal, fora
+    do controle de tempo; em texto, o resultado fica igual ao do caminho numérico.
+    """
+    texto = {}
+    for chave, valor in resultado.items():
+        if isinstance(valor, sp.Integer):
+            valor = int(valor)
+        elif isinstance(valor, sp.logic.boolalg.BooleanAtom):
+            valor = bool(valor)
+        elif isinstance(valor, sp.Basic):
+            valor = str(valor)
+        texto[chave] = valor
+    return texto
+
+
+def _trabalhador(conexao):
+    """Laço do processo trabalhador: recebe (indice, kwargs), devolve (indice, resultado)."""
+    # Carrega o sympy antes de aceitar tarefas, para a importação não contar no prazo
+    sp.S
+    conexao.send('pronto')
+    while True:
+        mensagem = conexao.recv()
+        if mensagem is None:
+            break
+        indice, kwargs = mensagem
+        try:
+            resultado = _expressoes_como_texto(decomposicao_fracao_parcial(**kwargs))
+        except Exception as e:
+            resultado = {"erro": f"Erro na decomposição: {e}"}
+        conexao.send((indice, resultado))
+
+
+def _como_kwargs(tarefa, racional):
+    """Aceita uma string (expressão) ou um dict de argumentos de decomposicao_fracao_parcial."""
+    if isinstance(tarefa, str):
+        return {'expressao': tarefa, 'racional': racional}
+    kwargs = dict(tarefa)
+    kwargs.setdefault('racional', racional)
+    return kwargs
+
+
+def _resultado_numerico(kwargs):
+    """Caminho numérico usado quando o simbólico estoura o tempo."""
+    coeficientes = _coeficientes_numericos(kwargs.get('expressao'), kwargs.get('numerador'),
+                                           kwargs.get('denominador'), kwargs.get('variavel', 'x'))
+    if coeficientes is None:
+        return {"erro": "Tempo esgotado e a expressão não tem coeficientes numéricos"}
+    resultado = decomposicao_numerica(*coeficientes, variavel=kwargs.get('variavel', 'x'),
+                                      tol=kwargs.get('tol', 1e-4))
+    resultado['tempo_esgotado'] = True
+    return resultado
+
+
+class _Processo:
+    """Um processo trabalhador com o seu próprio Pipe e a tarefa em andamento."""
+
+    def __init__(self, contexto):
+        self.conexao, conexao_filho = contexto.Pipe()
+        self.processo = contexto.Process(target=_trabalhador, args=(conexao_filho,), daemon=True)
+        self.processo.start()
+        conexao_filho.close()
+        self.tarefa = None
+        self.prazo = None
+        self.pronto = False
+
+    def enviar(self, indice, kwargs, tempo_limite):
+        if not self.pronto:
+            self.conexao.recv()
+            self.pronto = True
+        self.tarefa = (indice, kwargs)
+        self.prazo = time.monotonic() + tempo_limite
+        self.conexao.send((indice, kwargs))
+
+    def encerrar(self, forcar=False):
+        if forcar:
+            self.processo.terminate()
+        else:
+            try:
+                self.conexao.send(None)
+            except (BrokenPipeError, OSError):
+                self.processo.terminate()
+        self.processo.join()
+        self.conexao.close()
+
+
+def decompor_em_lote(tarefas, tempo_limite=10.0, processos=None, racional=True):
+    """
+    Decompõe muitas frações parciais num pool de processos, devolvendo os
+    resultados à medida que ficam prontos.
+
+    Cada processo tem o seu próprio Pipe; o processo principal espera em
+    todos ao mesmo tempo (multiprocessing.connection.wait) até o prazo mais
+    próximo. Se uma tarefa passa de tempo_limite segundos, o processo é
+    encerrado (o sympy não pode ser interrompido de outra forma), um novo
+    processo é criado no lugar e a tarefa é refeita pelo caminho numérico
+    (decomposicao_numerica), com 'tempo_esgotado': True no resultado. Se o
+    processo morre no meio de uma tarefa, ela volta com 'erro' e um novo
+    processo assume as seguintes.
+
+    As expressões sympy dos resultados chegam como texto (str), como no
+    caminho numérico.
+
+    Parâmetros:
+    -----------
+    tarefas : iterable
+        Expressões (str) ou dicts com os argumentos de decomposicao_fracao_parcial
+    tempo_limite : float
+        Tempo máximo por tarefa, em segundos (padrão: 10)
+    processos : int ou None
+        Número de processos (padrão: número de núcleos)
+    racional : bool
+        Valor de racional para as tarefas que não o definem. O padrão True
+        usa o caminho simbólico, que é o que justifica o pool; com False as
+        tarefas numéricas quase sempre são mais rápidas no próprio processo
+
+    Retorna:
+    --------
+    gerador de (indice, resultado)
+        indice é a posição da tarefa em tarefas; a ordem é a de término
+    """
+    pendentes = list(enumerate(tarefas))
+    pendentes.reverse()
+    n_processos = min(processos or os.cpu_count() or 1, max(len(pendentes), 1))
+    contexto = multiprocessing.get_context()
+    trabalhadores = [_Processo(contexto) for _ in range(n_processos)]
+
+    def proxima(trabalhador):
+        if pendentes:
+            indice, tarefa = pendentes.pop()
+            trabalhador.enviar(indice, _como_kwargs(tarefa, racional), tempo_limite)
+        else:
+            trabalhador.tarefa = None
+
+    try:
+        for trabalhador in trabalhadores:
+            proxima(trabalhador)
+
+        while True:
+            ocupados = [t for t in trabalhadores if t.tarefa is not None]
+            if not ocupados:
+                break
+
+            espera = max(0.0, min(t.prazo for t in ocupados) - time.monotonic())
+            prontos = wait([t.conexao for t in ocupados], timeout=espera)
+
+            for trabalhador in ocupados:
+                if trabalhador.conexao in prontos:
+                    try:
+                        indice, resultado = trabalhador.conexao.recv()
+                    except EOFError:
+                        # Processo morreu no meio da tarefa: não é tempo
+                        # esgotado, e a tarefa não é refeita
+                        indice, _ = trabalhador.tarefa
+                        trabalhador.encerrar(forcar=True)
+                        resultado = {"erro": "Processo trabalhador encerrado durante a tarefa "
+                                             f"(código de saída {trabalhador.processo.exitcode})"}
+                    else:
+                        yield indice, resultado
+                        proxima(trabalhador)
+                        continue
+                elif trabalhador.prazo <= time.monotonic():
+                    indice, kwargs = trabalhador.tarefa
+                    trabalhador.encerrar(forcar=True)
+                    resultado = _resultado_numerico(kwargs)
+                else:
+                    continue
+
+                substituto = _Processo(contexto)
+                trabalhadores[trabalhadores.index(trabalhador)] = substituto
+                yield indice, resultado
+                proxima(substituto)
+    finally:
+        for trabalhador in trabalhadores:
+            trabalhador.encerrar(forcar=trabalhador.tarefa is not None)
@@ -1,6 +1,8 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy import signal
+from .importacao_tardia import modulo_tardio
+
+plt = modulo_tardio('matplotlib.pyplot')
+signal = modulo_tardio('scipy.signal')
 
 def analisar_resposta_frequencia(num, den, N=512, plotar=True):
     """
@@ -1,8 +1,136 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy import signal
+from .resposta_frequencia import calcular_resposta_frequencia
+from .plano_z import avaliar_racional
+from .importacao_tardia import modulo_tardio
 
-def analisar_resposta_frequencia(num, den, N=512, plotar=True):
+plt = modulo_tardio('matplotlib.pyplot')
+
+def estender_resposta_periodica(w, mag, fase, k=2, n_pontos=2048):
+    """
+    Estende a resposta em frequência calculada em [0, π] para [-kπ, kπ].
+
+    Usa as propriedades de sistemas reais: |H(e^jω)| é PAR e ∠H(e^jω) é
+    ÍMPAR, ambas PERIÓDICAS com período 2π. Todo o cálculo é vetorizado
+    (aritmética modular sobre o vetor inteiro) e os valores intermediários
+    são obtidos por interpolação linear.
+
+    Parâmetros:
+    -----------
+    w : ndarray
+        Frequências em [0, π] (crescentes), como retornado por signal.freqz
+    mag : ndarray
+        Magnitude (linear) em cada frequência de w
+    fase : ndarray
+        Fase em radianos em cada frequência de w
+    k : float
+        A faixa estendida é [-kπ, kπ] (padrão: 2)
+    n_pontos : int
+        Número de pontos da faixa estendida (padrão: 2048)
+
+    Retorna:
+    --------
+    w_ext : ndarray
+        Frequências em [-kπ, kπ]
+    mag_ext : ndarray
+        Magnitude (linear) estendida
+    fase_ext : ndarray
+        Fase estendida em radianos, no intervalo [-π, π]
+    """
+    w_ext = np.linspace(-k*np.pi, k*np.pi, n_pontos)
+
+    # Leva cada ω para [-π, π) e depois para [0, π] usando a simetria
+    omega_mod = np.mod(w_ext + np.pi, 2*np.pi) - np.pi
+    omega_abs = np.abs(omega_mod)
+
+    mag_ext = np.interp(omega_abs, w, mag)
+
+    # Interpola a fase desdobrada para não cruzar os saltos de 2π,
+    # e depois volta para [-π, π]
+    fase_interp = np.interp(omega_abs, w, np.unwrap(fase))
+    fase_interp = np.mod(fase_interp + np.pi, 2*np.pi) - np.pi
+    fase_ext = np.where(omega_mod < 0, -fase_interp, fase_interp)
+
+    return w_ext, mag_ext, fase_ext
+
+
+def _eixo_multiplos_de_pi(ax, k):
+    """
+    Ajusta limites e marcações do eixo x em múltiplos de π para [-kπ, kπ].
+    """
+    ax.set_xlim([-k*np.pi, k*np.pi])
+    multiplos = np.arange(-int(k), int(k) + 1)
+    ax.set_xticks(multiplos * np.pi)
+    rotulos = {0: '0', 1: 'π', -1: '-π'}
+    ax.set_xticklabels([rotulos.get(m, f'{m}π') for m in multiplos])
+
+
+def desenhar_mag_fase_estendidas(eixos, resposta, k=2, n_pontos=2048):
+    """
+    Desenha magnitude linear (eixos[0]) e fase em graus (eixos[1]) de -kπ a kπ.
+
+    Parâmetros:
+    -----------
+    eixos : list
+        Dois eixos do matplotlib
+    resposta : RespostaFrequencia
+        Resposta em [0, π] (ex.: retorno de calcular_resposta_frequencia)
+    k, n_pontos :
+        Como em estender_resposta_periodica
+    """
+    ax1, ax2 = eixos[0], eixos[1]
+
+    # Para magnitude (par): |H(e^-jω)| = |H(e^jω)|
+    # Para fase (ímpar): ∠H(e^-jω) = -∠H(e^jω)
+    w_ext, mag_ext, fase_ext = estender_resposta_periodica(resposta.w, resposta.mag, resposta.fase,
+                                                           k=k, n_pontos=n_pontos)
+    fase_graus_ext = fase_ext * 180/np.pi
+
+    # --- Magnitude linear ---
+    ax1.plot(w_ext, mag_ext, 'b-', linewidth=2, label='|H(e^jω)|')
+    ax1.axvspan(0, np.pi, alpha=0.15, color='cyan', label='[0, π]')
+    ax1.axvline(x=0, color='r', linestyle='--', alpha=0.4)
+    ax1.axvline(x=np.pi, color='r', linestyle='--', alpha=0.4)
+    ax1.set_ylabel('Magnitude (linear)', fontsize=11)
+    ax1.set_title(f'Espectro de Magnitude (Linear) e Fase [-{k}π, {k}π]', fontsize=13, fontweight='bold')
+    ax1.grid(True, alpha=0.3)
+    _eixo_multiplos_de_pi(ax1, k)
+    ax1.legend()
+
+    # --- Fase ---
+    ax2.plot(w_ext, fase_graus_ext, 'r-', linewidth=2, label='∠H(e^jω)')
+    ax2.axvspan(0, np.pi, alpha=0.15, color='pink', label='[0, π]')
+    ax2.axvline(x=0, color='r', linestyle='--', alpha=0.4)
+    ax2.axvline(x=np.pi, color='r', linestyle='--', alpha=0.4)
+    ax2.axhline(y=0, color='k', linestyle='--', alpha=0.3)
+    ax2.set_xlabel('Frequência (rad/amostra)', fontsize=11)
+    ax2.set_ylabel('Fase (graus)', fontsize=11)
+    ax2.grid(True, alpha=0.3)
+    _eixo_multiplos_de_pi(ax2, k)
+    ax2.legend()
+
+
+def desenhar_mag_dB_estendida(ax, resposta, k=2, n_pontos=2048):
+    """
+    Desenha a magnitude em dB de -kπ a kπ num eixo do matplotlib.
+    """
+    w_ext, mag_ext, _ = estender_resposta_periodica(resposta.w, resposta.mag, resposta.fase,
+                                                    k=k, n_pontos=n_pontos)
+    mag_dB_ext = 20 * np.log10(mag_ext + 1e-10)
+
+    ax.plot(w_ext, mag_dB_ext, 'g-', linewidth=2, label='|H(e^jω)| (dB)')
+    ax.axvspan(0, np.pi, alpha=0.15, color='lime', label='[0, π]')
+    ax.axhline(y=-3, color='r', linestyle='--', alpha=0.4, label='-3 dB')
+    ax.axvline(x=0, color='r', linestyle='--', alpha=0.4)
+    ax.axvline(x=np.pi, color='r', linestyle='--', alpha=0.4)
+    ax.set_xlabel('Frequência (rad/amostra)', fontsize=11)
+    ax.set_ylabel('Magnitude (dB)', fontsize=11)
+    ax.set_title(f'Espectro de Magnitude |H(e^jω)| em dB [-{k}π, {k}π]', fontsize=13, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+    _eixo_multiplos_de_pi(ax, k)
+    ax.legend()
+
+
+def analisar_resposta_frequencia(num, den, N=512, plotar=True, k=2):
     """
     Analisa a resposta em frequência de um sistema discreto.
     
@@ -15,32 +143,22 @@ def analisar_resposta_frequencia(num, den, N=512, plotar=True):
     N : int
         Número de pontos de frequência (padrão: 512)
     plotar : bool
-        Se True, plota os gráficos de -2π a 2π
-    
+        Se True, plota os gráficos de -kπ a kπ
+    k : float
+        Extensão dos gráficos em múltiplos de π (padrão: 2 → [-2π, 2π])
+
     Retorna:
     --------
-    w : ndarray
-        Vetor de frequências normalizadas (0 a π)
-    H : ndarray
-        Resposta em frequência complexa
-    mag : ndarray
-        Magnitude (linear)
-    mag_dB : ndarray
-        Magnitude em dB
-    fase : ndarray
-        Fase em radianos
-    fase_graus : ndarray
-        Fase em graus
+    resposta : RespostaFrequencia
+        Objeto com w (0 a π) e H; magnitude, dB, fase, atraso de grupo etc.
+        são calculados sob demanda. Pode ser desempacotado como
+        w, H, mag, mag_dB, fase, fase_graus
     """
     
     # Calcula a resposta em frequência para [0, π]
-    w, H = signal.freqz(num, den, worN=N, whole=False)
-    
-    # Calcula magnitude e fase
-    mag = np.abs(H)
-    mag_dB = 20 * np.log10(mag + 1e-10)
-    fase = np.angle(H)  # Em radianos
-    fase_graus = np.angle(H, deg=True)
+    resposta = calcular_resposta_frequencia(num, den, N=N)
+    w, mag, mag_dB = resposta.w, resposta.mag, resposta.mag_dB
+    fase, fase_graus = resposta.fase, resposta.fase_graus
     
     # Imprime expressões simbólicas
     print("=" * 60)
@@ -86,100 +204,30 @@ def analisar_resposta_frequencia(num, den, N=512, plotar=True):
     print("  Propriedade: ∠H(e^jω) é ÍMPAR e PERIÓDICA com período 2π")
     
     if plotar:
-        # SEMPRE plota de -2π a 2π mostrando periodicidade
-        w_ext = np.linspace(-2*np.pi, 2*np.pi, N*4)
-        
-        # Para magnitude (par): |H(e^-jω)| = |H(e^jω)|
-        # Para fase (ímpar): ∠H(e^-jω) = -∠H(e^jω)
-        mag_ext = np.zeros_like(w_ext)
-        fase_ext = np.zeros_like(w_ext)
-        
-        for i, omega in enumerate(w_ext):
-            omega_mod = omega % (2*np.pi)
-            if omega_mod <= np.pi:
-                idx = np.searchsorted(w, omega_mod)
-                if idx >= len(mag): idx = len(mag) - 1
-                mag_ext[i] = mag[idx]
-                fase_ext[i] = fase[idx] if omega >= 0 else -fase[idx]
-            else:
-                omega_sym = 2*np.pi - omega_mod
-                idx = np.searchsorted(w, omega_sym)
-                if idx >= len(mag): idx = len(mag) - 1
-                mag_ext[i] = mag[idx]
-                fase_ext[i] = -fase[idx] if omega >= 0 else fase[idx]
-        
-        fase_graus_ext = fase_ext * 180/np.pi
-        mag_dB_ext = 20 * np.log10(mag_ext + 1e-10)
-        
-        # =============================================================
+        # SEMPRE plota de -kπ a kπ mostrando periodicidade
         # PLOT 1: Magnitude linear + fase (juntos)
-        # =============================================================
         fig1, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
-
-        # --- Magnitude linear ---
-        ax1.plot(w_ext, mag_ext, 'b-', linewidth=2, label='|H(e^jω)|')
-        ax1.axvspan(0, np.pi, alpha=0.15, color='cyan', label='[0, π]')
-        ax1.axvline(x=0, color='r', linestyle='--', alpha=0.4)
-        ax1.axvline(x=np.pi, color='r', linestyle='--', alpha=0.4)
-        ax1.set_ylabel('Magnitude (linear)', fontsize=11)
-        ax1.set_title('Espectro de Magnitude (Linear) e Fase [-2π, 2π]', fontsize=13, fontweight='bold')
-        ax1.grid(True, alpha=0.3)
-        ax1.set_xlim([-2*np.pi, 2*np.pi])
-        ax1.set_xticks([-2*np.pi, -np.pi, 0, np.pi, 2*np.pi])
-        ax1.set_xticklabels(['-2π', '-π', '0', 'π', '2π'])
-        ax1.legend()
-
-        # --- Fase ---
-        ax2.plot(w_ext, fase_graus_ext, 'r-', linewidth=2, label='∠H(e^jω)')
-        ax2.axvspan(0, np.pi, alpha=0.15, color='pink', label='[0, π]')
-        ax2.axvline(x=0, color='r', linestyle='--', alpha=0.4)
-        ax2.axvline(x=np.pi, color='r', linestyle='--', alpha=0.4)
-        ax2.axhline(y=0, color='k', linestyle='--', alpha=0.3)
-        ax2.set_xlabel('Frequência (rad/amostra)', fontsize=11)
-        ax2.set_ylabel('Fase (graus)', fontsize=11)
-        ax2.grid(True, alpha=0.3)
-        ax2.set_xlim([-2*np.pi, 2*np.pi])
-        ax2.set_xticks([-2*np.pi, -np.pi, 0, np.pi, 2*np.pi])
-        ax2.set_xticklabels(['-2π', '-π', '0', 'π', '2π'])
-        ax2.legend()
-
+        desenhar_mag_fase_estendidas([ax1, ax2], resposta, k=k, n_pontos=N*4)
         plt.tight_layout()
         plt.show()
         
-        # =============================================================
         # PLOT 2: Magnitude em dB separado
-        # =============================================================
         fig2, ax3 = plt.subplots(figsize=(12, 6))
-        ax3.plot(w_ext, mag_dB_ext, 'g-', linewidth=2, label='|H(e^jω)| (dB)')
-        ax3.axvspan(0, np.pi, alpha=0.15, color='lime', label='[0, π]')
-        ax3.axhline(y=-3, color='r', linestyle='--', alpha=0.4, label='-3 dB')
-        ax3.axvline(x=0, color='r', linestyle='--', alpha=0.4)
-        ax3.axvline(x=np.pi, color='r', linestyle='--', alpha=0.4)
-        ax3.set_xlabel('Frequência (rad/amostra)', fontsize=11)
-        ax3.set_ylabel('Magnitude (dB)', fontsize=11)
-        ax3.set_title('Espectro de Magnitude |H(e^jω)| em dB [-2π, 2π]', fontsize=13, fontweight='bold')
-        ax3.grid(True, alpha=0.3)
-        ax3.set_xlim([-2*np.pi, 2*np.pi])
-        ax3.set_xticks([-2*np.pi, -np.pi, 0, np.pi, 2*np.pi])
-        ax3.set_xticklabels(['-2π', '-π', '0', 'π', '2π'])
-        ax3.legend()
+        desenhar_mag_dB_estendida(ax3, resposta, k=k, n_pontos=N*4)
         plt.tight_layout()
         plt.show()
 
-    return w, H, mag, mag_dB, fase, fase_graus
+    return resposta
 
 
-def plotar_polos_zeros(num, den):
+def desenhar_polos_zeros(ax, num, den):
     """
-    Plota o diagrama de polos e zeros no plano Z.
+    Desenha o diagrama de polos e zeros no plano Z num eixo do matplotlib.
     """
     # Calcula zeros e polos
     zeros = np.roots(num) if len(num) > 1 else np.array([])
     polos = np.roots(den) if len(den) > 1 else np.array([])
     
-    # Cria figura
-    fig, ax = plt.subplots(figsize=(8, 8))
-    
     # Círculo unitário
     theta = np.linspace(0, 2*np.pi, 100)
     ax.plot(np.cos(theta), np.sin(theta), 'k--', linewidth=1.5, label='Círculo unitário')
@@ -215,6 +263,14 @@ def plotar_polos_zeros(num, den):
                   np.max(np.abs(polos)) + 0.5 if len(polos) > 0 else 1.5)
     ax.set_xlim([-max_val, max_val])
     ax.set_ylim([-max_val, max_val])
+
+
+def plotar_polos_zeros(num, den):
+    """
+    Plota o diagrama de polos e zeros no plano Z.
+    """
+    fig, ax = plt.subplots(figsize=(8, 8))
+    desenhar_polos_zeros(ax, num, den)
     
     plt.tight_layout()
     plt.show()
@@ -229,16 +285,13 @@ def verificar_calculos(num, den):
     print("=" * 60)
     
     # Testa em ω = 0, π/2, π
-    omegas = [0, np.pi/2, np.pi]
+    omegas = np.array([0, np.pi/2, np.pi])
     
-    for omega in omegas:
-        z = np.exp(1j * omega)
-        
-        # Calcula H(z) manualmente
-        H_num = sum([c * z**(-k) for k, c in enumerate(num)])
-        H_den = sum([c * z**(-k) for k, c in enumerate(den)])
-        H = H_num / H_den
-        
+    # Calcula H(z) diretamente nos pontos z = e^jω (Horner vetorizado)
+    zs = np.exp(1j * omegas)
+    Hs = avaliar_racional(num, den, zs)
+    
+    for omega, z, H in zip(omegas, zs, Hs):
         mag = np.abs(H)
         fase_rad = np.angle(H)
         fase_grau = np.angle(H, deg=True)
@@ -250,75 +303,122 @@ def verificar_calculos(num, den):
         print(f"  ∠H(e^jω) = {fase_rad:.4f} rad = {fase_grau:.2f}°")
 
 
-def usar_funcao_nativa_scipy(num, den, N=512):
+def desenhar_resposta_scipy(eixos, resposta, faixa=None):
     """
-    Usa signal.freqz do scipy - a função CORRETA para sistemas discretos.
-    Este é o método nativo e mais confiável para transformada Z.
+    Desenha magnitude em dB (eixos[0]) e fase em graus (eixos[1]) em [0, π],
+    ou apenas em faixa=(ω1, ω2) se fornecida.
     """
-    print("\n" + "="*70)
-    print("USANDO scipy.signal.freqz (MÉTODO NATIVO PARA SISTEMAS DISCRETOS)")
-    print("="*70)
-    
-    # signal.freqz é a função correta para sistemas discretos (transformada Z)
-    w, H = signal.freqz(num, den, worN=N, whole=False)
-    
-    # Calcula magnitude e fase
-    mag = np.abs(H)
-    mag_dB = 20 * np.log10(mag + 1e-10)
-    fase_rad = np.angle(H)
-    fase_graus = np.angle(H, deg=True)
-    
-    print(f"\nPontos calculados: {len(w)}")
-    print(f"Faixa de frequência: 0 a π rad/amostra")
-    print(f"\nValores em pontos chave:")
-    print(f"  ω=0:    |H|={mag[0]:.6f} ({mag_dB[0]:.2f} dB), ∠H={fase_graus[0]:.2f}°")
-    print(f"  ω=π/2:  |H|={mag[N//2]:.6f} ({mag_dB[N//2]:.2f} dB), ∠H={fase_graus[N//2]:.2f}°")
-    print(f"  ω=π:    |H|={mag[-1]:.6f} ({mag_dB[-1]:.2f} dB), ∠H={fase_graus[-1]:.2f}°")
-    
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
-    
+    ax1, ax2 = eixos[0], eixos[1]
+    w1, w2 = (0, np.pi) if faixa is None else faixa
+
     # Magnitude em dB
-    ax1.plot(w, mag_dB, 'b-', linewidth=2)
+    ax1.plot(resposta.w, resposta.mag_dB, 'b-', linewidth=2)
     ax1.axhline(y=0, color='k', linestyle='--', alpha=0.3)
     ax1.axhline(y=-3, color='r', linestyle='--', alpha=0.3, label='-3dB')
     ax1.set_xlabel('Frequência (rad/amostra)', fontsize=11)
     ax1.set_ylabel('Magnitude (dB)', fontsize=11)
     ax1.set_title('Espectro de Magnitude |H(e^jω)| - scipy.signal.freqz', fontsize=13, fontweight='bold')
     ax1.grid(True, alpha=0.3)
-    ax1.set_xlim([0, np.pi])
-    ax1.set_xticks([0, np.pi/4, np.pi/2, 3*np.pi/4, np.pi])
-    ax1.set_xticklabels(['0', 'π/4', 'π/2', '3π/4', 'π'])
+    ax1.set_xlim([w1, w2])
+    if faixa is None:
+        ax1.set_xticks([0, np.pi/4, np.pi/2, 3*np.pi/4, np.pi])
+        ax1.set_xticklabels(['0', 'π/4', 'π/2', '3π/4', 'π'])
     ax1.legend()
-    
+
     # Fase em graus
-    ax2.plot(w, fase_graus, 'r-', linewidth=2)
+    ax2.plot(resposta.w, resposta.fase_graus, 'r-', linewidth=2)
     ax2.axhline(y=0, color='k', linestyle='--', alpha=0.3)
     ax2.set_xlabel('Frequência (rad/amostra)', fontsize=11)
     ax2.set_ylabel('Fase (graus)', fontsize=11)
     ax2.set_title('Espectro de Fase ∠H(e^jω) - scipy.signal.freqz', fontsize=13, fontweight='bold')
     ax2.grid(True, alpha=0.3)
-    ax2.set_xlim([0, np.pi])
-    ax2.set_xticks([0, np.pi/4, np.pi/2, 3*np.pi/4, np.pi])
-    ax2.set_xticklabels(['0', 'π/4', 'π/2', '3π/4', 'π'])
+    ax2.set_xlim([w1, w2])
+    if faixa is None:
+        ax2.set_xticks([0, np.pi/4, np.pi/2, 3*np.pi/4, np.pi])
+        ax2.set_xticklabels(['0', 'π/4', 'π/2', '3π/4', 'π'])
+
+
+def usar_funcao_nativa_scipy(num, den, N=512, faixa=None):
+    """
+    Usa signal.freqz do scipy - a função CORRETA para sistemas discretos.
+    Este é o método nativo e mais confiável para transformada Z.
+
+    Se faixa=(ω1, ω2) for fornecida, calcula N pontos apenas nessa
+    sub-faixa com a transformada chirp-Z (modo zoom), em vez de [0, π].
+
+    Retorna um RespostaFrequencia (desempacotável como
+    w, H, mag, mag_dB, fase_rad, fase_graus).
+    """
+    print("\n" + "="*70)
+    print("USANDO scipy.signal.freqz (MÉTODO NATIVO PARA SISTEMAS DISCRETOS)")
+    print("="*70)
+    
+    # signal.freqz é a função correta para sistemas discretos (transformada Z);
+    # com faixa, usa o zoom (grade densa só em [ω1, ω2] via chirp-Z)
+    resposta = calcular_resposta_frequencia(num, den, N=N, faixa=faixa)
+    w1, w2 = (0, np.pi) if faixa is None else faixa
+    w, mag, mag_dB, fase_graus = resposta.w, resposta.mag, resposta.mag_dB, resposta.fase_graus
+    
+    print(f"\nPontos calculados: {len(w)}")
+    print(f"Faixa de frequência: {w1/np.pi:.3f}π a {w2/np.pi:.3f}π rad/amostra")
+    print(f"\nValores em pontos chave:")
+    for i in [0, N//2, -1]:
+        print(f"  ω={w[i]/np.pi:.3f}π:  |H|={mag[i]:.6f} ({mag_dB[i]:.2f} dB), ∠H={fase_graus[i]:.2f}°")
+    
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
+    desenhar_resposta_scipy([ax1, ax2], resposta, faixa=faixa)
     
     plt.tight_layout()
     plt.show()
     
-    return w, H, mag, mag_dB, fase_rad, fase_graus
+    return resposta
+
+
+# ============================================================================
+# RELATÓRIOS EM ARQUIVO (sem janela) - usar com relatorios.renderizar_em_lote
+# ============================================================================
+
+def relatorio_resposta_frequencia(eixos, tarefa):
+    """
+    Relatório (layout 3x1) de magnitude, fase e magnitude em dB em [-2π, 2π].
+    tarefa = (num, den)
+    """
+    num, den = tarefa
+    resposta = calcular_resposta_frequencia(num, den)
+    desenhar_mag_fase_estendidas(eixos[:2], resposta)
+    desenhar_mag_dB_estendida(eixos[2], resposta)
+
+
+def relatorio_polos_zeros(eixos, tarefa):
+    """
+    Relatório (layout 1x1) do diagrama de polos e zeros. tarefa = (num, den)
+    """
+    num, den = tarefa
+    desenhar_polos_zeros(eixos[0], num, den)
+
+
+def relatorio_resposta_scipy(eixos, tarefa):
+    """
+    Relatório (layout 2x1) de magnitude em dB e fase em [0, π].
+    tarefa = (num, den)
+    """
+    num, den = tarefa
+    desenhar_resposta_scipy(eixos, calcular_resposta_frequencia(num, den))
 
 
 # ============================================================================
 # EXEMPLOS DE USO
 # ============================================================================
 
-print("\n" + "="*70)
-print("EXEMPLO 1: H(z) = z/(z-0.8) = 1/(1-0.8z^-1)")
-print("="*70)
-num1 = [1]
-den1 = [1, -0.8]
-verificar_calculos(num1, den1)
-w1, H1, mag1, mag_dB1, fase1, fase_graus1 = analisar_resposta_frequencia(num1, den1)
-plotar_polos_zeros(num1, den1)
+if __name__ == "__main__":
+    print("\n" + "="*70)
+    print("EXEMPLO 1: H(z) = z/(z-0.8) = 1/(1-0.8z^-1)")
+    print("="*70)
+    num1 = [1]
+    den1 = [1, -0.8]
+    verificar_calculos(num1, den1)
+    w1, H1, mag1, mag_dB1, fase1, fase_graus1 = analisar_resposta_frequencia(num1, den1)
+    plotar_polos_zeros(num1, den1)
 
 # print("\n" + "="*70)
 # print("EXEMPLO 2: Filtro Passa-Baixas H(z) = (0.5 + 0.5z^-1)/(1 - 0.8z^-1)")
@@ -351,8 +451,14 @@ plotar_polos_zeros(num1, den1)
 # MÉTODO 2 - Usando função nativa do scipy (mais simples):
 # usar_funcao_nativa_scipy(num, den)
 #
-# MÉTODO 3 - Usando apenas signal.freqz (o mais básico):
+# MÉTODO 3 - Relatórios em arquivo para muitos filtros, sem janelas:
+# from P1.relatorios import renderizar_em_lote
+# filtros = [(num1, den1), (num2, den2), ...]
+# renderizar_em_lote(relatorio_resposta_frequencia, filtros, 'relatorios',
+#                    layout=(3, 1), figsize=(12, 12))
+#
+# MÉTODO 4 - Usando apenas signal.freqz (o mais básico):
 # w, H = signal.freqz(num, den, worN=512)
 # mag = np.abs(H)
 # fase = np.angle(H)
-# ============================================================================
\ No newline at end of file
+# ============================================================================
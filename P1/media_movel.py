@@ -1,5 +1,5 @@
-from impulse import impulse
-from funcao_atraso import atraso
+from .impulse import impulse
+from .funcao_atraso import atraso
 
 
 def media_movel(array,unidades):
@@ -32,5 +32,6 @@ def media_movel(array,unidades):
     
 #     return [None] * (unidades - 1) + newarray  # NaN nas primeiras posições
 
-x=[1,2,3,4,5]
-print(media_movel(x,3))
\ No newline at end of file
+if __name__ == "__main__":
+    x=[1,2,3,4,5]
+    print(media_movel(x,3))
@@ -0,0 +1,124 @@
+import numpy as np
+from .importacao_tardia import modulo_tardio
+
+plt = modulo_tardio('matplotlib.pyplot')
+
+def _horner(coeficientes, z):
+    """
+    Avalia o polinômio Σ c[i] z^(n-i) (potências decrescentes) em todos os
+    pontos de z de uma vez, pelo método de Horner sobre ndarrays.
+    """
+    resultado = np.full(z.shape, coeficientes[0], dtype=complex)
+    for c in coeficientes[1:]:
+        resultado *= z
+        resultado += c
+    return resultado
+
+
+def avaliar_racional(num, den, z, tamanho_bloco=2**18):
+    """
+    Avalia H(z) = N(z)/D(z) em um array arbitrário de pontos complexos z.
+
+    Os coeficientes seguem a mesma convenção de signal.freqz e lfilter
+    (potências de z^-1): H(z) = (b0 + b1 z^-1 + ...) / (a0 + a1 z^-1 + ...).
+    Internamente os dois polinômios são completados com zeros até o mesmo
+    comprimento e avaliados em potências de z por Horner, o que vale também
+    em z = 0. O array é processado em blocos de tamanho_bloco pontos para
+    limitar o uso de memória.
+
+    Parâmetros:
+    -----------
+    num : array_like
+        Coeficientes do numerador (potências de z^-1)
+    den : array_like
+        Coeficientes do denominador (potências de z^-1)
+    z : complex ou array_like
+        Pontos do plano Z (qualquer formato)
+    tamanho_bloco : int
+        Número máximo de pontos avaliados por vez (padrão: 2**18)
+
+    Retorna:
+    --------
+    H : ndarray
+        H(z) com o mesmo formato de z (inf nos polos)
+    """
+    num = np.atleast_1d(np.asarray(num, dtype=complex))
+    den = np.atleast_1d(np.asarray(den, dtype=complex))
+
+    # b0 + b1 z^-1 + ... + bL z^-L = z^-L (b0 z^L + ... + bL)
+    L = max(len(num), len(den))
+    num = np.concatenate([num, np.zeros(L - len(num))])
+    den = np.concatenate([den, np.zeros(L - len(den))])
+
+    z = np.asarray(z, dtype=complex)
+    z_plano = z.ravel()
+    H = np.empty(z_plano.shape, dtype=complex)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for inicio in range(0, len(z_plano), tamanho_bloco):
+            bloco = z_plano[inicio:inicio + tamanho_bloco]
+            H[inicio:inicio + tamanho_bloco] = _horner(num, bloco) / _horner(den, bloco)
+
+    return H.reshape(z.shape)
+
+
+def superficie_plano_z(num, den, raio_max=1.5, n_raios=500, n_angulos=500,
+                       tamanho_bloco=2**18):
+    """
+    Calcula |H(z)| numa grade polar do plano Z.
+
+    Parâmetros:
+    -----------
+    num, den : array_like
+        Coeficientes de H(z) (potências de z^-1)
+    raio_max : float
+        Raio máximo da grade (padrão: 1.5)
+    n_raios : int
+        Número de raios entre 0 e raio_max (padrão: 500)
+    n_angulos : int
+        Número de ângulos entre 0 e 2π (padrão: 500)
+    tamanho_bloco : int
+        Repassado para avaliar_racional
+
+    Retorna:
+    --------
+    z : ndarray
+        Pontos da grade, formato (n_raios, n_angulos)
+    mag : ndarray
+        |H(z)| em cada ponto da grade
+    """
+    raios = np.linspace(0, raio_max, n_raios)
+    angulos = np.linspace(0, 2*np.pi, n_angulos)
+    z = raios[:, None] * np.exp(1j * angulos)[None, :]
+
+    mag = np.abs(avaliar_racional(num, den, z, tamanho_bloco=tamanho_bloco))
+    return z, mag
+
+
+def plotar_superficie_plano_z(num, den, raio_max=1.5, n_raios=500, n_angulos=500,
+                              limite_dB=40):
+    """
+    Plota |H(z)| em dB sobre o plano Z, mostrando a influência de polos
+    (picos) e zeros (vales), junto com o círculo unitário.
+    """
+    z, mag = superficie_plano_z(num, den, raio_max, n_raios, n_angulos)
+    mag_dB = 20 * np.log10(mag + 1e-10)
+
+    # Satura os picos dos polos para não esconder o resto da superfície
+    mag_dB = np.clip(mag_dB, -limite_dB, limite_dB)
+
+    fig, ax = plt.subplots(figsize=(8, 7))
+    mapa = ax.pcolormesh(z.real, z.imag, mag_dB, shading='gouraud', cmap='viridis')
+    fig.colorbar(mapa, ax=ax, label='|H(z)| (dB)')
+
+    theta = np.linspace(0, 2*np.pi, 200)
+    ax.plot(np.cos(theta), np.sin(theta), 'w--', linewidth=1.5, label='Círculo unitário')
+
+    ax.set_xlabel('Parte Real', fontsize=11)
+    ax.set_ylabel('Parte Imaginária', fontsize=11)
+    ax.set_title('Magnitude |H(z)| no Plano Z', fontsize=13, fontweight='bold')
+    ax.legend(fontsize=10)
+    ax.axis('equal')
+
+    plt.tight_layout()
+    plt.show()
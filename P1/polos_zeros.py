@@ -0,0 +1,171 @@
+import numpy as np
+
+def _empilhar_polinomios(polinomios):
+    """
+    Converte uma lista de polinômios (potências decrescentes) em um array 2D.
+
+    Polinômios mais curtos são completados com zeros à direita. Na convenção
+    de z^-1 usada por freqz/lfilter isso não muda a função de transferência;
+    nas raízes aparece apenas um fator z^k, ou seja, raízes extras em z = 0.
+    """
+    if isinstance(polinomios, np.ndarray) and polinomios.ndim == 2:
+        # Coeficientes inteiros seriam truncados na matriz companheira
+        return polinomios.astype(np.result_type(polinomios, float))
+    polinomios = [np.atleast_1d(np.asarray(p)) for p in polinomios]
+    grau = max(len(p) for p in polinomios)
+    tipo = np.result_type(*polinomios, float)
+    pilha = np.zeros((len(polinomios), grau), dtype=tipo)
+    for i, p in enumerate(polinomios):
+        pilha[i, :len(p)] = p
+    return pilha
+
+
+def raizes_em_lote(polinomios):
+    """
+    Calcula as raízes de vários polinômios com uma única chamada de autovalores.
+
+    Monta a matriz companheira de cada polinômio e empilha todas num array
+    (B, n, n), cujos autovalores são calculados de uma vez por
+    np.linalg.eigvals (o mesmo método de np.roots, mas sem laço em Python).
+
+    Parâmetros:
+    -----------
+    polinomios : array_like
+        Array (B, n+1) ou lista de B polinômios em potências decrescentes
+        (mesma convenção de np.roots; para H(z) em z^-1, o próprio den).
+        O primeiro coeficiente de cada polinômio deve ser não nulo
+
+    Retorna:
+    --------
+    raizes : ndarray
+        Array complexo (B, n) com as raízes de cada polinômio
+    """
+    pilha = _empilhar_polinomios(polinomios)
+    B, n = pilha.shape[0], pilha.shape[1] - 1
+
+    if np.any(pilha[:, 0] == 0):
+        raise ValueError("O primeiro coeficiente de cada polinômio deve ser não nulo.")
+    if n == 0:
+        return np.zeros((B, 0), dtype=complex)
+
+    # Matriz companheira: primeira linha -c[1:]/c[0], subdiagonal de uns
+    companheiras = np.zeros((B, n, n), dtype=pilha.dtype)
+    companheiras[:, 0, :] = -pilha[:, 1:] / pilha[:, :1]
+    companheiras[:, np.arange(1, n), np.arange(n - 1)] = 1
+
+    return np.linalg.eigvals(companheiras).astype(complex)
+
+
+def agrupar_raizes(raizes, tol=1e-5):
+    """
+    Agrupa raízes numericamente repetidas e devolve as distintas com suas
+    multiplicidades.
+
+    Uma raiz de multiplicidade m sai dos autovalores espalhada em torno do
+    valor exato γ, a uma distância relativa da ordem de ε^(1/m) (~1e-4 para
+    m = 4, ~1e-3 para m = 5). Por isso o raio de agrupamento é relativo a |γ|
+    e cresce com o tamanho do grupo: a partir de cada raiz, procura o maior
+    m tal que existam m raízes a menos de 2·max(tol, 10·ε^(1/m))·|γ| dela, e
+    substitui o grupo pela média.
+
+    Parâmetros:
+    -----------
+    raizes : array_like
+        Raízes (ex.: uma linha de raizes_em_lote)
+    tol : float
+        Menor distância relativa para considerar duas raízes iguais
+        (padrão: 1e-5)
+
+    Retorna:
+    --------
+    raizes : ndarray
+        Raízes distintas, na ordem em que aparecem
+    multiplicidades : ndarray
+        Multiplicidade de cada raiz
+    """
+    eps = np.finfo(float).eps
+    todas = list(np.atleast_1d(raizes))
+    distintas, multiplicidades = [], []
+    while todas:
+        gama = todas[0]
+        # m = 1 sempre encontra a própria raiz; como os raios crescem com m,
+        # o primeiro m (de cima para baixo) com pelo menos m raízes tem
+        # exatamente m
+        for m in range(len(todas), 0, -1):
+            raio = 2 * max(tol, 10 * eps ** (1 / m)) * abs(gama)
+            grupo = [r for r in todas if abs(r - gama) <= raio]
+            if len(grupo) >= m:
+                break
+        todas = [r for r in todas if abs(r - gama) > raio]
+        distintas.append(np.mean(grupo))
+        multiplicidades.append(len(grupo))
+    return np.array(distintas), np.array(multiplicidades, dtype=int)
+
+
+def analisar_estabilidade_em_lote(denominadores):
+    """
+    Calcula polos, raio máximo e estabilidade de vários sistemas de uma vez.
+
+    Parâmetros:
+    -----------
+    denominadores : array_like
+        Array (B, N+1) ou lista de denominadores de H(z) (potências de z^-1)
+
+    Retorna:
+    --------
+    polos : ndarray
+        Array complexo (B, N) com os polos de cada sistema
+    raio_max : ndarray
+        Maior |polo| de cada sistema (0 para sistemas sem polos)
+    estavel : ndarray
+        Array booleano; True se todos os polos estão dentro do círculo unitário
+    """
+    polos = raizes_em_lote(denominadores)
+    if polos.shape[1] == 0:
+        raio_max = np.zeros(polos.shape[0])
+    else:
+        raio_max = np.max(np.abs(polos), axis=1)
+    return polos, raio_max, raio_max < 1
+
+
+def teste_jury(polinomios):
+    """
+    Teste de estabilidade de Jury / Schur-Cohn, sem calcular raízes.
+
+    Aplica a recursão de redução de ordem (step-down) e verifica se todos os
+    coeficientes de reflexão têm |k| < 1, o que equivale a todas as raízes
+    estarem dentro do círculo unitário. Custa O(n²) operações por polinômio,
+    vetorizadas sobre o lote inteiro.
+
+    Parâmetros:
+    -----------
+    polinomios : array_like
+        Um polinômio (1D) ou lote (B, n+1) / lista de polinômios em potências
+        decrescentes (o denominador de H(z), ou a equação característica)
+
+    Retorna:
+    --------
+    estavel : bool ou ndarray
+        True se todas as raízes têm módulo < 1 (um valor por polinômio;
+        escalar se a entrada for um único polinômio)
+    """
+    # Olha só o primeiro elemento: np.ndim de uma lista de polinômios de
+    # graus diferentes falharia
+    unico = np.ndim(polinomios[0]) == 0
+    pilha = _empilhar_polinomios([polinomios] if unico else polinomios)
+
+    if np.any(pilha[:, 0] == 0):
+        raise ValueError("O primeiro coeficiente de cada polinômio deve ser não nulo.")
+
+    a = pilha / pilha[:, :1]
+    estavel = np.ones(a.shape[0], dtype=bool)
+
+    for m in range(a.shape[1] - 1, 0, -1):
+        k = a[:, m].copy()
+        estavel &= np.abs(k) < 1
+        # Linhas já instáveis seguem com k = 0 só para não dividir por zero
+        k[~estavel] = 0
+        fator = (1 - np.abs(k)**2)[:, None]
+        a = (a[:, :m] - k[:, None] * np.conj(a[:, m:0:-1])) / fator
+
+    return bool(estavel[0]) if unico else estavel
@@ -8,7 +8,7 @@ def rampa(n):
             array.append(0)
     return array
 
-print(rampa(1))
-print(rampa(2))
-print(rampa(3))
-
+if __name__ == "__main__":
+    print(rampa(1))
+    print(rampa(2))
+    print(rampa(3))
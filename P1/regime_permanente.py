@@ -0,0 +1,176 @@
+from fractions import Fraction
+import numpy as np
+from .importacao_tardia import modulo_tardio
+from .salto_recorrencia import espaco_estados, preparar_salto
+
+plt = modulo_tardio('matplotlib.pyplot')
+signal = modulo_tardio('scipy.signal')
+
+def periodo_amostras(freq, fs, max_periodo=10**6):
+    """
+    Menor período P (em amostras) de uma senoide de frequência freq
+    amostrada a fs: freq/fs = m/P em fração irredutível.
+
+    Parâmetros:
+    -----------
+    freq, fs : float
+        Frequência do sinal e de amostragem (mesma unidade)
+    max_periodo : int
+        Maior denominador aceito na aproximação racional de freq/fs
+        (padrão: 10**6)
+
+    Retorna:
+    --------
+    P : int
+    """
+    return Fraction(freq / fs).limit_denominator(max_periodo).denominator
+
+
+def _dobrar(coeficientes, P):
+    """Soma os coeficientes de índices congruentes módulo P (mesma DFT de tamanho P)."""
+    coeficientes = np.atleast_1d(np.asarray(coeficientes))
+    completo = np.zeros(-(-len(coeficientes) // P) * P, dtype=coeficientes.dtype)
+    completo[:len(coeficientes)] = coeficientes
+    return completo.reshape(-1, P).sum(axis=0)
+
+
+def regime_permanente(b, a, x_periodo):
+    """
+    Saída em regime permanente de H(z) = b/a (potências de z^-1) para uma
+    entrada periódica, sobre um período, sem simular o transitório.
+
+    Com x[n] = x[n + P], a saída permanente também tem período P e a sua
+    DFT é Y[k] = H(e^(j2πk/P)) X[k]. H nas P frequências sai da DFT de
+    tamanho P de b e de a dobrados módulo P (e^(-j2πki/P) tem período P em
+    i), então o custo é O(P log P + len(b) + len(a)) para qualquer entrada:
+    senoide, várias senoides ou onda quadrada.
+
+    Parâmetros:
+    -----------
+    b, a : array_like
+        Numerador e denominador (potências de z^-1), como no lfilter
+    x_periodo : array_like
+        Um período da entrada, x[0], ..., x[P-1]
+
+    Retorna:
+    --------
+    y_periodo : ndarray
+        y[0], ..., y[P-1] do regime permanente (o regime continua com
+        y[n] = y_periodo[n mod P])
+    """
+    x_periodo = np.atleast_1d(np.asarray(x_periodo))
+    P = len(x_periodo)
+    real = np.isrealobj(b) and np.isrealobj(a) and np.isrealobj(x_periodo)
+    if real:
+        dft, idft = np.fft.rfft, lambda Y: np.fft.irfft(Y, P)
+    else:
+        dft, idft = np.fft.fft, lambda Y: np.fft.ifft(Y, P)
+
+    A = dft(_dobrar(a, P))
+    X = dft(x_periodo)
+    # Componentes da entrada abaixo do ruído de arredondamento da FFT (uma
+    # senoide tem resíduos ~1e-16 nas outras raias) não contam como usadas
+    usadas = np.abs(X) > 1e-12 * np.max(np.abs(X), initial=0)
+    if np.any(np.abs(A[usadas]) < 1e-12 * np.max(np.abs(A))):
+        raise ValueError("A entrada tem componente numa frequência de polo sobre o círculo "
+                         "unitário: não há regime permanente periódico.")
+    Y = np.zeros_like(X, dtype=complex)
+    Y[usadas] = dft(_dobrar(b, P))[usadas] / A[usadas] * X[usadas]
+    return idft(Y)
+
+
+def estado_periodico(b, a, x_periodo):
+    """
+    Estado inicial zi do lfilter que coloca o sistema direto no regime
+    permanente: lfilter(b, a, np.tile(x_periodo, q), zi=zi) sai periódico
+    desde a primeira amostra.
+
+    Resolve a equação de estado periódica z = A^P z + c, em que
+    [[A^P, c], [0, 1]] é o mapa de um período (salto_recorrencia.preparar_salto),
+    em O(P·N² + N³). Útil quando, além do regime, se quer continuar a
+    simulação a partir dele.
+
+    Parâmetros:
+    -----------
+    b, a : array_like
+        Numerador e denominador (potências de z^-1)
+    x_periodo : array_like
+        Um período da entrada
+
+    Retorna:
+    --------
+    zi : ndarray
+        Estado (max(len(a), len(b)) - 1 elementos)
+    """
+    N = len(espaco_estados(b, a)[2])
+    mapa = preparar_salto(b, a, x_periodo)['potencias'][0]
+    return np.linalg.solve(np.eye(N) - mapa[:N, :N], mapa[:N, N])
+
+
+def regime_permanente_analogico(num, den, x_periodo, T):
+    """
+    Regime permanente de H(s) = num/den (polinômios em s, como em
+    signal.TransferFunction) para uma entrada periódica de período T,
+    dada por P amostras uniformes de um período.
+
+    A entrada é tratada como limitada em banda (harmônicos até P/2): o
+    harmônico k de frequência k/T sai multiplicado por H(j2πk/T). Para ondas
+    com descontinuidades (quadrada), use P grande o bastante para os
+    harmônicos desprezados serem pequenos.
+
+    Parâmetros:
+    -----------
+    num, den : array_like
+        Coeficientes em potências decrescentes de s
+    x_periodo : array_like
+        x(0), x(T/P), ..., x((P-1)T/P)
+    T : float
+        Período da entrada em segundos
+
+    Retorna:
+    --------
+    y_periodo : ndarray
+        Saída permanente nos mesmos instantes
+    """
+    x_periodo = np.atleast_1d(np.asarray(x_periodo))
+    P = len(x_periodo)
+    X = np.fft.fft(x_periodo)
+    k = np.fft.fftfreq(P, d=1 / P)
+    s = 2j * np.pi * k / T
+    Y = np.polyval(num, s) / np.polyval(den, s) * X
+    if P % 2 == 0 and np.isrealobj(x_periodo):
+        # O harmônico de Nyquist é compartilhado por ±P/2: usa a parte real
+        # da média dos dois lados para manter a saída real
+        nyquist = P // 2
+        Y[nyquist] = X[nyquist] * np.real(
+            np.polyval(num, s[nyquist]) / np.polyval(den, s[nyquist]))
+    y = np.fft.ifft(Y)
+    real = np.isrealobj(num) and np.isrealobj(den) and np.isrealobj(x_periodo)
+    return y.real if real else y
+
+
+if __name__ == "__main__":
+    # Onda quadrada de período 40 num passa-baixas Butterworth de ordem 4
+    b, a = signal.butter(4, 0.1)
+    P = 40
+    x_periodo = np.where(np.arange(P) < P // 2, 1.0, -1.0)
+    y_periodo = regime_permanente(b, a, x_periodo)
+
+    # Conferência: simular 200 períodos e pegar o último
+    y_simulado = signal.lfilter(b, a, np.tile(x_periodo, 200))[-P:]
+    print("Diferença para a simulação longa:", np.max(np.abs(y_periodo - y_simulado)))
+
+    # Partindo do estado periódico, a simulação já começa no regime
+    zi = estado_periodico(b, a, x_periodo)
+    y_direto, _ = signal.lfilter(b, a, np.tile(x_periodo, 3), zi=zi)
+    print("Diferença sem transitório:", np.max(np.abs(y_direto - np.tile(y_periodo, 3))))
+
+    n = np.arange(3 * P)
+    plt.step(n, np.tile(x_periodo, 3), where='post', label='Entrada x[n]')
+    plt.plot(n, np.tile(y_periodo, 3), 'r.-', label='Regime permanente y[n]')
+    plt.title('Regime Permanente para Onda Quadrada')
+    plt.xlabel('n')
+    plt.ylabel('Amplitude')
+    plt.legend()
+    plt.grid(True)
+    plt.show()
@@ -0,0 +1,126 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from .importacao_tardia import modulo_tardio
+
+mfigure = modulo_tardio('matplotlib.figure')
+
+# Figuras já criadas neste processo, reaproveitadas entre relatórios:
+# (layout, figsize, dpi) -> (figura, lista de eixos)
+_figuras = {}
+
+
+def _obter_figura(layout, figsize, dpi):
+    """
+    Devolve a figura (e seus eixos) para o layout pedido, criando-a só na
+    primeira vez. As figuras são matplotlib.figure.Figure avulsas: não passam
+    pelo pyplot, não abrem janela e não dependem do backend interativo.
+    """
+    chave = (tuple(layout), tuple(figsize), dpi)
+    if chave not in _figuras:
+        fig = mfigure.Figure(figsize=figsize, dpi=dpi)
+        eixos = list(fig.subplots(*layout, squeeze=False).ravel())
+        _figuras[chave] = (fig, eixos)
+
+    fig, eixos = _figuras[chave]
+
+    # Limpa o relatório anterior: remove eixos extras (ex.: colorbar)
+    # e apaga o conteúdo dos eixos do layout
+    for ax in fig.axes:
+        if ax not in eixos:
+            fig.delaxes(ax)
+    for ax in eixos:
+        ax.cla()
+    fig.suptitle('')
+    return fig, eixos
+
+
+def renderizar_relatorio(desenhar, tarefa, caminho, layout=(1, 1), figsize=(10, 6), dpi=100):
+    """
+    Desenha um relatório em arquivo, sem janela e sem plt.show().
+
+    Parâmetros:
+    -----------
+    desenhar : callable
+        Função desenhar(eixos, tarefa) que desenha na lista de eixos recebida
+        (ex.: relatorio_resposta_frequencia, relatorio_polos_zeros)
+    tarefa : objeto
+        Dados do relatório, repassados para desenhar (ex.: (num, den))
+    caminho : str
+        Arquivo de saída; o formato vem da extensão (.png, .pdf, .svg, ...)
+    layout : tuple
+        (linhas, colunas) de eixos da figura (padrão: (1, 1))
+    figsize : tuple
+        Tamanho da figura em polegadas (padrão: (10, 6))
+    dpi : int
+        Resolução da figura (padrão: 100)
+
+    Retorna:
+    --------
+    caminho : str
+        O próprio caminho do arquivo gerado
+    """
+    fig, eixos = _obter_figura(layout, figsize, dpi)
+    desenhar(eixos, tarefa)
+    fig.tight_layout()
+    fig.savefig(caminho)
+    return caminho
+
+
+def _renderizar_item(argumentos):
+    """Executa renderizar_relatorio num processo do pool."""
+    desenhar, tarefa, caminho, layout, figsize, dpi = argumentos
+    return renderizar_relatorio(desenhar, tarefa, caminho, layout, figsize, dpi)
+
+
+def renderizar_em_lote(desenhar, tarefas, pasta, nomes=None, layout=(1, 1),
+                       figsize=(10, 6), dpi=100, formato='png', processos=None):
+    """
+    Renderiza muitos relatórios em arquivos, distribuídos num pool de processos.
+
+    Cada processo reaproveita a mesma figura e os mesmos eixos para todos os
+    relatórios que recebe, então o custo fica limitado pelo número de
+    núcleos e não por criação de figuras ou pela interface gráfica.
+
+    Parâmetros:
+    -----------
+    desenhar : callable
+        Função desenhar(eixos, tarefa), definida no nível do módulo (precisa
+        ser serializável para ir aos processos)
+    tarefas : iterable
+        Dados de cada relatório (ex.: lista de (num, den))
+    pasta : str
+        Pasta de saída (criada se não existir)
+    nomes : list ou None
+        Nome (sem extensão) de cada arquivo. Se None, usa relatorio_0000, ...
+    layout, figsize, dpi :
+        Como em renderizar_relatorio
+    formato : str
+        Extensão dos arquivos (padrão: 'png')
+    processos : int ou None
+        Número de processos. None usa todos os núcleos; 1 renderiza no
+        próprio processo, sem pool
+
+    Retorna:
+    --------
+    caminhos : list
+        Caminhos dos arquivos gerados, na mesma ordem de tarefas
+    """
+    tarefas = list(tarefas)
+    if nomes is None:
+        nomes = [f"relatorio_{i:04d}" for i in range(len(tarefas))]
+    if len(nomes) != len(tarefas):
+        raise ValueError("nomes deve ter o mesmo tamanho de tarefas.")
+
+    os.makedirs(pasta, exist_ok=True)
+    argumentos = [(desenhar, tarefa, os.path.join(pasta, f"{nome}.{formato}"), layout, figsize, dpi)
+                  for tarefa, nome in zip(tarefas, nomes)]
+
+    if processos == 1:
+        return [_renderizar_item(a) for a in argumentos]
+
+    # Lotes grandes por processo: menos comunicação e mais reaproveitamento da figura
+    n_processos = processos or os.cpu_count() or 1
+    tamanho_lote = max(1, len(argumentos) // (4 * n_processos))
+
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        return list(executor.map(_renderizar_item, argumentos, chunksize=tamanho_lote))
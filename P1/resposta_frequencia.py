@@ -0,0 +1,184 @@
+from functools import cached_property
+import numpy as np
+from .importacao_tardia import modulo_tardio
+
+signal = modulo_tardio('scipy.signal')
+
+def resposta_frequencia_zoom(num, den, w1, w2, M=1024):
+    """
+    Calcula H(e^jω) numa grade densa apenas na sub-faixa [ω1, ω2].
+
+    Usa a transformada chirp-Z (signal.czt), que avalia os polinômios do
+    numerador e do denominador em M pontos igualmente espaçados do arco
+    e^jω, ω ∈ [ω1, ω2], com custo O((L + M) log(L + M)) (L = nº de
+    coeficientes). Útil para ver o ripple perto de ωp sem aumentar o
+    worN do freqz na faixa [0, π] inteira.
+
+    Parâmetros:
+    -----------
+    num : array_like
+        Coeficientes do numerador (potências decrescentes de z, como no freqz)
+    den : array_like
+        Coeficientes do denominador (potências decrescentes de z, como no freqz)
+    w1, w2 : float
+        Limites da sub-faixa em rad/amostra (w1 < w2)
+    M : int
+        Número de pontos na sub-faixa (padrão: 1024)
+
+    Retorna:
+    --------
+    w : ndarray
+        Frequências em rad/amostra de w1 a w2 (inclusive)
+    H : ndarray
+        Resposta em frequência complexa nessas frequências
+    """
+    if M < 2:
+        raise ValueError("M deve ser pelo menos 2.")
+    if w2 <= w1:
+        raise ValueError("É preciso w1 < w2.")
+
+    num = np.atleast_1d(np.asarray(num, dtype=float))
+    den = np.atleast_1d(np.asarray(den, dtype=float))
+
+    # Pontos z_k = A * W^(-k), com A = e^(jω1) e W = e^(-jΔω)
+    passo = (w2 - w1) / (M - 1)
+    A = np.exp(1j * w1)
+    W = np.exp(-1j * passo)
+
+    H_num = signal.czt(num, M, W, A)
+    H_den = signal.czt(den, M, W, A)
+
+    w = w1 + passo * np.arange(M)
+    return w, H_num / H_den
+
+
+class RespostaFrequencia:
+    """
+    Resposta em frequência H(e^jω) com grandezas derivadas calculadas sob demanda.
+
+    Guarda apenas w e H. Magnitude, dB, fase (enrolada e desdobrada), atraso
+    de grupo e banda de -3 dB são calculados no primeiro acesso e ficam
+    guardados na instância; o que nunca é acessado nunca é calculado.
+
+    Para compatibilidade com o código antigo, o objeto se comporta como a
+    sexta-upla (w, H, mag, mag_dB, fase, fase_graus): pode ser desempacotado,
+    indexado (resposta[0] é w) e len(resposta) == 6:
+    >>> w, H, mag, mag_dB, fase, fase_graus = calcular_resposta_frequencia(num, den)
+
+    Parâmetros:
+    -----------
+    w : ndarray
+        Frequências em rad/amostra
+    H : ndarray
+        Resposta em frequência complexa nessas frequências
+    num, den : array_like, opcional
+        Coeficientes de H(z). Se fornecidos, o atraso de grupo é calculado
+        de forma exata (signal.group_delay) em vez de derivada numérica
+    """
+
+    # Campos da sexta-upla antiga, na ordem
+    _CAMPOS = ('w', 'H', 'mag', 'mag_dB', 'fase', 'fase_graus')
+
+    def __init__(self, w, H, num=None, den=None):
+        self.w = np.asarray(w)
+        self.H = np.asarray(H)
+        self.num = num
+        self.den = den
+
+    def __len__(self):
+        return len(self._CAMPOS)
+
+    def __iter__(self):
+        return (getattr(self, campo) for campo in self._CAMPOS)
+
+    def __getitem__(self, indice):
+        # Só calcula o(s) campo(s) pedido(s): resposta[0] não calcula mag
+        campos = self._CAMPOS[indice]
+        if isinstance(indice, slice):
+            return tuple(getattr(self, campo) for campo in campos)
+        return getattr(self, campos)
+
+    @cached_property
+    def mag(self):
+        """Magnitude (linear)"""
+        return np.abs(self.H)
+
+    @cached_property
+    def mag_dB(self):
+        """Magnitude em dB"""
+        return 20 * np.log10(self.mag + 1e-10)
+
+    @cached_property
+    def fase(self):
+        """Fase em radianos, em [-π, π]"""
+        return np.angle(self.H)
+
+    @cached_property
+    def fase_graus(self):
+        """Fase em graus, em [-180, 180]"""
+        return np.degrees(self.fase)
+
+    @cached_property
+    def fase_desdobrada(self):
+        """Fase em radianos sem os saltos de 2π"""
+        return np.unwrap(self.fase)
+
+    @cached_property
+    def atraso_grupo(self):
+        """Atraso de grupo τ(ω) = -d∠H/dω, em amostras"""
+        if self.num is not None and self.den is not None:
+            _, gd = signal.group_delay((self.num, self.den), w=self.w)
+            return gd
+        return -np.gradient(self.fase_desdobrada, self.w)
+
+    @cached_property
+    def faixa_3dB(self):
+        """
+        (ω_inf, ω_sup): menor e maior frequência em que |H| está a até 3 dB
+        do máximo, com interpolação linear nas bordas.
+        """
+        limiar = np.max(self.mag_dB) - 3
+        acima = np.nonzero(self.mag_dB >= limiar)[0]
+        i0, i1 = acima[0], acima[-1]
+
+        w_inf = self.w[i0]
+        if i0 > 0:
+            w_inf = np.interp(limiar, self.mag_dB[[i0 - 1, i0]], self.w[[i0 - 1, i0]])
+        w_sup = self.w[i1]
+        if i1 < len(self.w) - 1:
+            # mag_dB decresce de i1 para i1+1; np.interp precisa de x crescente
+            w_sup = np.interp(limiar, self.mag_dB[[i1 + 1, i1]], self.w[[i1 + 1, i1]])
+        return w_inf, w_sup
+
+    @cached_property
+    def largura_banda_3dB(self):
+        """Largura da banda de -3 dB em rad/amostra"""
+        w_inf, w_sup = self.faixa_3dB
+        return w_sup - w_inf
+
+
+def calcular_resposta_frequencia(num, den, N=512, faixa=None):
+    """
+    Calcula a resposta em frequência de H(z) e devolve um RespostaFrequencia.
+
+    Parâmetros:
+    -----------
+    num : array_like
+        Coeficientes do numerador (potências decrescentes de z)
+    den : array_like
+        Coeficientes do denominador (potências decrescentes de z)
+    N : int
+        Número de pontos de frequência (padrão: 512)
+    faixa : tuple ou None
+        Se None, usa signal.freqz em [0, π). Se (ω1, ω2), usa o modo zoom
+        (resposta_frequencia_zoom) apenas nessa sub-faixa
+
+    Retorna:
+    --------
+    RespostaFrequencia
+    """
+    if faixa is None:
+        w, H = signal.freqz(num, den, worN=N, whole=False)
+    else:
+        w, H = resposta_frequencia_zoom(num, den, faixa[0], faixa[1], M=N)
+    return RespostaFrequencia(w, H, num=num, den=den)
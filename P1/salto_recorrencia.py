@@ -0,0 +1,201 @@
+import numpy as np
+from .importacao_tardia import modulo_tardio
+
+plt = modulo_tardio('matplotlib.pyplot')
+signal = modulo_tardio('scipy.signal')
+
+def espaco_estados(b, a):
+    """
+    Matrizes de estado da forma direta II transposta usada pelo lfilter:
+        z[n] = A z[n-1] + B x[n]
+        y[n] = C z[n-1] + D x[n]
+    com z[n-1] igual ao zi/zf do lfilter (o estado antes da amostra n).
+
+    Parâmetros:
+    -----------
+    b : array_like
+        Coeficientes do numerador (potências de z^-1)
+    a : array_like
+        Coeficientes do denominador (potências de z^-1)
+
+    Retorna:
+    --------
+    A, B, C, D : ndarray
+        A de formato (N, N), B e C de formato (N,) e D escalar, com
+        N = max(len(a), len(b)) - 1 (coeficientes já divididos por a[0])
+    """
+    b = np.atleast_1d(np.asarray(b))
+    a = np.atleast_1d(np.asarray(a))
+    if a[0] == 0:
+        raise ValueError("O primeiro coeficiente do denominador deve ser não nulo.")
+
+    N = max(len(a), len(b)) - 1
+    tipo = np.result_type(b, a, float)
+    b = np.concatenate([b, np.zeros(N + 1 - len(b))]).astype(tipo) / a[0]
+    a = np.concatenate([a, np.zeros(N + 1 - len(a))]).astype(tipo) / a[0]
+
+    A = np.zeros((N, N), dtype=tipo)
+    A[:, 0] = -a[1:]
+    A[np.arange(N - 1), np.arange(1, N)] = 1
+    B = b[1:] - a[1:] * b[0]
+    C = np.zeros(N, dtype=tipo)
+    if N:
+        C[0] = 1
+    return A, B, C, b[0]
+
+
+def preparar_salto(b, a, entrada=0.0, condicoes=None, condicoes_x=None):
+    """
+    Prepara a avaliação de y[n] em horizontes arbitrários, sem simular as
+    amostras intermediárias, para entradas nula, constante ou periódicas.
+
+    O estado é aumentado com uma componente constante 1, s = [z; 1], para que
+    cada passo vire uma multiplicação de matriz mesmo com entrada:
+        S_j = [[A, B p[j]], [0, 1]]
+    Para uma entrada de período P, guarda os mapas parciais
+    M_r = S_(r-1) ... S_1 S_0 (r = 0, ..., P-1) e o mapa de um período
+    M_P; então, com n = qP + r,
+        s[n-1] = M_r M_P^q s[-1],    y[n] = C s[n-1] + D p[r]
+    e M_P^q sai das potências M_P^(2^k) (avaliar_salto), em O(N³ log n).
+
+    Parâmetros:
+    -----------
+    b, a : array_like
+        Numerador e denominador (potências de z^-1), como no lfilter
+    entrada : número ou array_like
+        Escalar: entrada constante x[n] = entrada para n >= 0 (0 é a
+        resposta de entrada nula). Array: um período [p0, ..., p(P-1)],
+        x[n] = p[n mod P]
+    condicoes : array_like ou None
+        [y[-1], y[-2], ...] (None: repouso)
+    condicoes_x : array_like ou None
+        [x[-1], x[-2], ...] (None: zeros), como em signal.lfiltic
+
+    Retorna:
+    --------
+    salto : dict
+        - 'C', 'D': saída em função do estado aumentado
+        - 'periodo': array com um período da entrada
+        - 'parciais': M_0, ..., M_(P-1), formato (P, N+1, N+1)
+        - 'potencias': [M_P, M_P², M_P⁴, ...], estendida sob demanda
+        - 'estado_inicial': s[-1] = [zi; 1]
+        - 'real': True se coeficientes, entrada e condições são reais
+    """
+    A, B, C, D = espaco_estados(b, a)
+    N = len(C)
+    periodo = np.atleast_1d(np.asarray(entrada))
+    if periodo.ndim != 1 or len(periodo) == 0:
+        raise ValueError("entrada deve ser um escalar ou um período 1D não vazio.")
+
+    zi = np.zeros(N)
+    if N and (condicoes is not None or condicoes_x is not None):
+        a0 = np.atleast_1d(np.asarray(a))[0]
+        y_ant = [0.0] if condicoes is None else condicoes
+        zi = signal.lfiltic(np.asarray(b) / a0, np.asarray(a) / a0, y_ant, condicoes_x)
+    tipo = np.result_type(A, periodo, zi)
+
+    passo = np.zeros((N + 1, N + 1), dtype=tipo)
+    passo[:N, :N] = A
+    passo[N, N] = 1
+    parciais = np.empty((len(periodo) + 1, N + 1, N + 1), dtype=tipo)
+    parciais[0] = np.eye(N + 1)
+    for j, pj in enumerate(periodo):
+        passo[:N, N] = B * pj
+        parciais[j + 1] = passo @ parciais[j]
+
+    return {
+        'C': np.concatenate([C, [0]]).astype(tipo),
+        'D': D,
+        'periodo': periodo,
+        'parciais': parciais[:-1],
+        'potencias': [parciais[-1]],
+        'estado_inicial': np.concatenate([zi, [1]]).astype(tipo),
+        'real': not np.issubdtype(tipo, np.complexfloating),
+    }
+
+
+def avaliar_salto(salto, n):
+    """
+    y[n] para horizontes arbitrários, a partir de preparar_salto.
+
+    Os horizontes são tratados juntos: para cada bit k do número de períodos
+    q, os estados com esse bit ligado são multiplicados por M_P^(2^k) de uma
+    vez. Custo O(N³ log n) para as potências (reaproveitadas entre chamadas)
+    mais O(len(n) · N² log n) para os estados; n = 10**12 custa pouco mais
+    que n = 10**3.
+
+    Parâmetros:
+    -----------
+    salto : dict
+        Resultado de preparar_salto
+    n : int ou array_like de int
+        Horizontes (n >= 0; qualquer formato, esparsos ou fora de ordem)
+
+    Retorna:
+    --------
+    y : ndarray
+        y[n] com o mesmo formato de n
+    """
+    n = np.asarray(n)
+    if n.size and np.min(n) < 0:
+        raise ValueError("Os horizontes devem ser n >= 0.")
+    P = len(salto['periodo'])
+    q, r = np.divmod(n.ravel().astype(np.int64), P)
+
+    potencias = salto['potencias']
+    bits = int(q.max()).bit_length() if q.size else 0
+    while len(potencias) < bits:
+        potencias.append(potencias[-1] @ potencias[-1])
+
+    estados = np.tile(salto['estado_inicial'], (len(q), 1))
+    for k in range(bits):
+        ligado = (q >> k) & 1 == 1
+        estados[ligado] = estados[ligado] @ potencias[k].T
+    estados = np.einsum('hij,hj->hi', salto['parciais'][r], estados)
+
+    y = estados @ salto['C'] + salto['D'] * salto['periodo'][r]
+    if salto['real']:
+        y = np.real(y)
+    return y.reshape(n.shape)
+
+
+def recorrencia_em(b, a, n, entrada=0.0, condicoes=None, condicoes_x=None):
+    """
+    y[n] de a0 y[n] + ... + aN y[n-N] = b0 x[n] + ... + bM x[n-M] nos
+    horizontes n, com entrada constante ou periódica (ver preparar_salto).
+
+    Equivale a lfilter(b, a, x, zi=lfiltic(b, a, condicoes))[n], sem calcular
+    as amostras intermediárias. Para várias consultas ao mesmo sistema, use
+    preparar_salto uma vez e avaliar_salto a cada consulta.
+    """
+    return avaliar_salto(preparar_salto(b, a, entrada, condicoes, condicoes_x), n)
+
+
+if __name__ == "__main__":
+    # Lucro y[n] = (1+r)y[n-1] + x[n]: saldo inicial 1000 e depósito de 100 por mês
+    r = 0.005
+    b, a = [1], [1, -(1 + r)]
+    salto = preparar_salto(b, a, entrada=100.0, condicoes=[1000.0])
+
+    meses = np.array([12, 120, 600, 1200])
+    for mes, saldo in zip(meses, avaliar_salto(salto, meses - 1)):
+        print(f"Saldo após {mes:5d} meses: {saldo:.2f}")
+
+    # Conferência com o lfilter, simulando todas as amostras
+    x = np.full(1200, 100.0)
+    y = signal.lfilter(b, a, x, zi=signal.lfiltic(b, a, [1000.0]))[0]
+    print("Erro relativo máximo:", np.max(np.abs(avaliar_salto(salto, np.arange(1200)) - y) / np.abs(y)))
+
+    # Entrada periódica: depósito dobrado todo mês 12 (décimo terceiro)
+    deposito = np.full(12, 100.0)
+    deposito[11] = 200.0
+    salto_anual = preparar_salto(b, a, entrada=deposito, condicoes=[1000.0])
+    anos = np.arange(1, 31)
+    saldos = avaliar_salto(salto_anual, 12 * anos - 1)
+
+    plt.stem(anos, saldos)
+    plt.title("Saldo ao fim de cada ano (depósito periódico)")
+    plt.xlabel("Ano")
+    plt.ylabel("y[n]")
+    plt.grid(True)
+    plt.show()
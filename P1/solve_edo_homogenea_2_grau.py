@@ -1,88 +1,187 @@
 import numpy as np
-import matplotlib.pyplot as plt
+from .polos_zeros import agrupar_raizes, raizes_em_lote, teste_jury
+from .lfilter import filtrar_com_condicoes
+from .importacao_tardia import modulo_tardio
 
-#Expressão do Lucro é y[n]=(1+r)y[n-1]+x[n]
-
-#Lembrar de colocar a expressão em avanço pra calcular a homogenea
-def solve_edo_homo(coeficientes_entrada,cond_menos_um, cond_menos_dois):
-    if(len(coeficientes_entrada)==2):
-
-    # Resolve EDO homogênea discreta de 1ª ordem:
-    # a1*y[n] + a0*y[n-1] = 0
-        a1, a0 = coeficientes_entrada
-        print(f"Equação característica: {a1}*gama + {a0} = 0")
-
-        gama = -a0 / a1
-        print(f"Raiz (gama): {gama:.4f}")
+plt = modulo_tardio('matplotlib.pyplot')
 
-        if abs(gama) < 1:
-            print("Sistema Estável")
-        else:
-            print("Sistema Instável")
-
-   
-        C = cond_menos_um / gama
-        print(f"Constante C = {C:.4f}")
+#Expressão do Lucro é y[n]=(1+r)y[n-1]+x[n]
 
-        # Solução geral
-        print(f"Solução: y[n] = {C:.4f} * ({gama:.4f})^n , n >= 0")
+def raizes_com_multiplicidade(coeficientes, tol=1e-5):
+    """
+    Raízes distintas da equação característica e suas multiplicidades.
+
+    As raízes vêm dos autovalores da matriz companheira (raizes_em_lote) e
+    são agrupadas por agrupar_raizes, com raio relativo que cresce com a
+    multiplicidade (raízes repetidas saem espalhadas de ~ε^(1/m)).
+
+    Parâmetros:
+    -----------
+    coeficientes : array_like
+        [a0, a1, ..., aN] de a0 γ^N + a1 γ^(N-1) + ... + aN = 0
+    tol : float
+        Menor distância relativa para considerar duas raízes iguais
+        (padrão: 1e-5)
+
+    Retorna:
+    --------
+    raizes : ndarray
+        Raízes distintas (complexas)
+    multiplicidades : ndarray
+        Multiplicidade de cada raiz
+    """
+    raizes, multiplicidades = agrupar_raizes(raizes_em_lote([coeficientes])[0], tol)
+    return raizes.astype(complex), multiplicidades
+
+
+def base_homogenea(raizes, multiplicidades, n):
+    """
+    Matriz da base n^j γ^n (j = 0, ..., m-1 para cada raiz γ de multiplicidade m).
+
+    Retorna:
+    --------
+    ndarray de formato (len(n), N), uma coluna por função da base
+    """
+    n = np.asarray(n, dtype=float)
+    colunas = []
+    for gama, m in zip(raizes, multiplicidades):
+        potencia = np.power(complex(gama), n)
+        for j in range(m):
+            colunas.append(n**j * potencia)
+    return np.stack(colunas, axis=-1)
+
+
+def resolver_homogenea(coeficientes, condicoes, n, tol=1e-5):
+    """
+    Solução da equação de diferenças homogênea de ordem N
+        a0 y[n] + a1 y[n-1] + ... + aN y[n-N] = 0
+    na forma fechada y[n] = Σ_γ Σ_j c_γj n^j γ^n, vetorizada sobre vários
+    conjuntos de condições iniciais.
+
+    As constantes saem de um único sistema linear Φ c = y0, com
+    Φ[i, :] = base em n = -(i+1), resolvido para todos os conjuntos de uma vez.
+
+    Parâmetros:
+    -----------
+    coeficientes : array_like
+        [a0, a1, ..., aN] (mesma convenção do denominador em lfilter)
+    condicoes : array_like
+        [y[-1], y[-2], ..., y[-N]], ou array (S, N) com S conjuntos de
+        condições (ex.: cenários de Monte Carlo)
+    n : array_like de int
+        Índices onde avaliar a solução (n >= 0, podem ser esparsos)
+    tol : float
+        Repassado para raizes_com_multiplicidade
+
+    Retorna:
+    --------
+    y : ndarray
+        Formato (len(n),) para um conjunto de condições ou (S, len(n)) para S
+        conjuntos (real se os coeficientes e as condições forem reais)
+    constantes : ndarray
+        Constantes c, formato (N,) ou (S, N), na ordem das colunas de base_homogenea
+    """
+    coeficientes = np.trim_zeros(np.atleast_1d(np.asarray(coeficientes)), 'b')
+    N = len(coeficientes) - 1
+    condicoes = np.asarray(condicoes)
+    unico = condicoes.ndim == 1
+    condicoes = np.atleast_2d(condicoes)[:, :N]
+
+    if N == 0:
+        y = np.zeros((len(condicoes), len(np.atleast_1d(n))))
+        constantes = np.zeros((len(condicoes), 0))
+        return (y[0], constantes[0]) if unico else (y, constantes)
+
+    raizes, multiplicidades = raizes_com_multiplicidade(coeficientes, tol)
+    Phi = base_homogenea(raizes, multiplicidades, -np.arange(1, N + 1))
+    constantes = np.linalg.solve(Phi, condicoes.T.astype(complex)).T
+
+    y = constantes @ base_homogenea(raizes, multiplicidades, np.atleast_1d(n)).T
+    if np.isrealobj(coeficientes) and np.isrealobj(condicoes):
+        y = y.real
+
+    return (y[0], constantes[0]) if unico else (y, constantes)
+
+
+def resposta_completa(coeficientes, b, x, condicoes):
+    """
+    Resposta completa de a0 y[n] + ... + aN y[n-N] = b0 x[n] + ... + bM x[n-M]
+    para n = 0, ..., len(x)-1: resposta de entrada nula mais resposta de
+    estado nulo, numa única passada do lfilter com as condições iniciais
+    convertidas em estado (lfilter.filtrar_com_condicoes).
+
+    Parâmetros:
+    -----------
+    coeficientes : array_like
+        [a0, ..., aN] (denominador)
+    b : array_like
+        [b0, ..., bM] (numerador)
+    x : array_like
+        Entrada x[0..L-1] (x[n] = 0 para n < 0), ou array (S, L) com uma
+        entrada por conjunto de condições
+    condicoes : array_like
+        [y[-1], ..., y[-N]] ou array (S, N)
+
+    Retorna:
+    --------
+    y : ndarray
+        Formato (L,) ou (S, L)
+    """
+    return filtrar_com_condicoes(b, coeficientes, x, condicoes)
 
-        
-        n = np.arange(0, 30)
-        y = C * (gama**n)
 
+#Lembrar de colocar a expressão em avanço pra calcular a homogenea
+def solve_edo_homo(coeficientes_entrada, *condicoes, n_amostras=30, plotar=True):
+    """
+    Resolve e plota a equação de diferenças homogênea de qualquer ordem.
+
+    coeficientes_entrada = [a0, ..., aN] e condicoes = y[-1], y[-2], ..., y[-N]
+    (condições a mais são ignoradas, como no uso antigo
+    solve_edo_homo([1, -0.6], y_menos_um, y_menos_dois)).
+    """
+    coeficientes = np.asarray(coeficientes_entrada)
+    N = len(coeficientes) - 1
+    if len(condicoes) < N:
+        raise ValueError(f"Equação de ordem {N}: informe {N} condições iniciais.")
+    condicoes = np.asarray(condicoes[:N], dtype=float)
+
+    termos = " + ".join(f"{a}*gama^{N - i}" for i, a in enumerate(coeficientes))
+    print(f"Equação característica: {termos} = 0")
+
+    raizes, multiplicidades = raizes_com_multiplicidade(coeficientes)
+    for gama, m in zip(raizes, multiplicidades):
+        gama = np.real_if_close(gama)
+        print(f"Raiz (gama): {gama:.4f}" + (f" (multiplicidade {m})" if m > 1 else ""))
+
+    if teste_jury(coeficientes):
+        print("Sistema Estável")
+    else:
+        print("Sistema Instável")
+
+    n = np.arange(0, n_amostras)
+    y, constantes = resolver_homogenea(coeficientes, condicoes, n)
+    print(f"constantes: {np.real_if_close(constantes)}")
+
+    if plotar:
         plt.stem(n, y)
-        plt.title("Solução da EDO Homogênea de 1ª Ordem")
+        plt.title(f"Solução da EDO Homogênea de Ordem {N}")
         plt.xlabel("n")
         plt.ylabel("y[n]")
         plt.grid(True)
         plt.show()
-
-        return y
-    elif(len(coeficientes_entrada)==3):
-        print(f"eq de segundo grau:{coeficientes_entrada[0]}*gama^2 {coeficientes_entrada[1]}*gama {coeficientes_entrada[2]} ")
-
-        delta=(coeficientes_entrada[1])**2-4*coeficientes_entrada[0]*coeficientes_entrada[2]
-        print(f"delta={delta}")
-
-        gama1=(-(coeficientes_entrada[1])-(delta**(1/2)))/(2*coeficientes_entrada[0])
-        gama2=(-(coeficientes_entrada[1])+(delta**(1/2)))/(2*coeficientes_entrada[0])
-        print(f"gama1: {gama1}")
-        print(f"gama2: {gama2}")
-
-        #Resolvendo sistema de equação pra achar as constantes
-        A = np.array([[gama1**(-1), gama2**(-1)],
-            [gama1**(-2), gama2**(-2)]])
-        
-        B = np.array([cond_menos_um, cond_menos_dois])
-
-        constantes = np.linalg.solve(A, B)
-        print(f"constantes:{constantes}")
-
-        c1 = constantes[0]
-        c2 = constantes[1]
-
-        print(f"c1: {c1:.3f}")
-        print(f"c2: {c2:.3f}")
-    
-        if(0<abs(gama1)<1 and 0<abs(gama1)<1):
-            print("Sistema Estável")
-        else:
-            print("Sistema Instável")
-        print(f"solução: {c1:.3f}*({gama1})^n + {c2:.3f}*({gama2})^n , n>=0")
-
-
-        n = np.arange(0, 30)
-        eq_resultado = c1 * (gama1**n) + c2 * (gama2**n)
-
-        plt.stem(n,eq_resultado)
-        plt.title("Solução da EDO de 2ª Ordem")
-        plt.show()
-        return eq_resultado
+    return y
 
 
+if __name__ == "__main__":
+    entrada=[1,-0.6,-0.16]
 
-entrada=[1,-0.6,-0.16]
+    # entrada=[1,-0.6]
+    solve_edo_homo(entrada,0,25/4)
 
-# entrada=[1,-0.6]
-solve_edo_homo(entrada,0,25/4)
\ No newline at end of file
+    # Monte Carlo do lucro y[n] = (1+r)y[n-1] + x[n]: 10000 saldos iniciais
+    # e depósitos mensais fixos, todos resolvidos de uma vez
+    r = 0.01
+    saldos_iniciais = np.random.default_rng(0).uniform(0, 1000, size=(10000, 1))
+    depositos = np.full(120, 100.0)
+    y = resposta_completa([1, -(1 + r)], [1], depositos, saldos_iniciais)
+    print(f"Saldo após 120 meses: média {y[:, -1].mean():.2f}, desvio {y[:, -1].std():.2f}")
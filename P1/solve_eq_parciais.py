@@ -1,6 +1,10 @@
-from sympy import symbols, apart, simplify, factor, degree, div, Poly, cancel, S, Add
-from sympy.parsing.sympy_parser import parse_expr
 from fractions import Fraction
+import numpy as np
+from .importacao_tardia import modulo_tardio
+from .polos_zeros import agrupar_raizes
+
+sp = modulo_tardio('sympy')
+sympy_parser = modulo_tardio('sympy.parsing.sympy_parser')
 
 def extrair_fracoes(expr, var):
     """
@@ -11,7 +15,7 @@ def extrair_fracoes(expr, var):
     fracoes = []
     
     # Se a expressão é uma soma, separa os termos
-    if isinstance(expr, Add):
+    if isinstance(expr, sp.Add):
         termos = expr.as_ordered_terms()
     else:
         termos = [expr]
@@ -35,22 +39,295 @@ def extrair_fracoes(expr, var):
     
     return fracoes
 
-def decomposicao_fracao_parcial(expressao=None, numerador=None, denominador=None, variavel='x', racional=False):
+def _formatar_numero(c):
+    """Número (real ou complexo) como texto no formato do sympy (I = unidade imaginária)."""
+    c = complex(c)
+    # Partes ~1e-16 vezes menores que |c| são arredondamento: viram zero
+    # (sem sinal) para não aparecer -2.9e-16 no texto
+    limite = 1e-12 * abs(c)
+    real = c.real + 0.0 if abs(c.real) > limite else 0.0
+    imag = c.imag + 0.0 if abs(c.imag) > max(limite, 1e-12) else 0.0
+    if imag == 0:
+        return f"{real:.6g}"
+    return f"({real:.6g}{imag:+.6g}*I)"
+
+
+def _formatar_polinomio(coeficientes, var):
+    """Polinômio em potências decrescentes de var como texto (ex.: 'x**2 - 0.9*x + 0.9')."""
+    grau = len(coeficientes) - 1
+    # Coeficientes ~1e-16 vezes menores que o maior são resto de arredondamento
+    limite = 1e-12 * max((abs(c) for c in coeficientes), default=0)
+    termos = []
+    for i, c in enumerate(coeficientes):
+        k = grau - i
+        if c == 0 or abs(c) <= limite:
+            continue
+        monomio = '' if k == 0 else var if k == 1 else f"{var}**{k}"
+        if not monomio:
+            termos.append(_formatar_numero(c))
+        elif c == 1:
+            termos.append(monomio)
+        elif c == -1:
+            termos.append(f"-{monomio}")
+        else:
+            termos.append(f"{_formatar_numero(c)}*{monomio}")
+    if not termos:
+        return "0"
+    return " + ".join(termos).replace("+ -", "- ")
+
+
+def _formatar_fator(polo, var):
+    """Fator (var - polo) como texto."""
+    polo = complex(polo)
+    if abs(polo.imag) > 1e-12 * max(1.0, abs(polo.real)):
+        return f"({var} - {_formatar_numero(polo)})"
+    if polo.real == 0:
+        return var
+    if polo.real < 0:
+        return f"({var} + {_formatar_numero(-polo.real)})"
+    return f"({var} - {_formatar_numero(polo.real)})"
+
+
+def _coeficientes_numericos(expressao, numerador, denominador, variavel):
+    """
+    Obtém os coeficientes numéricos (potências decrescentes) do numerador e do
+    denominador. Listas de coeficientes são usadas diretamente, sem sympy;
+    strings passam só pelo parse. Retorna None se a expressão não for uma
+    razão de polinômios com coeficientes numéricos.
+    """
+    if numerador is not None and denominador is not None \
+            and not isinstance(numerador, str) and not isinstance(denominador, str):
+        return np.atleast_1d(np.asarray(numerador)), np.atleast_1d(np.asarray(denominador))
+
+    try:
+        var = sp.symbols(variavel)
+        if expressao is not None:
+            numer, denom = sympy_parser.parse_expr(expressao, local_dict={variavel: var}).as_numer_denom()
+        else:
+            numer = sympy_parser.parse_expr(numerador, local_dict={variavel: var})
+            denom = sympy_parser.parse_expr(denominador, local_dict={variavel: var})
+        num = [complex(c) for c in sp.Poly(numer, var).all_coeffs()]
+        den = [complex(c) for c in sp.Poly(denom, var).all_coeffs()]
+    except Exception:
+        return None
+    return np.real_if_close(num), np.real_if_close(den)
+
+
+def _cancelar_raizes_comuns(num, den, tol):
+    """
+    Remove raízes comuns ao numerador e ao denominador (distância relativa
+    <= tol, isto é, |zero - polo| <= tol·|polo|).
+
+    Retorna (num, den, polos, houve_cancelamento), com polos = raízes do
+    den devolvido (já calculadas aqui, não precisam de outro np.roots).
+    """
+    polos = np.roots(den) if len(den) > 1 else np.zeros(0)
+    if len(num) < 2 or len(polos) == 0:
+        return num, den, polos, False
+
+    zeros = list(np.roots(num))
+    restantes = []
+    for polo in polos:
+        if zeros:
+            distancias = np.abs(np.array(zeros) - polo)
+            j = int(np.argmin(distancias))
+            if distancias[j] <= tol * abs(polo):
+                zeros.pop(j)
+                continue
+        restantes.append(polo)
+
+    if len(restantes) == len(polos):
+        return num, den, polos, False
+    num = np.real_if_close(num[0] * np.poly(zeros), tol=1e6)
+    den = np.real_if_close(den[0] * np.poly(restantes), tol=1e6)
+    return np.atleast_1d(num), np.atleast_1d(den), np.array(restantes), True
+
+
+def _residuos(num, den, polos, tol):
+    """
+    Frações parciais de num/den a partir das raízes polos de den, como
+    signal.residue, mas com os polos repetidos agrupados por distância
+    relativa (agrupar_raizes) em vez de absoluta.
+
+    Retorna (residuos, polos, direto, potencias): termo i =
+    residuos[i] / (x - polos[i])**potencias[i], polos em ordem crescente de
+    módulo e polos repetidos em sequência, com potências 1, 2, ..., m.
+    """
+    if len(num) >= len(den):
+        direto, resto = np.polydiv(num, den)
+    else:
+        direto, resto = np.zeros(0), num
+    if len(polos) == 0:
+        return np.zeros(0), np.zeros(0), direto, np.zeros(0, dtype=int)
+
+    distintas, multiplicidades = agrupar_raizes(polos, tol)
+    ordem = np.argsort(np.abs(distintas), kind='stable')
+    distintas, multiplicidades = distintas[ordem], multiplicidades[ordem]
+    potencias = np.concatenate([np.arange(1, m + 1) for m in multiplicidades])
+
+    if np.all(multiplicidades == 1):
+        # Polos simples: r_i = num(p_i) / (a0 · Π_{k≠i} (p_i - p_k)), vetorizado
+        diferencas = distintas[:, None] - distintas[None, :]
+        np.fill_diagonal(diferencas, 1)
+        residuos = np.polyval(resto, distintas) / (den[0] * np.prod(diferencas, axis=1))
+        return residuos, distintas, direto, potencias
+
+    residuos = []
+    for i, (polo, m) in enumerate(zip(distintas, multiplicidades)):
+        # num/den = g(x) / (x - polo)^m, g = num / (a0 · demais fatores); os
+        # resíduos são os m primeiros coeficientes de Taylor de g em polo
+        outros = np.atleast_1d(den[0] * np.poly(np.repeat(np.delete(distintas, i),
+                                                         np.delete(multiplicidades, i))))
+        monomio = np.array([1, -polo])
+        quociente_outros, valor_outros = np.polydiv(outros, monomio)
+        resto_g = np.asarray(resto, dtype=np.result_type(resto, distintas))
+        bloco = []
+        for _ in range(m):
+            resto_g, valor = np.polydiv(resto_g, monomio)
+            r = valor[-1] / valor_outros[-1]
+            resto_g = np.polysub(resto_g, r * quociente_outros)
+            bloco.append(r)
+        residuos.extend(reversed(bloco))
+    return np.array(residuos), np.repeat(distintas, multiplicidades), direto, potencias
+
+
+def _coeficientes_para_expr(coeficientes, var, racional):
+    """Lista de coeficientes (potências decrescentes) como expressão sympy."""
+    if racional:
+        coeficientes = [sp.Rational(f.numerator, f.denominator)
+                        for f in (Fraction(float(c)).limit_denominator() for c in coeficientes)]
+    else:
+        coeficientes = [sp.sympify(c) for c in coeficientes]
+    return sp.Poly(coeficientes, var).as_expr()
+
+
+def decomposicao_numerica(numerador, denominador, variavel='x', tol=1e-4):
+    """
+    Decomposição em frações parciais por resíduos, em ponto flutuante.
+
+    Calcula as raízes do denominador uma vez (np.roots), cancela as comuns
+    com o numerador, agrupa os polos repetidos e obtém os resíduos como
+    signal.residue (polos simples de uma vez, vetorizado). Não passa pelo
+    sympy. Custa da ordem de 0,3-0,5 ms por chamada para denominadores de
+    grau baixo, quase tudo overhead do numpy (np.roots, polydiv) e da
+    montagem dos textos; polos repetidos custam um pouco mais (~1 ms).
+
+    Parâmetros:
+    -----------
+    numerador, denominador : array_like
+        Coeficientes em potências decrescentes de variavel
+    variavel : str, padrão 'x'
+        Nome da variável usado nos textos do resultado
+    tol : float, padrão 1e-4
+        Distância relativa abaixo da qual duas raízes são consideradas
+        iguais: |r1 - r2| <= tol·|r1| no cancelamento entre numerador e
+        denominador; nos polos repetidos o raio cresce com a multiplicidade
+        (ver polos_zeros.agrupar_raizes). Polos distintos próximos, mas
+        separados por mais que isso, continuam distintos
+
+    Retorna:
+    --------
+    dict : mesmas chaves de decomposicao_fracao_parcial (as expressões vêm
+        como texto no formato do sympy) e mais:
+        - 'residuos', 'polos', 'multiplicidades': termo i = residuos[i] / (x - polos[i])**multiplicidades[i]
+        - 'coef_polinomial': coeficientes da parte polinomial (potências decrescentes)
+        - 'num_simplificado', 'den_simplificado': coeficientes de 'simplificada'
+        - 'metodo': 'numerico'
+    """
+    num = np.trim_zeros(np.atleast_1d(np.asarray(numerador)), 'f')
+    den = np.trim_zeros(np.atleast_1d(np.asarray(denominador)), 'f')
+    if len(den) == 0:
+        return {"erro": "Denominador não pode ser zero"}
+    if len(num) == 0:
+        num = np.zeros(1)
+
+    var = variavel
+    original_str = f"({_formatar_polinomio(num, var)})/({_formatar_polinomio(den, var)})"
+
+    num_simp, den_simp, raizes_den, houve_simplificacao = _cancelar_raizes_comuns(num, den, tol)
+    grau_num = len(num_simp) - 1
+    grau_den = len(den_simp) - 1
+    simplificada_str = f"({_formatar_polinomio(num_simp, var)})/({_formatar_polinomio(den_simp, var)})"
+
+    if np.all(num_simp == 0):
+        residuos, polos, direto = np.zeros(0), np.zeros(0), np.zeros(0)
+        multiplicidades = np.zeros(0, dtype=int)
+    else:
+        residuos, polos, direto, multiplicidades = _residuos(num_simp, den_simp, raizes_den, tol)
+
+    # Resíduos nulos (ex.: 1/(x - 1)**3 dá 0/(x - 1) e 0/(x - 1)**2) ficam nos
+    # arrays, mas não aparecem no texto
+    limite = tol * np.max(np.abs(residuos)) if len(residuos) else 0
+    termos = []
+    for r, p_, m in zip(residuos, polos, multiplicidades):
+        if abs(r) <= limite:
+            continue
+        fator = _formatar_fator(p_, var)
+        termos.append(f"{_formatar_numero(r)}/{fator}" + (f"**{m}" if m > 1 else ""))
+    decomposicao = " + ".join(termos).replace("+ -", "- ") if termos else "0"
+
+    parte_polinomial = _formatar_polinomio(direto, var) if len(direto) and np.any(direto != 0) else None
+    if parte_polinomial is not None and termos:
+        resultado_completo = f"{parte_polinomial} + {decomposicao}".replace("+ -", "- ")
+    else:
+        resultado_completo = parte_polinomial or decomposicao
+
+    # Denominador fatorado: coeficiente líder vezes (x - p)^m de cada polo distinto
+    fatores = []
+    for i, (p_, m) in enumerate(zip(polos, multiplicidades)):
+        if i == len(polos) - 1 or multiplicidades[i + 1] == 1:
+            fatores.append(_formatar_fator(p_, var) + (f"**{m}" if m > 1 else ""))
+    lider = "" if den_simp[0] == 1 else f"{_formatar_numero(den_simp[0])}*"
+    denominador_fatorado = lider + "*".join(fatores) if fatores else _formatar_numero(den_simp[0])
+
+    return {
+        'original': original_str,
+        'original_str': original_str,
+        'simplificada': simplificada_str,
+        'simplificada_str': simplificada_str,
+        'denominador_fatorado': denominador_fatorado,
+        'grau_numerador': grau_num,
+        'grau_denominador': grau_den,
+        'precisou_divisao': grau_num >= grau_den and grau_den >= 0,
+        'parte_polinomial': parte_polinomial,
+        'decomposicao': decomposicao,
+        'resultado_completo': resultado_completo,
+        'houve_simplificacao': houve_simplificacao,
+        'residuos': residuos,
+        'polos': polos,
+        'multiplicidades': multiplicidades,
+        'coef_polinomial': direto,
+        'num_simplificado': num_simp,
+        'den_simplificado': den_simp,
+        'metodo': 'numerico',
+    }
+
+def decomposicao_fracao_parcial(expressao=None, numerador=None, denominador=None, variavel='x',
+                                racional=False, tol=1e-4):
     """
     Decompõe uma fração racional em frações parciais.
+
+    Por padrão usa o caminho numérico (decomposicao_numerica, por resíduos),
+    que não chama cancel/div/apart. O caminho simbólico (sympy) é usado
+    quando racional=True ou quando os coeficientes não são numéricos.
     
     Parâmetros:
     -----------
     expressao : str, opcional
         Expressão completa como string (ex: "(2*x + 3)/(x**2 - 1)")
-    numerador : str, opcional
-        Numerador da fração como string
-    denominador : str, opcional
-        Denominador da fração como string
+    numerador : str ou array_like, opcional
+        Numerador da fração como string ou lista de coeficientes
+        (potências decrescentes da variável)
+    denominador : str ou array_like, opcional
+        Denominador da fração como string ou lista de coeficientes
     variavel : str, padrão 'x'
         Variável da expressão
     racional : bool, padrão False
-        Se True, converte decimais para frações racionais
+        Se True, converte decimais para frações racionais e usa o caminho
+        simbólico (resultado exato)
+    tol : float, padrão 1e-4
+        Tolerância relativa do caminho numérico para polos repetidos e
+        cancelamentos
     
     Retorna:
     --------
@@ -60,16 +337,35 @@ def decomposicao_fracao_parcial(expressao=None, numerador=None, denominador=None
         - 'parte_polinomial': parte polinomial (se grau num >= grau den)
         - 'decomposicao': decomposição em frações parciais
         - 'resultado_completo': resultado final completo
+        - 'metodo': 'numerico' ou 'simbolico'
+        No caminho numérico (o padrão) as expressões vêm como texto (str),
+        não como expressões do sympy (use racional=True ou sp.sympify no
+        texto para obtê-las), e há também as chaves 'residuos', 'polos',
+        'multiplicidades', 'coef_polinomial', 'num_simplificado' e
+        'den_simplificado'
     
     Exemplos:
     ---------
     >>> resultado = decomposicao_fracao_parcial("(2*x + 3)/(x**2 - 1)")
     >>> resultado = decomposicao_fracao_parcial(numerador="x + 1", denominador="x**2 - 1")
     >>> resultado = decomposicao_fracao_parcial("(x**2)/(x**2 - 0.9*x + 0.9)")
+    >>> resultado = decomposicao_fracao_parcial(numerador=[1, 0, 0], denominador=[1, -0.9, 0.9])
     """
     
+    # Caminho numérico rápido
+    if not racional:
+        coeficientes = _coeficientes_numericos(expressao, numerador, denominador, variavel)
+        if coeficientes is not None:
+            return decomposicao_numerica(*coeficientes, variavel=variavel, tol=tol)
+
     # Define a variável simbólica
-    var = symbols(variavel)
+    var = sp.symbols(variavel)
+
+    # Listas de coeficientes viram expressões (com frações exatas se racional)
+    if numerador is not None and not isinstance(numerador, str):
+        numerador = str(_coeficientes_para_expr(numerador, var, racional))
+    if denominador is not None and not isinstance(denominador, str):
+        denominador = str(_coeficientes_para_expr(denominador, var, racional))
     
     # Parse da entrada
     try:
@@ -82,9 +378,9 @@ def decomposicao_fracao_parcial(expressao=None, numerador=None, denominador=None
                 for decimal in decimais:
                     frac = Fraction(decimal).limit_denominator()
                     expressao_proc = expressao_proc.replace(decimal, f"({frac.numerator}/{frac.denominator})")
-                expr = parse_expr(expressao_proc, local_dict={variavel: var})
+                expr = sympy_parser.parse_expr(expressao_proc, local_dict={variavel: var})
             else:
-                expr = parse_expr(expressao, local_dict={variavel: var})
+                expr = sympy_parser.parse_expr(expressao, local_dict={variavel: var})
             numer, denom = expr.as_numer_denom()
         elif numerador is not None and denominador is not None:
             if racional:
@@ -98,11 +394,11 @@ def decomposicao_fracao_parcial(expressao=None, numerador=None, denominador=None
                         frac = Fraction(decimal).limit_denominator()
                         num_proc = num_proc.replace(decimal, f"({frac.numerator}/{frac.denominator})")
                         den_proc = den_proc.replace(decimal, f"({frac.numerator}/{frac.denominator})")
-                numer = parse_expr(num_proc, local_dict={variavel: var})
-                denom = parse_expr(den_proc, local_dict={variavel: var})
+                numer = sympy_parser.parse_expr(num_proc, local_dict={variavel: var})
+                denom = sympy_parser.parse_expr(den_proc, local_dict={variavel: var})
             else:
-                numer = parse_expr(numerador, local_dict={variavel: var})
-                denom = parse_expr(denominador, local_dict={variavel: var})
+                numer = sympy_parser.parse_expr(numerador, local_dict={variavel: var})
+                denom = sympy_parser.parse_expr(denominador, local_dict={variavel: var})
             expr = numer / denom
         else:
             raise ValueError("Forneça 'expressao' ou 'numerador' e 'denominador'")
@@ -115,19 +411,19 @@ def decomposicao_fracao_parcial(expressao=None, numerador=None, denominador=None
     
     # Converte para polinômios para análise
     try:
-        poly_num = Poly(numer, var)
-        poly_den = Poly(denom, var)
+        poly_num = sp.Poly(numer, var)
+        poly_den = sp.Poly(denom, var)
     except Exception as e:
         return {"erro": f"Erro ao processar como polinômio: {e}"}
     
     # Cancela fatores comuns (simplificação)
-    expr_simplificada = cancel(expr)
+    expr_simplificada = sp.cancel(expr)
     numer_simp, denom_simp = expr_simplificada.as_numer_denom()
     
     # Verifica os graus após simplificação
     try:
-        grau_num = degree(numer_simp, var)
-        grau_den = degree(denom_simp, var)
+        grau_num = sp.degree(numer_simp, var)
+        grau_den = sp.degree(denom_simp, var)
     except Exception:
         # Se não conseguir determinar o grau, assume 0
         grau_num = 0 if numer_simp.is_number else -1
@@ -139,19 +435,19 @@ def decomposicao_fracao_parcial(expressao=None, numerador=None, denominador=None
     if grau_den is None:
         grau_den = 0
     
-    parte_polinomial = S.Zero
+    parte_polinomial = sp.S.Zero
     numer_para_decompor = numer_simp
     denom_para_decompor = denom_simp
     
     # Se grau do numerador >= grau do denominador, faz divisão polinomial
     if grau_num >= grau_den and grau_den >= 0:
         try:
-            quociente, resto = div(numer_simp, denom_simp, var)
+            quociente, resto = sp.div(numer_simp, denom_simp, var)
             parte_polinomial = quociente
             numer_para_decompor = resto
         except Exception as e:
             # Se falhar, tenta sem divisão
-            parte_polinomial = S.Zero
+            parte_polinomial = sp.S.Zero
             numer_para_decompor = numer_simp
     
     # Decomposição em frações parciais
@@ -159,28 +455,28 @@ def decomposicao_fracao_parcial(expressao=None, numerador=None, denominador=None
         fracao_para_decompor = numer_para_decompor / denom_para_decompor
         try:
             # Usa full=True para decomposição completa
-            decomposicao = apart(fracao_para_decompor, var, full=True)
+            decomposicao = sp.apart(fracao_para_decompor, var, full=True)
         except Exception as e:
             # Se apart falhar, tenta simplificar
             try:
-                decomposicao = simplify(fracao_para_decompor)
+                decomposicao = sp.simplify(fracao_para_decompor)
             except:
                 decomposicao = fracao_para_decompor
     else:
-        decomposicao = S.Zero
+        decomposicao = sp.S.Zero
     
     # Extrai as frações individuais
     fracoes_individuais = extrair_fracoes(decomposicao, var)
     
     # Resultado completo
-    if parte_polinomial != S.Zero:
-        resultado_completo = simplify(parte_polinomial + decomposicao)
+    if parte_polinomial != sp.S.Zero:
+        resultado_completo = sp.simplify(parte_polinomial + decomposicao)
     else:
         resultado_completo = decomposicao
     
     # Fatora o denominador para mostrar informações úteis
     try:
-        denom_fatorado = factor(denom_simp)
+        denom_fatorado = sp.factor(denom_simp)
     except:
         denom_fatorado = denom_simp
     
@@ -194,10 +490,11 @@ def decomposicao_fracao_parcial(expressao=None, numerador=None, denominador=None
         'grau_numerador': grau_num,
         'grau_denominador': grau_den,
         'precisou_divisao': grau_num >= grau_den and grau_den >= 0,
-        'parte_polinomial': parte_polinomial if parte_polinomial != S.Zero else None,
+        'parte_polinomial': parte_polinomial if parte_polinomial != sp.S.Zero else None,
         'decomposicao': decomposicao,
         'resultado_completo': resultado_completo,
-        'houve_simplificacao': expr != expr_simplificada
+        'houve_simplificacao': expr != expr_simplificada,
+        'metodo': 'simbolico',
     }
     
     return resultado
@@ -269,11 +566,10 @@ def exibir_resultado(resultado):
 #     resultado4 = decomposicao_fracao_parcial("(x**2)/(x**2 - 0.9*x + 0.9)", racional=True)
 #     exibir_resultado(resultado4)
 
-from sympy import apart, symbols
-
-# Exemplo
-x = symbols('x')
-expressao = (8*x - 19) / (x**2 -5*x + 6)  #(colcoar o denominador comouma expressão inteira, sem multiplicação de polinomios)
-# expressao = (x + 1) / (x**2 - 1)
-resultado = apart(expressao, x)
-print(resultado)
\ No newline at end of file
+if __name__ == "__main__":
+    # Exemplo
+    x = sp.symbols('x')
+    expressao = (8*x - 19) / (x**2 -5*x + 6)  #(colcoar o denominador comouma expressão inteira, sem multiplicação de polinomios)
+    # expressao = (x + 1) / (x**2 - 1)
+    resultado = sp.apart(expressao, x)
+    print(resultado)
@@ -1,22 +1,5 @@
-# Subplots
-fig, axs = plt.subplots(2, 1, figsize=(6, 4), sharex=True)
-t=np.arange()
-axs[0].stem(t, x_impulso, linefmt='red', markerfmt='ro', basefmt='k')
-axs[0].set_title('Impulso original')
-axs[0].grid(True)
-
-axs[1].stem(t, x_atrasado, linefmt='blue', markerfmt='bo', basefmt='k')
-axs[1].set_title(f'Impulso atrasado de {k} unidades')
-axs[1].grid(True)
-
-plt.xlabel('Tempo (n)')
-plt.tight_layout()
-plt.show()
-
-# ======================================================
-
 """
-stem_plot_guide.py
+subplot.py
 
 Guia de gráficos de sinais discretos usando matplotlib.stem
 Inclui exemplos de:
@@ -27,8 +10,8 @@ Inclui exemplos de:
  - eixos, títulos e grids
 
 Como usar:
- - rodar diretamente: `python stem_plot_guide.py`
- - importar funções: `from stem_plot_guide import example_stem_basic`
+ - rodar diretamente (na raiz do repositório): `python -m P1.subplot`
+ - importar funções: `from P1.subplot import example_stem_basic`
 
 Requisitos:
  - matplotlib
@@ -36,7 +19,9 @@ Requisitos:
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+from .importacao_tardia import modulo_tardio
+
+plt = modulo_tardio('matplotlib.pyplot')
 
 def example_stem_basic():
     """Exemplo básico de stem"""
@@ -88,6 +73,12 @@ def example_stem_subplots():
     plt.show()
 
 
+if __name__ == "__main__":
+    example_stem_basic()
+    example_stem_multiple()
+    example_stem_subplots()
+
+
 
 
 
@@ -0,0 +1,249 @@
+import numpy as np
+from .polos_zeros import agrupar_raizes, raizes_em_lote
+from .solve_eq_parciais import _residuos
+
+def forma_fechada(num, den, tol=1e-4):
+    """
+    Forma fechada de h[n] = Z^-1{H(z)} a partir dos resíduos.
+
+    H(z) = num/den em potências de z^-1 é reescrita em potências positivas
+    (num e den completados com zeros à direita até o mesmo tamanho L + 1,
+    ou seja, multiplicados por z^L) e decomposta por resíduos com os polos
+    repetidos agrupados por distância relativa (polos_zeros.agrupar_raizes,
+    com raio que cresce com a multiplicidade). Cada termo r / (z - p)^m
+    vira r · C(n - 1, m - 1) · p^(n - m) · u[n - m] e a constante vira um
+    impulso em n = 0 (ver forma_fechada_de_decomposicao).
+
+    Parâmetros:
+    -----------
+    num : array_like
+        Coeficientes do numerador (potências de z^-1)
+    den : array_like
+        Coeficientes do denominador (potências de z^-1)
+    tol : float
+        Menor distância relativa para considerar dois polos repetidos
+        (padrão: 1e-4)
+
+    Retorna:
+    --------
+    forma : dict
+        - 'residuos', 'polos', 'multiplicidades': um elemento por termo
+        - 'atrasos': atraso de cada termo (igual à multiplicidade)
+        - 'indices_impulsos', 'impulsos': posições e valores dos termos diretos
+        - 'real': True se num e den são reais (h[n] é real)
+    """
+    num = np.atleast_1d(np.asarray(num))
+    den = np.atleast_1d(np.asarray(den))
+    if den[0] == 0:
+        raise ValueError("O primeiro coeficiente do denominador deve ser não nulo.")
+
+    tamanho = max(len(num), len(den))
+    num_z = np.concatenate([num, np.zeros(tamanho - len(num))])
+    den_z = np.concatenate([den, np.zeros(tamanho - len(den))])
+    residuos, polos, direto, multiplicidades = _residuos(num_z, den_z, np.roots(den_z), tol)
+
+    forma = forma_fechada_de_decomposicao({
+        'residuos': residuos,
+        'polos': polos,
+        'multiplicidades': multiplicidades,
+        'coef_polinomial': direto,
+    })
+    forma['real'] = bool(np.isrealobj(num) and np.isrealobj(den))
+    return forma
+
+
+def forma_fechada_de_decomposicao(resultado):
+    """
+    Forma fechada a partir de uma decomposição em potências positivas de z
+    (resultado de decomposicao_numerica / decomposicao_fracao_parcial com
+    variavel='z'), em que cada termo é r / (z - p)^m.
+
+    r / (z - p)^m = r z^-m / (1 - p z^-1)^m, então o termo vira
+        r · C(n - 1, m - 1) · p^(n - m) · u[n - m]
+    e a parte polinomial Σ c_k z^k vira impulsos c_k δ[n + k].
+
+    Parâmetros:
+    -----------
+    resultado : dict
+        Dicionário do caminho numérico, com 'residuos', 'polos',
+        'multiplicidades' e 'coef_polinomial'
+
+    Retorna:
+    --------
+    forma : dict
+        No mesmo formato de forma_fechada
+    """
+    multiplicidades = np.asarray(resultado['multiplicidades'], dtype=int)
+    coef = np.asarray(resultado['coef_polinomial'])
+    # c_k z^k, com k de len(coef)-1 até 0, fica em n = -k
+    indices = -np.arange(len(coef) - 1, -1, -1)
+    residuos = np.asarray(resultado['residuos'])
+    polos = np.asarray(resultado['polos'])
+    return {
+        'residuos': residuos,
+        'polos': polos,
+        'multiplicidades': multiplicidades,
+        'atrasos': multiplicidades.copy(),
+        'indices_impulsos': indices,
+        'impulsos': coef,
+        'real': bool(np.allclose(np.sort_complex(polos), np.sort_complex(np.conj(polos)))
+                     and np.all(np.isreal(coef))),
+    }
+
+
+def _binomial(n, k):
+    """C(n + k, k) = Π_{j=1..k} (n + j)/j em ponto flutuante, vetorizado em n."""
+    resultado = np.ones(np.shape(n))
+    for j in range(1, k + 1):
+        resultado *= (n + j) / j
+    return resultado
+
+
+def avaliar_forma_fechada(forma, n):
+    """
+    Avalia h[n] da forma fechada em índices arbitrários, sem simular as
+    amostras anteriores: custa O(len(n) · número de termos), e n = 10**9
+    custa o mesmo que n = 10.
+
+    Parâmetros:
+    -----------
+    forma : dict
+        Resultado de forma_fechada ou forma_fechada_de_decomposicao
+    n : int ou array_like de int
+        Índices (qualquer formato; podem ser esparsos, fora de ordem ou negativos)
+
+    Retorna:
+    --------
+    h : ndarray
+        h[n] com o mesmo formato de n (real se forma['real'])
+    """
+    n = np.asarray(n)
+    h = np.zeros(n.shape, dtype=complex)
+
+    for r, p, m, d in zip(forma['residuos'], forma['polos'], forma['multiplicidades'], forma['atrasos']):
+        k = n - d
+        causal = k >= 0
+        if not np.any(causal):
+            continue
+        kc = k[causal]
+        # C(k + m - 1, m - 1) p^k; p^k com expoente float evita estouro de inteiro
+        termo = r * _binomial(kc.astype(float), m - 1) * np.power(complex(p), kc.astype(float))
+        h[causal] += termo
+
+    for indice, valor in zip(forma['indices_impulsos'], forma['impulsos']):
+        h[n == indice] += valor
+
+    return h.real if forma['real'] else h
+
+
+def resposta_impulso_fechada(num, den, n, tol=1e-4):
+    """
+    h[n] de H(z) = num/den (potências de z^-1) nos índices n, pela forma fechada.
+
+    Equivale a lfilter(num, den, impulso)[n], mas sem calcular as amostras
+    intermediárias.
+    """
+    return avaliar_forma_fechada(forma_fechada(num, den, tol), n)
+
+
+def resposta_impulso_contorno(num, den, n_amostras=None, tol=1e-10):
+    """
+    Resposta ao impulso h[n] de H(z) por amostragem num círculo e IFFT,
+    sem decomposição em frações parciais (serve para sistemas de ordem alta).
+
+    Em z = r e^(jω_k), ω_k = 2πk/N, H vale Σ h[n] r^-n e^(-jω_k n); então
+    ifft(fft(b_i r^-i) / fft(a_i r^-i)) devolve h[n] r^-n somado com as
+    cópias h[n + lN] r^-(n+lN) (aliasing) e basta multiplicar por r^n.
+
+    Escolhas automáticas, a partir de ρ = maior |polo| (polos_zeros):
+    - n_amostras: o menor L com L^(m-1) ρ^L ≈ tol (m = multiplicidade do
+      polo dominante), isto é, a cauda de h abaixo de tol;
+    - N: potência de 2 >= 2·L;
+    - r = ρ · (tol / N^(m-1))^(-1/N), de forma que o fator de aliasing
+      (ρ/r)^N · N^(m-1) = tol.
+
+    Limite de erro: se |h[n]| <= K (n+1)^(m-1) ρ^n, então para n < L
+        |erro[n]| <= K 2^(m-1) ρ^n · tol/(1 - tol)  +  E_arr · r^n
+    O primeiro termo é o aliasing. O segundo é o arredondamento ao avaliar
+    B/A no círculo, amplificado por r^n:
+        E_arr ≈ ε · max_k (Σ|b_i| r^-i + |H_k| Σ|a_i| r^-i) / |A_k|
+    que cresce quando há polos muito perto do círculo de raio r (filtros de
+    ordem alta com polos agrupados, em forma direta, onde o próprio lfilter
+    também perde precisão). Os dois fatores vêm em info.
+
+    Parâmetros:
+    -----------
+    num : array_like
+        Coeficientes do numerador (potências de z^-1)
+    den : array_like
+        Coeficientes do denominador (potências de z^-1)
+    n_amostras : int ou None
+        Número de amostras de h. Obrigatório se o sistema não for estável (ρ >= 1)
+    tol : float
+        Tolerância da cauda e do aliasing (padrão: 1e-10)
+
+    Retorna:
+    --------
+    h : ndarray
+        h[0], ..., h[n_amostras-1] (real se num e den são reais)
+    info : dict
+        'raio_polos' (ρ), 'raio' (r), 'N', 'fator_aliasing' ((ρ/r)^N N^(m-1)) e
+        'erro_arredondamento' (E_arr · r^(L-1), o segundo termo do limite)
+    """
+    num = np.atleast_1d(np.asarray(num))
+    den = np.atleast_1d(np.asarray(den))
+    if den[0] == 0:
+        raise ValueError("O primeiro coeficiente do denominador deve ser não nulo.")
+
+    # Zeros no fim de den são polos em z = 0: não mudam ρ
+    den_efetivo = np.trim_zeros(den, 'b')
+    polos = raizes_em_lote([den_efetivo])[0]
+    rho = float(np.max(np.abs(polos))) if len(polos) else 0.0
+
+    # Multiplicidade do polo dominante: agrupados por distância relativa,
+    # com raio que cresce com a multiplicidade (polos repetidos saem
+    # espalhados de ~ε^(1/m))
+    m = 1
+    if rho > 0:
+        distintos, multiplicidades = agrupar_raizes(polos)
+        modulos = np.abs(distintos)
+        dominantes = modulos >= np.max(modulos) * (1 - 1e-3)
+        m = int(np.max(multiplicidades[dominantes]))
+
+    if n_amostras is None:
+        if rho >= 1:
+            raise ValueError("Sistema não estável (maior |polo| >= 1): informe n_amostras.")
+        if rho == 0:
+            n_amostras = len(num)
+        else:
+            n_amostras = int(np.ceil(np.log(tol) / np.log(rho)))
+            if m > 1:
+                # Compensa o fator n^(m-1) dos polos repetidos
+                n_amostras += int(np.ceil((m - 1) * np.log(n_amostras) / -np.log(rho)))
+    n_amostras = max(int(n_amostras), 1)
+
+    N = 2 ** int(np.ceil(np.log2(2 * max(n_amostras, len(num), len(den)))))
+    r = rho * (tol / N ** (m - 1)) ** (-1 / N) if rho > 0 else 1.0
+
+    num_r = num * r ** -np.arange(len(num), dtype=float)
+    den_r = den * r ** -np.arange(len(den), dtype=float)
+    B = np.fft.fft(num_r, N)
+    A = np.fft.fft(den_r, N)
+    soma_b, soma_a = np.sum(np.abs(num_r)), np.sum(np.abs(den_r))
+    H_circulo = B / A
+    g = np.fft.ifft(H_circulo)
+
+    escala = r ** np.arange(n_amostras, dtype=float)
+    h = g[:n_amostras] * escala
+    if np.isrealobj(num) and np.isrealobj(den):
+        h = h.real
+
+    info = {
+        'raio_polos': rho,
+        'raio': r,
+        'N': N,
+        'fator_aliasing': (rho / r) ** N * N ** (m - 1) if rho > 0 else 0.0,
+        'erro_arredondamento': float(np.finfo(float).eps * escala[-1] * np.max(
+            (soma_b + np.abs(H_circulo) * soma_a) / np.abs(A))),
+    }
+    return h, info
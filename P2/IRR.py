@@ -1,10 +1,14 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.signal import butter, cont2discrete, freqz, lfilter
+from P1.importacao_tardia import modulo_tardio
+from P1.resposta_frequencia import RespostaFrequencia, calcular_resposta_frequencia
+from P1.regime_permanente import periodo_amostras, regime_permanente
+
+plt = modulo_tardio('matplotlib.pyplot')
+signal = modulo_tardio('scipy.signal')
 
 def projetar_filtro_iir(N=None, fs=10000, fp=1000, fs_reject=1500, 
                         passband_ripple_db=1, stopband_atten_db=15,
-                        plotar=True, testar=True):
+                        plotar=True, testar=True, pontos_zoom=4096):
     """
     Projeta e testa filtro IIR Butterworth usando invariância ao impulso
     
@@ -33,8 +37,14 @@ def projetar_filtro_iir(N=None, fs=10000, fp=1000, fs_reject=1500,
     testar : bool
         Se True, executa testes com diferentes frequências (padrão: True)
     
+    pontos_zoom : int
+        Pontos usados na validação de cada faixa (passagem [0, ωp] e
+        rejeição [ωs, π]), calculados com a transformada chirp-Z só dentro
+        da faixa (padrão: 4096)
+    
     RETORNA:
-        dict com 'b_z', 'a_z' (coeficientes), 'specs' e 'resultados_testes'
+        dict com 'b_z', 'a_z' (coeficientes), 'resposta' (RespostaFrequencia
+        em [0, π]), 'specs' e 'resultados_testes'
     """
     
     # Calcular período de amostragem
@@ -91,12 +101,12 @@ def projetar_filtro_iir(N=None, fs=10000, fp=1000, fs_reject=1500,
     print("="*70)
     
     # H(s) do filtro analógico Butterworth 
-    b_s, a_s = butter(N_usado, Omega_c, btype='low', analog=True)
+    b_s, a_s = signal.butter(N_usado, Omega_c, btype='low', analog=True)
     
     # Converter para digital H(z) usando invariância ao impulso
     # Usamos Td = 1 (normalizado) conforme slide do professor
     Td = 1  # Período normalizado
-    sysd = cont2discrete((b_s, a_s), Td, method='impulse')
+    sysd = signal.cont2discrete((b_s, a_s), Td, method='impulse')
     b_z = sysd[0].flatten()
     a_z = sysd[1].flatten()
     
@@ -104,25 +114,22 @@ def projetar_filtro_iir(N=None, fs=10000, fp=1000, fs_reject=1500,
     print(f"Coefs b ({len(b_z)}): {b_z}")
     print(f"Coefs a ({len(a_z)}): {a_z}")
     
-    # Calcular resposta em frequência
-    w, h = freqz(b_z, a_z, worN=4096)
-    h_db = 20 * np.log10(np.abs(h) + 1e-10)
-    h_mag = np.abs(h)
+    # Calcular resposta em frequência (faixa [0, π], usada nos gráficos)
+    # (magnitude e dB só são calculados se os gráficos forem gerados)
+    w, h = signal.freqz(b_z, a_z, worN=4096)
+    resposta = RespostaFrequencia(w, h, num=b_z, den=a_z)
     
-    # Separar regiões de passagem e rejeição
-    idx_passband = np.where(w <= wp_digital)[0]
-    idx_stopband = np.where(w >= ws_digital)[0]
+    # Validação com grade densa só nas regiões de passagem e rejeição (zoom chirp-Z)
+    passband = calcular_resposta_frequencia(b_z, a_z, N=pontos_zoom, faixa=(0, wp_digital))
     
     # Verificar ganhos máximos e mínimos
-    if len(idx_passband) > 0:
-        passband_max = np.max(h_db[idx_passband])
-        passband_min = np.min(h_db[idx_passband])
-    else:
-        passband_max = passband_min = 0
-    
-    if len(idx_stopband) > 0:
-        stopband_max = np.max(h_db[idx_stopband])
+    passband_max = np.max(passband.mag_dB)
+    passband_min = np.min(passband.mag_dB)
+    if ws_digital < np.pi:
+        stopband = calcular_resposta_frequencia(b_z, a_z, N=pontos_zoom, faixa=(ws_digital, np.pi))
+        stopband_max = np.max(stopband.mag_dB)
     else:
+        # Rejeição em fs/2 ou acima: não há faixa de rejeição em [0, π]
         stopband_max = -100
     
     # Checar se atende as especificações
@@ -138,55 +145,25 @@ def projetar_filtro_iir(N=None, fs=10000, fp=1000, fs_reject=1500,
     print(f"  Spec: ≤-{stopband_atten_db}dB | {'✓ ATENDE' if stopband_ok else '✗ NÃO ATENDE'}")
     print("="*70)
     
+    specs = {
+        'N': N_usado,
+        'N_calculado': N_calculado,
+        'Omega_c': Omega_c,
+        'fs': fs,
+        'fp': fp,
+        'fs_reject': fs_reject,
+        'passband_ripple_db': passband_ripple_db,
+        'stopband_atten_db': stopband_atten_db,
+        'delta_p': delta_p,
+        'delta_s': delta_s,
+        'passband_ok': passband_ok,
+        'stopband_ok': stopband_ok
+    }
+    
     # Plotar resposta em frequência
     if plotar:
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
-        
-        specs_text = f"N={N_usado}, fs={fs}Hz, fp={fp}Hz, fs_rej={fs_reject}Hz, Ripple≤{passband_ripple_db}dB, Atten≥{stopband_atten_db}dB"
-        
-        # Gráfico 1: Magnitude em dB
-        ax1.plot(w, h_db, 'b-', linewidth=2.5, label='Resposta do filtro')
-        ax1.axvline(wp_digital, color='g', linestyle='--', linewidth=2, 
-                   label=f'fp={fp}Hz ({wp_digital/np.pi:.2f}π)')
-        ax1.axvline(ws_digital, color='orange', linestyle='--', linewidth=2, 
-                   label=f'fs={fs_reject}Hz ({ws_digital/np.pi:.2f}π)')
-        ax1.axhline(0, color='green', linestyle=':', alpha=0.7, linewidth=1.5)
-        ax1.axhline(-passband_ripple_db, color='green', linestyle=':', alpha=0.7, 
-                   linewidth=1.5, label=f'Passagem: 0 a -{passband_ripple_db}dB')
-        ax1.axhline(-stopband_atten_db, color='red', linestyle=':', alpha=0.7, 
-                   linewidth=1.5, label=f'Rejeição: ≤-{stopband_atten_db}dB')
-        
-        ax1.set_xlabel('Frequência (rad/amostra)', fontsize=12, fontweight='bold')
-        ax1.set_ylabel('Magnitude (dB)', fontsize=12, fontweight='bold')
-        ax1.set_title(f'Magnitude Logarítmica - {specs_text}', fontsize=13, fontweight='bold')
-        ax1.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
-        ax1.legend(fontsize=10, loc='upper right')
-        ax1.set_xlim([0, np.pi])
-        ax1.set_ylim([-100, 5])
-        
-        # Gráfico 2: Magnitude linear
-        threshold_pass = 10**(-passband_ripple_db/20)
-        threshold_stop = 10**(-stopband_atten_db/20)
-        
-        ax2.plot(w, h_mag, 'b-', linewidth=2.5, label='Resposta do filtro')
-        ax2.axvline(wp_digital, color='g', linestyle='--', linewidth=2, 
-                   label=f'fp={fp}Hz')
-        ax2.axvline(ws_digital, color='orange', linestyle='--', linewidth=2, 
-                   label=f'fs={fs_reject}Hz')
-        ax2.axhline(1.0, color='green', linestyle=':', alpha=0.7, linewidth=1.5)
-        ax2.axhline(threshold_pass, color='green', linestyle=':', alpha=0.7, 
-                   linewidth=1.5, label=f'Limite passagem: {threshold_pass:.5f}')
-        ax2.axhline(threshold_stop, color='red', linestyle=':', alpha=0.7, 
-                   linewidth=1.5, label=f'Limite rejeição: {threshold_stop:.5f}')
-        
-        ax2.set_xlabel('Frequência (rad/amostra)', fontsize=12, fontweight='bold')
-        ax2.set_ylabel('Amplitude', fontsize=12, fontweight='bold')
-        ax2.set_title(f'Magnitude Linear - {specs_text}', fontsize=13, fontweight='bold')
-        ax2.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
-        ax2.legend(fontsize=10, loc='upper right')
-        ax2.set_xlim([0, np.pi])
-        ax2.set_ylim([0, 1.2])
-        
+        desenhar_resposta_iir([ax1, ax2], resposta, specs)
         plt.tight_layout()
         plt.show()
     
@@ -217,13 +194,21 @@ def projetar_filtro_iir(N=None, fs=10000, fp=1000, fs_reject=1500,
             t = np.arange(0, duracao, Ts)
             x = np.sin(2 * np.pi * freq * t)
             
-            # Aplicar o filtro
-            y = lfilter(b_z, a_z, x)
+            # Saída real do filtro (com o transitório), para comparação
+            y = signal.lfilter(b_z, a_z, x)
+            
+            # Saída em regime permanente direto de um período da senoide
+            # (freq/fs = m/P), sem simular e descartar o transitório.
+            # y_regime só repete esse período: é apenas o regime permanente,
+            # não a saída do filtro a partir de t = 0
+            P = periodo_amostras(freq, fs)
+            x_periodo = np.sin(2 * np.pi * freq * np.arange(P) / fs)
+            y_periodo = regime_permanente(b_z, a_z, x_periodo)
+            y_regime = np.resize(y_periodo, len(t))
             
-            # Calcular atenuação após regime transitório
-            n_stable = len(y) // 2
-            x_rms = np.sqrt(np.mean(x[n_stable:]**2))
-            y_rms = np.sqrt(np.mean(y[n_stable:]**2))
+            # Atenuação pelos valores RMS de um período
+            x_rms = np.sqrt(np.mean(x_periodo**2))
+            y_rms = np.sqrt(np.mean(y_periodo**2))
             
             if x_rms > 1e-10:
                 atenuacao_db = 20 * np.log10(y_rms / x_rms)
@@ -250,6 +235,7 @@ def projetar_filtro_iir(N=None, fs=10000, fp=1000, fs_reject=1500,
                 't': t,
                 'x': x,
                 'y': y,
+                'y_regime': y_regime,
                 'atten_db': atenuacao_db,
                 'esperado': esperado,
                 'ok': ok
@@ -259,31 +245,8 @@ def projetar_filtro_iir(N=None, fs=10000, fp=1000, fs_reject=1500,
         
         # Plotar alguns casos
         if plotar and len(resultados_testes) >= 4:
-            indices_plot = [1, 3, 5, 7]
             fig, axes = plt.subplots(2, 2, figsize=(16, 10))
-            axes = axes.flatten()
-            
-            for idx, caso_idx in enumerate(indices_plot):
-                if caso_idx < len(resultados_testes):
-                    res = resultados_testes[caso_idx]
-                    ax = axes[idx]
-                    
-                    ax.plot(res['t'], res['x'], 'b-', alpha=0.6, 
-                           label=f"Entrada {res['freq']:.0f} Hz", linewidth=2)
-                    ax.plot(res['t'], res['y'], 'r-', alpha=0.9, 
-                           label=f"Saída ({res['atten_db']:.1f} dB)", linewidth=2.5)
-                    
-                    status_text = '✓ OK' if res['ok'] else '✗ FALHOU'
-                    ax.set_title(f"{res['freq']:.0f} Hz ({res['esperado']}) - {status_text}", 
-                               fontsize=12, fontweight='bold')
-                    ax.set_xlabel('Tempo (s)', fontsize=10)
-                    ax.set_ylabel('Amplitude', fontsize=10)
-                    ax.legend(loc='upper right', fontsize=9)
-                    ax.grid(True, alpha=0.3)
-                    ax.set_xlim([0, 0.01])
-            
-            plt.suptitle(f'Testes do Filtro - {specs_text}', 
-                        fontsize=14, fontweight='bold', y=0.995)
+            desenhar_testes_iir(axes.flatten(), resultados_testes, specs)
             plt.tight_layout()
             plt.show()
     
@@ -291,24 +254,118 @@ def projetar_filtro_iir(N=None, fs=10000, fp=1000, fs_reject=1500,
     return {
         'b_z': b_z,
         'a_z': a_z,
-        'specs': {
-            'N': N_usado,
-            'N_calculado': N_calculado,
-            'Omega_c': Omega_c,
-            'fs': fs,
-            'fp': fp,
-            'fs_reject': fs_reject,
-            'passband_ripple_db': passband_ripple_db,
-            'stopband_atten_db': stopband_atten_db,
-            'delta_p': delta_p,
-            'delta_s': delta_s,
-            'passband_ok': passband_ok,
-            'stopband_ok': stopband_ok
-        },
+        'resposta': resposta,
+        'specs': specs,
         'resultados_testes': resultados_testes
     }
 
 
+def _texto_specs(specs):
+    """Resumo das especificações usado nos títulos dos gráficos."""
+    return (f"N={specs['N']}, fs={specs['fs']}Hz, fp={specs['fp']}Hz, fs_rej={specs['fs_reject']}Hz, "
+            f"Ripple≤{specs['passband_ripple_db']}dB, Atten≥{specs['stopband_atten_db']}dB")
+
+
+def desenhar_resposta_iir(eixos, resposta, specs):
+    """
+    Desenha magnitude em dB (eixos[0]) e linear (eixos[1]) do filtro com as
+    faixas e limites da especificação.
+
+    resposta : RespostaFrequencia em [0, π] ('resposta' do retorno de projetar_filtro_iir)
+    specs : dict 'specs' do retorno de projetar_filtro_iir
+    """
+    ax1, ax2 = eixos[0], eixos[1]
+    fs, fp, fs_reject = specs['fs'], specs['fp'], specs['fs_reject']
+    passband_ripple_db = specs['passband_ripple_db']
+    stopband_atten_db = specs['stopband_atten_db']
+    wp_digital = 2 * np.pi * fp / fs
+    ws_digital = 2 * np.pi * fs_reject / fs
+    specs_text = _texto_specs(specs)
+
+    # Gráfico 1: Magnitude em dB
+    ax1.plot(resposta.w, resposta.mag_dB, 'b-', linewidth=2.5, label='Resposta do filtro')
+    ax1.axvline(wp_digital, color='g', linestyle='--', linewidth=2, 
+               label=f'fp={fp}Hz ({wp_digital/np.pi:.2f}π)')
+    ax1.axvline(ws_digital, color='orange', linestyle='--', linewidth=2, 
+               label=f'fs={fs_reject}Hz ({ws_digital/np.pi:.2f}π)')
+    ax1.axhline(0, color='green', linestyle=':', alpha=0.7, linewidth=1.5)
+    ax1.axhline(-passband_ripple_db, color='green', linestyle=':', alpha=0.7, 
+               linewidth=1.5, label=f'Passagem: 0 a -{passband_ripple_db}dB')
+    ax1.axhline(-stopband_atten_db, color='red', linestyle=':', alpha=0.7, 
+               linewidth=1.5, label=f'Rejeição: ≤-{stopband_atten_db}dB')
+
+    ax1.set_xlabel('Frequência (rad/amostra)', fontsize=12, fontweight='bold')
+    ax1.set_ylabel('Magnitude (dB)', fontsize=12, fontweight='bold')
+    ax1.set_title(f'Magnitude Logarítmica - {specs_text}', fontsize=13, fontweight='bold')
+    ax1.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
+    ax1.legend(fontsize=10, loc='upper right')
+    ax1.set_xlim([0, np.pi])
+    ax1.set_ylim([-100, 5])
+
+    # Gráfico 2: Magnitude linear
+    threshold_pass = 10**(-passband_ripple_db/20)
+    threshold_stop = 10**(-stopband_atten_db/20)
+
+    ax2.plot(resposta.w, resposta.mag, 'b-', linewidth=2.5, label='Resposta do filtro')
+    ax2.axvline(wp_digital, color='g', linestyle='--', linewidth=2, 
+               label=f'fp={fp}Hz')
+    ax2.axvline(ws_digital, color='orange', linestyle='--', linewidth=2, 
+               label=f'fs={fs_reject}Hz')
+    ax2.axhline(1.0, color='green', linestyle=':', alpha=0.7, linewidth=1.5)
+    ax2.axhline(threshold_pass, color='green', linestyle=':', alpha=0.7, 
+               linewidth=1.5, label=f'Limite passagem: {threshold_pass:.5f}')
+    ax2.axhline(threshold_stop, color='red', linestyle=':', alpha=0.7, 
+               linewidth=1.5, label=f'Limite rejeição: {threshold_stop:.5f}')
+
+    ax2.set_xlabel('Frequência (rad/amostra)', fontsize=12, fontweight='bold')
+    ax2.set_ylabel('Amplitude', fontsize=12, fontweight='bold')
+    ax2.set_title(f'Magnitude Linear - {specs_text}', fontsize=13, fontweight='bold')
+    ax2.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
+    ax2.legend(fontsize=10, loc='upper right')
+    ax2.set_xlim([0, np.pi])
+    ax2.set_ylim([0, 1.2])
+
+
+def desenhar_testes_iir(eixos, resultados_testes, specs):
+    """
+    Desenha entrada, saída (lfilter) e regime permanente de quatro testes
+    (índices 1, 3, 5 e 7) em quatro eixos.
+    """
+    indices_plot = [1, 3, 5, 7]
+    for idx, caso_idx in enumerate(indices_plot):
+        if caso_idx < len(resultados_testes):
+            res = resultados_testes[caso_idx]
+            ax = eixos[idx]
+            
+            ax.plot(res['t'], res['x'], 'b-', alpha=0.6, 
+                   label=f"Entrada {res['freq']:.0f} Hz", linewidth=2)
+            ax.plot(res['t'], res['y'], 'r-', alpha=0.9, 
+                   label=f"Saída ({res['atten_db']:.1f} dB)", linewidth=2.5)
+            ax.plot(res['t'], res['y_regime'], 'k--', alpha=0.7,
+                   label="Regime permanente", linewidth=1.5)
+            
+            status_text = '✓ OK' if res['ok'] else '✗ FALHOU'
+            ax.set_title(f"{res['freq']:.0f} Hz ({res['esperado']}) - {status_text}", 
+                       fontsize=12, fontweight='bold')
+            ax.set_xlabel('Tempo (s)', fontsize=10)
+            ax.set_ylabel('Amplitude', fontsize=10)
+            ax.legend(loc='upper right', fontsize=9)
+            ax.grid(True, alpha=0.3)
+            ax.set_xlim([0, 0.01])
+
+    eixos[0].figure.suptitle(f'Testes do Filtro - {_texto_specs(specs)}', 
+                             fontsize=14, fontweight='bold', y=0.995)
+
+
+def relatorio_iir(eixos, parametros):
+    """
+    Relatório em arquivo (layout 2x1) para relatorios.renderizar_em_lote.
+    parametros = dict de argumentos de projetar_filtro_iir (ex.: {'N': 6, 'fp': 1000})
+    """
+    resultado = projetar_filtro_iir(**parametros, plotar=False, testar=False)
+    desenhar_resposta_iir(eixos, resultado['resposta'], resultado['specs'])
+
+
 # Executar com os parâmetros do slide 15/32
 if __name__ == "__main__":
     
@@ -0,0 +1,33 @@
+"""
+P2 - Amostragem, recuperação e filtros.
+
+Como em P1, importar o pacote não executa exemplos nem carrega bibliotecas
+pesadas: os submódulos são importados no primeiro acesso. Os exemplos rodam
+a partir da raiz do repositório com:
+    python -m P2.recuperacao
+"""
+import importlib
+
+_SUBMODULOS = (
+    'IRR',
+    'amostragem',
+    'amostragem_com_fourier',
+    'filtros_analogicos',
+    'filtros_com_entrada',
+    'reamostrador',
+    'recuperacao',
+    'tabelas_kernel',
+    'teste_filtros_com_entrada',
+)
+
+__all__ = list(_SUBMODULOS)
+
+
+def __getattr__(nome):
+    if nome in _SUBMODULOS:
+        return importlib.import_module(f'.{nome}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULOS))
@@ -1,50 +1,94 @@
 import numpy as np
-import matplotlib.pyplot as plt
+from P1.importacao_tardia import modulo_tardio
 
-def amostragem(x,fs):
-    #assumindo  que a frequencia de amostragem de x continuo é 0.001s:
-    passo = int((1/fs)/0.001)
-    trem=np.zeros(len(x))
-    for i in range(len(trem)):
-        if i%passo==0:
-            trem[i]=1
+plt = modulo_tardio('matplotlib.pyplot')
 
-    x_amostrado=[0]*len(x)
-    for i in range(len(x)):        
-        x_amostrado[i] = x[i] * trem[i]
-    print(x_amostrado)
+def amostragem(x, fs, dt=0.001, trem_impulsos=False):
+    """
+    Amostra um sinal "contínuo" x, dado numa grade de passo dt, com
+    frequência de amostragem fs.
 
+    Se T/dt (T = 1/fs) é inteiro, as amostras são a view x[..., ::passo]:
+    nenhuma cópia e nenhum laço, mesmo para sinais longos. Se não é inteiro,
+    os instantes nT caem entre pontos da grade e os valores são interpolados
+    linearmente entre os vizinhos.
 
-    # valores_compactos = []
-    # indices_compactos = []
-    # for i in range(len(x_amostrado)):
-    #     if x_amostrado[i] != 0:
-    #         valores_compactos.append(x_amostrado[i])
-    #         indices_compactos.append(i)
-    return x_amostrado
+    Parâmetros:
+    -----------
+    x : array_like
+        Sinal na grade t = 0, dt, 2dt, ... (último eixo; um ndarray não é copiado)
+    fs : float
+        Frequência de amostragem em Hz
+    dt : float
+        Passo da grade de x em segundos (padrão: 0.001)
+    trem_impulsos : bool
+        Se True, devolve o sinal multiplicado pelo trem de impulsos na grade
+        densa (mesmo tamanho de x, zeros fora das amostras), como na
+        representação x(t)·Σδ(t - nT). Com T/dt não inteiro, cada amostra vai
+        para o ponto da grade mais próximo de nT (padrão: False)
+
+    Retorna:
+    --------
+    x_n : ndarray
+        Amostras x(nT) (compacto) ou o trem de impulsos denso
+    t_n : ndarray
+        Instantes nT das amostras, ou a grade densa se trem_impulsos=True
+    """
+    x = np.asarray(x)
+    L = x.shape[-1]
+    T = 1 / fs
+    razao = T / dt
+    passo = int(round(razao))
+
+    if passo >= 1 and abs(razao - passo) <= 1e-9 * razao:
+        x_n = x[..., ::passo]
+        indices = np.arange(0, L, passo)
+        t_n = indices * dt
+    else:
+        t_n = np.arange(int(np.floor((L - 1) / razao)) + 1) * T
+        posicao = t_n / dt
+        base = np.clip(np.floor(posicao).astype(int), 0, max(L - 2, 0))
+        vizinho = np.minimum(base + 1, L - 1)
+        fracao = posicao - base
+        x_n = x[..., base] * (1 - fracao) + x[..., vizinho] * fracao
+        indices = np.minimum(np.round(posicao).astype(int), L - 1)
+
+    if not trem_impulsos:
+        return x_n, t_n
 
-duracao = 1  # 1 segundo
-t = np.arange(0, duracao, 0.001)  # vetor de tempo com 0.001s de resolução
-frequencia_sinal = 5  # Hz
-x = np.sin(2 * np.pi * frequencia_sinal * t)
+    x_amostrado = np.zeros(x.shape, dtype=np.result_type(x_n, float))
+    x_amostrado[..., indices] = x_n
+    return x_amostrado, np.arange(L) * dt
 
-# Amostrando com fs = 20 Hz
-fs = 20
-x_amostrado = amostragem(x, fs)
 
-# Plotando
-plt.figure(figsize=(12, 6))
-plt.plot(t, x, 'b-', label='Sinal Original', alpha=0.7, linewidth=2)
-plt.stem(t, x_amostrado, linefmt='r-', markerfmt='ro', basefmt='k-', label=f'Sinal Amostrado (fs={fs} Hz)')
-plt.xlabel('Tempo (s)')
-plt.ylabel('Amplitude')
-plt.title('Amostragem de Sinal')
-plt.legend()
-plt.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.show()
+if __name__ == "__main__":
+    duracao = 1  # 1 segundo
+    t = np.arange(0, duracao, 0.001)  # vetor de tempo com 0.001s de resolução
+    frequencia_sinal = 5  # Hz
+    x = np.sin(2 * np.pi * frequencia_sinal * t)
 
-print(f"Número de amostras: {sum(1 for v in x_amostrado if v != 0)}")
+    # Amostrando com fs = 20 Hz
+    fs = 20
+    x_n, t_n = amostragem(x, fs)
+
+    # Plotando
+    plt.figure(figsize=(12, 6))
+    plt.plot(t, x, 'b-', label='Sinal Original', alpha=0.7, linewidth=2)
+    plt.stem(t_n, x_n, linefmt='r-', markerfmt='ro', basefmt='k-', label=f'Sinal Amostrado (fs={fs} Hz)')
+    plt.xlabel('Tempo (s)')
+    plt.ylabel('Amplitude')
+    plt.title('Amostragem de Sinal')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    plt.show()
+
+    print(f"Número de amostras: {len(x_n)}")
+
+    # Razão T/dt não inteira (fs = 30 Hz, T = 33.3 ms): amostras interpoladas
+    x_n, t_n = amostragem(x, 30)
+    print(f"fs = 30 Hz: {len(x_n)} amostras, erro máximo da interpolação "
+          f"{np.max(np.abs(x_n - np.sin(2 * np.pi * frequencia_sinal * t_n))):.2e}")
 
 
 
@@ -64,4 +108,4 @@ print(f"Número de amostras: {sum(1 for v in x_amostrado if v != 0)}")
     - x_n_compacto: apenas os valores amostrados
     - indices_amostras: índices das amostras
     - info: dicionário com informações espectrais
-"""
\ No newline at end of file
+"""
@@ -1,52 +1,66 @@
 import numpy as np
-import matplotlib.pyplot as plt
+from P1.graficos_decimados import plotar_decimado, stem_decimado
+from P1.importacao_tardia import modulo_tardio
+from .amostragem import amostragem
 
-def amostragem_completa(x_t, t, fs, plotar=True):
+plt = modulo_tardio('matplotlib.pyplot')
 
+def amostragem_completa(x_t, t, fs, plotar=True, espectros=False):
+    """
+    Processo completo de amostragem com análise no domínio do tempo e frequência.
+    
+    Parâmetros:
+    - x_t: sinal contínuo x(t) (real)
+    - t: vetor de tempo correspondente (passo uniforme)
+    - fs: frequência de amostragem
+    - plotar: se True, gera os gráficos
+    - espectros: se True, inclui os espectros da grade densa em info
+      (calculados de qualquer forma quando plotar=True)
+    
+    Retorna:
+    - x_n: sinal amostrado (vetor esparso com zeros)
+    - x_n_compacto: apenas os valores amostrados (inclusive os que valem zero)
+    - indices_amostras: índices das amostras na grade t
+    - info: dicionário com 'T', 'fs' e 'n_amostras'; com espectros=True,
+      também 'X_f', 'X_n_f' (rfft de x(t) e de x[n], só frequências >= 0)
+      e 'freqs' (rfftfreq)
+    """
     
     T = 1/fs  # Período de amostragem
     dt = t[1] - t[0]  # Resolução temporal
     
     # ===== AMOSTRAGEM =====
-    passo = int(T/dt)
-    trem = np.zeros(len(x_t))
-    for i in range(len(trem)):
-        if i % passo == 0:
-            trem[i] = 1
-    
-    x_n = x_t * trem  # Sinal amostrado (com zeros)
-    
-    # Extrair valores compactos
-    indices_amostras = []
-    x_n_compacto = []
-    for i in range(len(x_n)):
-        if x_n[i] != 0:
-            indices_amostras.append(i)
-            x_n_compacto.append(x_n[i])
-    
-    # ===== TRANSFORMADA DE FOURIER =====
+    # As amostras são identificadas pela posição na grade, não pelo valor:
+    # amostras que valem zero (seno em t = 0) continuam sendo amostras
+    x_n_compacto, t_n = amostragem(x_t, fs, dt)
+    indices_amostras = np.minimum(np.round(t_n / dt).astype(int), len(x_t) - 1)
     
-    # Fourier de x(t) - sinal contínuo
-    N_t = len(x_t)
-    X_f = np.fft.fft(x_t)
-    X_f_mag = np.abs(X_f) / N_t
-    freqs_t = np.fft.fftfreq(N_t, dt)
-    
-    # Fourier de x[n] - sinal amostrado
-    X_n_f = np.fft.fft(x_n)
-    X_n_f_mag = np.abs(X_n_f) / N_t
-    freqs_n = np.fft.fftfreq(N_t, dt)
+    x_n = np.zeros(len(x_t))  # Sinal amostrado (com zeros)
+    x_n[indices_amostras] = x_n_compacto
     
     # Informações
     info = {
         'T': T,
         'fs': fs,
         'n_amostras': len(x_n_compacto),
-        'X_f': X_f,
-        'X_n_f': X_n_f,
-        'freqs': freqs_t
     }
     
+    if plotar or espectros:
+        # ===== TRANSFORMADA DE FOURIER =====
+        # Sinais reais: rfft guarda só as frequências >= 0 (metade da memória
+        # e do tempo da fft completa)
+        
+        # Fourier de x(t) - sinal contínuo
+        N_t = len(x_t)
+        X_f = np.fft.rfft(x_t)
+        freqs = np.fft.rfftfreq(N_t, dt)
+        
+        # Fourier de x[n] - sinal amostrado
+        X_n_f = np.fft.rfft(x_n)
+        
+        if espectros:
+            info.update({'X_f': X_f, 'X_n_f': X_n_f, 'freqs': freqs})
+    
     # ===== PLOTAGEM =====
     if plotar:
         fig = plt.figure(figsize=(16, 10))
@@ -54,8 +68,8 @@ def amostragem_completa(x_t, t, fs, plotar=True):
         # ===== DOMÍNIO DO TEMPO =====
         
         # Subplot 1: x(t) - Sinal Contínuo
-        plt.subplot(2, 2, 1)
-        plt.plot(t, x_t, 'b-', linewidth=2, label='x(t)')
+        ax = plt.subplot(2, 2, 1)
+        plotar_decimado(ax, t, x_t, 'b-', linewidth=2, label='x(t)')
         plt.xlabel('Tempo (s)')
         plt.ylabel('Amplitude')
         plt.title('Sinal Contínuo x(t)')
@@ -63,15 +77,14 @@ def amostragem_completa(x_t, t, fs, plotar=True):
         plt.legend()
         
         # Subplot 2: x[n] - Sinal Amostrado
-        plt.subplot(2, 2, 2)
-        plt.plot(t, x_t, 'b-', alpha=0.3, linewidth=1, label='x(t) original')
-        markerline, stemlines, baseline = plt.stem(t, x_n, 
-                                                     linefmt='r-', 
-                                                     markerfmt='ro', 
-                                                     basefmt='k-',
-                                                     label=f'x[n] (fs={fs} Hz)')
-        markerline.set_alpha(0.7)
-        stemlines.set_alpha(0.7)
+        ax = plt.subplot(2, 2, 2)
+        plotar_decimado(ax, t, x_t, 'b-', alpha=0.3, linewidth=1, label='x(t) original')
+        stem_decimado(ax, t[indices_amostras], x_n_compacto, 
+                      linefmt='r-', 
+                      markerfmt='ro', 
+                      basefmt='k-',
+                      label=f'x[n] (fs={fs} Hz)',
+                      alpha=0.7)
         plt.xlabel('Tempo (s)')
         plt.ylabel('Amplitude')
         plt.title(f'Sinal Amostrado x[n] (T={T:.4f}s, {len(x_n_compacto)} amostras)')
@@ -81,10 +94,11 @@ def amostragem_completa(x_t, t, fs, plotar=True):
         # ===== DOMÍNIO DA FREQUÊNCIA =====
         
         # Subplot 3: Fourier de x(t)
-        plt.subplot(2, 2, 3)
+        ax = plt.subplot(2, 2, 3)
         # Plotar apenas frequências positivas até fs/2
-        mask_pos = (freqs_t >= 0) & (freqs_t <= fs)
-        plt.plot(freqs_t[mask_pos], X_f_mag[mask_pos], 'b-', linewidth=2)
+        X_f_mag = np.abs(X_f) / N_t
+        mask_pos = freqs <= fs
+        plotar_decimado(ax, freqs[mask_pos], X_f_mag[mask_pos], 'b-', linewidth=2)
         plt.xlabel('Frequência (Hz)')
         plt.ylabel('Magnitude')
         plt.title('Transformada de Fourier de x(t)')
@@ -92,10 +106,11 @@ def amostragem_completa(x_t, t, fs, plotar=True):
         plt.xlim([0, fs])
         
         # Subplot 4: Fourier de x[n] - MOSTRANDO REPETIÇÕES
-        plt.subplot(2, 2, 4)
+        ax = plt.subplot(2, 2, 4)
         # Plotar até 2*fs para mostrar as repetições (aliasing)
-        mask_rep = (freqs_n >= 0) & (freqs_n <= 2*fs)
-        plt.plot(freqs_n[mask_rep], X_n_f_mag[mask_rep], 'r-', linewidth=2)
+        X_n_f_mag = np.abs(X_n_f) / N_t
+        mask_rep = freqs <= 2*fs
+        plotar_decimado(ax, freqs[mask_rep], X_n_f_mag[mask_rep], 'r-', linewidth=2)
         
         # Marcar fs
         plt.axvline(x=fs, color='orange', linestyle='--', linewidth=2, 
@@ -105,7 +120,7 @@ def amostragem_completa(x_t, t, fs, plotar=True):
         plt.text(fs*0.15, max(X_n_f_mag[mask_rep])*0.9, 
                 'Espectro\nOriginal', fontsize=10, ha='center',
                 bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
-        if 2*fs <= max(freqs_n):
+        if 2*fs <= max(freqs):
             plt.text(fs*1.15, max(X_n_f_mag[mask_rep])*0.9, 
                     'Repetição\n(Aliasing)', fontsize=10, ha='center',
                     bbox=dict(boxstyle='round', facecolor='salmon', alpha=0.5))
@@ -125,18 +140,19 @@ def amostragem_completa(x_t, t, fs, plotar=True):
 
 # ========== EXEMPLO DE USO ==========
 
-# Criar sinal contínuo x(t)
-duracao = 1  # 1 segundo
-dt = 0.001  # resolução de 1ms
-t = np.arange(0, duracao, dt)
+if __name__ == "__main__":
+    # Criar sinal contínuo x(t)
+    duracao = 1  # 1 segundo
+    dt = 0.001  # resolução de 1ms
+    t = np.arange(0, duracao, dt)
 
-# Sinal com múltiplas frequências
-f1 = 5  # Hz
-f2 = 8  # Hz
-x_t = np.sin(2 * np.pi * f1 * t) + 0.5 * np.sin(2 * np.pi * f2 * t)
+    # Sinal com múltiplas frequências
+    f1 = 5  # Hz
+    f2 = 8  # Hz
+    x_t = np.sin(2 * np.pi * f1 * t) + 0.5 * np.sin(2 * np.pi * f2 * t)
 
-print("\n" + "="*70)
-print("TESTE 1: fs = 30 Hz")
-print("="*70)
-fs1 = 10
-x_n1, x_n_comp1, indices1, info1 = amostragem_completa(x_t, t, fs1)
\ No newline at end of file
+    print("\n" + "="*70)
+    print("TESTE 1: fs = 30 Hz")
+    print("="*70)
+    fs1 = 10
+    x_n1, x_n_comp1, indices1, info1 = amostragem_completa(x_t, t, fs1)
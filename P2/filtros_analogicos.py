@@ -1,6 +1,8 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy import signal
+from P1.importacao_tardia import modulo_tardio
+
+plt = modulo_tardio('matplotlib.pyplot')
+signal = modulo_tardio('scipy.signal')
 
 def filtro_passa_baixa(fc, ordem=1):
     """
@@ -1,8 +1,22 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy import signal
-
-def filtro_RC(fc, tipo="passa-baixa", ordem=1, A=1.0, f_in=100, fase_in=0):
+from P1.importacao_tardia import modulo_tardio
+from P1.regime_permanente import regime_permanente_analogico
+
+plt = modulo_tardio('matplotlib.pyplot')
+signal = modulo_tardio('scipy.signal')
+
+def filtro_RC(fc, tipo="passa-baixa", ordem=1, A=1.0, f_in=100, fase_in=0, forma_onda="senoidal"):
+    """
+    Bode e resposta temporal de um filtro RC para uma entrada periódica de
+    frequência f_in.
+
+    forma_onda : str
+        "senoidal" (A cos(2π f_in t + fase_in)) ou "quadrada" (onda quadrada
+        de mesma amplitude, frequência e fase). Os valores impressos são os
+        da senoide/fundamental; a saída temporal da onda quadrada vem do
+        regime permanente calculado pela DFT de um período
+        (P1.regime_permanente), com os harmônicos até o 511º
+    """
     wc = 2 * np.pi * fc  # frequência angular de corte
 
     # # Define numerador e denominador conforme o tipo e a ordem
@@ -104,9 +118,20 @@ def filtro_RC(fc, tipo="passa-baixa", ordem=1, A=1.0, f_in=100, fase_in=0):
     plt.show()
 
     # Gera sinais de entrada e saída no tempo
-    t = np.linspace(0, 5/f_in, 1000)
-    vin = A * np.cos(2*np.pi*f_in*t + fase_in)
-    vout = A_out * np.cos(2*np.pi*f_in*t + fase_out)
+    if forma_onda == "senoidal":
+        t = np.linspace(0, 5/f_in, 1000)
+        vin = A * np.cos(2*np.pi*f_in*t + fase_in)
+        vout = A_out * np.cos(2*np.pi*f_in*t + fase_out)
+    elif forma_onda == "quadrada":
+        P = 1024
+        t_periodo = np.arange(P) / (P * f_in)
+        x_periodo = A * np.sign(np.cos(2*np.pi*f_in*t_periodo + fase_in))
+        y_periodo = regime_permanente_analogico(num, den, x_periodo, 1/f_in)
+        t = np.arange(5 * P) / (P * f_in)
+        vin = np.tile(x_periodo, 5)
+        vout = np.tile(y_periodo, 5)
+    else:
+        raise ValueError("forma_onda deve ser 'senoidal' ou 'quadrada'.")
 
     plt.figure(figsize=(10,4))
     plt.plot(t, vin, label="Entrada")
@@ -119,17 +144,18 @@ def filtro_RC(fc, tipo="passa-baixa", ordem=1, A=1.0, f_in=100, fase_in=0):
     plt.show()
 
 
-# Exemplo de uso
-# Exemplo 1: entrada = cos(50t)
-# f_in = 50 Hz (frequência linear)
-
-R=1*1e3
-C=10*1e-6
-tau=10
-# fc=1/(2*np.pi*R*C)
-fc=1/(2*np.pi*tau)
-print("Frequência de corte do Filtro igual a",fc)
-# filtro_RC(fc, tipo="passa-baixa", ordem=1, A=1, f_in=100)
-filtro_RC(fc, tipo="passa-alta", ordem=1, A=1, f_in=100)
-
-
+if __name__ == "__main__":
+    # Exemplo de uso
+    # Exemplo 1: entrada = cos(50t)
+    # f_in = 50 Hz (frequência linear)
+
+    R=1*1e3
+    C=10*1e-6
+    tau=10
+    # fc=1/(2*np.pi*R*C)
+    fc=1/(2*np.pi*tau)
+    print("Frequência de corte do Filtro igual a",fc)
+    # filtro_RC(fc, tipo="passa-baixa", ordem=1, A=1, f_in=100)
+    filtro_RC(fc, tipo="passa-alta", ordem=1, A=1, f_in=100)
+    # Mesmo filtro com onda quadrada: a saída inclui todos os harmônicos
+    filtro_RC(fc, tipo="passa-alta", ordem=1, A=1, f_in=100, forma_onda="quadrada")
@@ -0,0 +1,233 @@
+from fractions import Fraction
+import numpy as np
+from P1.importacao_tardia import modulo_tardio
+from .tabelas_kernel import avaliar_kernel, avaliar_tabela, tabela_kernel
+
+plt = modulo_tardio('matplotlib.pyplot')
+
+class Reamostrador:
+    """
+    Conversor de taxa de amostragem para fluxos contínuos, processados em
+    blocos de qualquer tamanho.
+
+    É a reconstrução limitada em banda de recuperacao_sinal avaliada nos
+    instantes da nova taxa: a saída m fica na posição m·fs_entrada/fs_saida
+    (em amostras de entrada) e é a soma das amostras vizinhas pesadas por um
+    sinc janelado (tabelas_kernel). A razão fs_entrada/fs_saida = p/q é
+    guardada como fração e a posição de cada saída é calculada em inteiros:
+    parte inteira (m·p) // q e fase (m·p) % q, acumuladas de bloco em bloco
+    em int do Python. Por isso não há deriva em relação a p/q, e depois de
+    finalizar o número total de saídas é exatamente ceil(N_entrada · q / p).
+
+    A razão é aproximada por p/q com q <= max_denominador
+    (Fraction.limit_denominator). As razões usuais são exatas (44100/48000
+    = 147/160, 48000/10000 = 24/5, e 48000/1.001 para 48000 = 1000/1001,
+    a menos do arredondamento do float). Nas outras, a posição da saída m
+    se desloca de m·erro_razao amostras de entrada, com
+    |erro_razao| <= 1/max_denominador (em geral perto de
+    1/(q·max_denominador)): com o padrão, no máximo uma amostra a cada 10^9
+    saídas. As fases ficam em int64 dentro de cada bloco, o que limita um
+    único bloco a cerca de 9·10^18/max_denominador saídas.
+
+    Estrutura:
+    - polifásica (q <= max_fases): um banco com os pesos de cada uma das q
+      fases é calculado na criação; cada saída é um produto escalar;
+    - q maior (razões "quebradas"): os pesos de cada fase saem da tabela
+      sobreamostrada por interpolação linear (estrutura de Farrow de 1ª ordem).
+
+    Na redução de taxa (fs_saida < fs_entrada) o kernel é alargado por
+    fs_entrada/fs_saida, o que leva o corte para fs_saida/2 (filtro
+    anti-aliasing).
+
+    Parâmetros:
+    -----------
+    fs_entrada, fs_saida : float
+        Taxas de amostragem (Hz). A razão é convertida em fração a partir da
+        representação decimal (44100 e 48000 dão 147/160)
+    K : int
+        Número de amostras do kernel na taxa mais baixa (padrão: 32)
+    janela : str
+        'kaiser', 'hann', 'retangular' ou 'cubico' (ver tabelas_kernel)
+    max_fases : int
+        Maior q para usar o banco polifásico (padrão: 4096)
+    max_denominador : int
+        Maior q da aproximação racional da razão (padrão: 10**9)
+    max_elementos : int
+        Tamanho máximo das matrizes de trabalho (saídas × amostras do
+        kernel); blocos grandes são calculados em partes, e a memória extra
+        fica fixa (~2 MB por matriz) para qualquer tamanho de bloco
+
+    Exemplo:
+    --------
+    >>> conversor = Reamostrador(44100, 48000)
+    >>> for bloco in blocos:
+    ...     saida = conversor.processar(bloco)
+    >>> resto = conversor.finalizar()
+    """
+
+    def __init__(self, fs_entrada, fs_saida, K=32, janela='kaiser', max_fases=4096,
+                 max_denominador=10**9, max_elementos=1 << 18):
+        exata = Fraction(repr(float(fs_entrada))) / Fraction(repr(float(fs_saida)))
+        razao = exata.limit_denominator(max_denominador)
+        self.p, self.q = razao.numerator, razao.denominator
+        # Deriva da posição por saída, em amostras de entrada (0 se a razão é exata)
+        self.erro_razao = float(razao - exata)
+        self._inteiro, self._resto = divmod(self.p, self.q)
+        self.fs_entrada, self.fs_saida = fs_entrada, fs_saida
+
+        # Escala do kernel: 1 para aumentar a taxa, fs_saida/fs_entrada para reduzir
+        self.escala = min(1.0, self.q / self.p)
+        K_efetivo = 4 if janela == 'cubico' else K
+        meia_largura = int(np.ceil(K_efetivo / 2 / self.escala))
+        self.deslocamentos = np.arange(-meia_largura, meia_largura + 1)
+        self.meia_largura = meia_largura
+        self.K, self.janela = K, janela
+        self.max_elementos = max_elementos
+
+        if self.q <= max_fases:
+            d = np.arange(self.q)[:, None] / self.q - self.deslocamentos[None, :]
+            self._banco = self.escala * avaliar_kernel(self.escala * d, K, janela)
+            self._tabela = None
+        else:
+            self._banco = None
+            self._tabela = tabela_kernel(1 / fs_entrada, 1 / fs_saida, K, janela)
+
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Volta ao estado inicial (nenhuma amostra recebida)."""
+        # O buffer começa com zeros "antes" do início do sinal: x[n] = 0, n < 0
+        self._buffer = np.zeros(self.meia_largura)
+        self._inicio = -self.meia_largura  # índice absoluto de _buffer[0]
+        self._n_entrada = 0                # amostras recebidas
+        self._m = 0                        # próxima saída
+        # Posição da próxima saída, (m·p)//q e (m·p) % q, acumulada em int do
+        # Python: não estoura em fluxos longos nem com p grande
+        self._base = 0
+        self._fase = 0
+
+    @property
+    def atraso(self):
+        """Amostras de entrada que precisam chegar depois da posição de uma saída."""
+        return self.meia_largura
+
+    def _calcular(self, m_fim):
+        """Saídas _m, ..., m_fim - 1 a partir do buffer."""
+        n = m_fim - self._m
+        saida = np.empty(n)
+        # Saídas por vez: as matrizes (saídas × deslocamentos) ficam com no
+        # máximo max_elementos, qualquer que seja o tamanho do bloco
+        passo = max(1, self.max_elementos // len(self.deslocamentos))
+        for inicio in range(0, n, passo):
+            # Posições relativas à próxima saída: fase + j·(p % q) < (n + 1)·q,
+            # pequeno o bastante para int64
+            j = np.arange(inicio, min(inicio + passo, n), dtype=np.int64)
+            acumulado = self._fase + j * self._resto
+            base = (self._base - self._inicio) + j * self._inteiro + acumulado // self.q
+            fase = acumulado % self.q
+            indices = base[:, None] + self.deslocamentos[None, :]
+            amostras = self._buffer[indices]
+
+            if self._banco is not None:
+                pesos = self._banco[fase]
+            else:
+                d = (fase / self.q)[:, None] - self.deslocamentos[None, :]
+                pesos = self.escala * avaliar_tabela(self._tabela, self.escala * d)
+            saida[inicio:inicio + len(j)] = np.sum(amostras * pesos, axis=1)
+
+        self._m = m_fim
+        total = self._fase + n * self._resto
+        self._base += n * self._inteiro + total // self.q
+        self._fase = total % self.q
+
+        # Descarta o que nenhuma saída futura usa
+        descartar = self._base - self.meia_largura - self._inicio
+        if descartar > 0:
+            self._buffer = self._buffer[descartar:]
+            self._inicio += descartar
+        return saida
+
+    def processar(self, bloco):
+        """
+        Recebe o próximo bloco de entrada e devolve todas as saídas que já
+        podem ser calculadas (as que dependem de amostras ainda não
+        recebidas ficam para o próximo bloco ou para finalizar).
+
+        Parâmetros:
+        -----------
+        bloco : array_like
+            Amostras de entrada (1D, qualquer tamanho, inclusive vazio)
+
+        Retorna:
+        --------
+        saida : ndarray
+            Amostras na taxa fs_saida
+        """
+        bloco = np.asarray(bloco, dtype=float).ravel()
+        self._buffer = np.concatenate([self._buffer, bloco])
+        self._n_entrada += len(bloco)
+
+        # Saída m fica pronta quando (m·p)//q + meia_largura <= n_entrada - 1
+        disponivel = self._n_entrada - self.meia_largura
+        m_fim = -(-disponivel * self.q // self.p) if disponivel > 0 else 0
+        if m_fim <= self._m:
+            return np.zeros(0)
+        return self._calcular(m_fim)
+
+    def finalizar(self):
+        """
+        Completa o sinal com zeros depois da última amostra e devolve as
+        saídas restantes, até o total ceil(N_entrada · q / p). Depois disso
+        o reamostrador volta ao estado inicial.
+        """
+        m_fim = -(-self._n_entrada * self.q // self.p)
+        saida = np.zeros(0)
+        if m_fim > self._m:
+            self._buffer = np.concatenate([self._buffer, np.zeros(self.meia_largura + 1)])
+            saida = self._calcular(m_fim)
+        self.reiniciar()
+        return saida
+
+
+def reamostrar(x, fs_entrada, fs_saida, K=32, janela='kaiser'):
+    """
+    Reamostra um sinal inteiro de fs_entrada para fs_saida (um Reamostrador
+    com um único bloco). Retorna ceil(len(x) · fs_saida / fs_entrada) amostras.
+    """
+    conversor = Reamostrador(fs_entrada, fs_saida, K, janela)
+    return np.concatenate([conversor.processar(x), conversor.finalizar()])
+
+
+if __name__ == "__main__":
+    # Fluxo de 2 s a 44,1 kHz, em blocos de tamanhos aleatórios, para 48 kHz
+    fs_entrada, fs_saida = 44100, 48000
+    f = 1000
+    x = np.sin(2 * np.pi * f * np.arange(2 * fs_entrada) / fs_entrada)
+
+    conversor = Reamostrador(fs_entrada, fs_saida)
+    rng = np.random.default_rng(0)
+    cortes = np.sort(rng.integers(0, len(x), 200))
+    blocos = [conversor.processar(b) for b in np.split(x, cortes)]
+    y = np.concatenate(blocos + [conversor.finalizar()])
+
+    esperado = np.sin(2 * np.pi * f * np.arange(len(y)) / fs_saida)
+    meio = slice(1000, len(y) - 1000)
+    print(f"{fs_entrada} → {fs_saida} Hz (p/q = {conversor.p}/{conversor.q}): "
+          f"{len(y)} saídas para {len(x)} entradas")
+    print(f"Erro máximo longe das bordas: {np.max(np.abs(y[meio] - esperado[meio])):.2e}")
+    print(f"Blocos e sinal inteiro iguais: {np.allclose(y, reamostrar(x, fs_entrada, fs_saida))}")
+
+    # 48 kHz → 10 kHz (fs do projetar_filtro_iir): 7 kHz fica acima de
+    # Nyquist e é atenuado pelo anti-aliasing
+    t = np.arange(48000) / 48000
+    x = np.sin(2 * np.pi * 1000 * t) + np.sin(2 * np.pi * 7000 * t)
+    y = reamostrar(x, 48000, 10000)
+    espectro = np.abs(np.fft.rfft(y)) / (len(y) / 2)
+    freqs = np.fft.rfftfreq(len(y), 1 / 10000)
+
+    plt.plot(freqs, 20 * np.log10(espectro + 1e-12))
+    plt.title('48 kHz → 10 kHz: tons de 1 kHz e 7 kHz (dobraria para 3 kHz)')
+    plt.xlabel('Frequência (Hz)')
+    plt.ylabel('Magnitude (dB)')
+    plt.grid(True)
+    plt.show()
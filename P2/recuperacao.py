@@ -1,8 +1,34 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from amostragem import amostragem
+from P1.graficos_decimados import plotar_decimado, stem_decimado
+from .amostragem import amostragem
+from .tabelas_kernel import tabela_kernel, avaliar_tabela
+from P1.importacao_tardia import modulo_tardio
 
-def recuperacao_sinal(x_n, T, dt=0.001):
+plt = modulo_tardio('matplotlib.pyplot')
+
+def _recuperacao_fft(x_n_valores, T, dt, t0):
+    """
+    Interpolação limitada em banda de um sinal periódico: as M amostras são
+    um período (período M·T) e o espectro rfft é completado com zeros até
+    L = round(M·T/dt) pontos. Exata para sinais periódicos com harmônicos
+    abaixo de fs/2; O((M + L) log L).
+    """
+    M = len(x_n_valores)
+    L = max(int(round(M * T / dt)), M)
+    X = np.fft.rfft(x_n_valores)
+    if M % 2 == 0 and L > M:
+        # Bin de Nyquist: com zeros acrescentados ele deixa de ser o último
+        # e vale por +fs/2 e -fs/2, então fica com metade para cada lado
+        X[-1] /= 2
+    Y = np.zeros(L // 2 + 1, dtype=complex)
+    Y[:len(X)] = X
+    x_recuperado = np.fft.irfft(Y, L) * (L / M)
+    t = t0 + np.arange(L) * (M * T / L)
+    return x_recuperado, t
+
+
+def recuperacao_sinal(x_n, T, dt=0.001, t_n=None, K=None, janela='kaiser',
+                      metodo='sinc', tamanho_bloco=1 << 16, max_elementos=1 << 18):
     """
     Conversão Digital → Analógica: x[n] → x(t)
     
@@ -10,105 +36,147 @@ def recuperacao_sinal(x_n, T, dt=0.001):
     x_r(t) = Σ x[n] * h_r(t - nT)
     onde h_r(t) = sin(πt/T) / (πt/T)  [função sinc]
     
+    Métodos:
+    - 'sinc' com K=None: soma completa, todas as amostras para cada ponto
+      de saída (O(pontos · amostras), em blocos de pontos)
+    - 'sinc' com K inteiro: sinc truncado nas K amostras mais próximas e
+      multiplicado por uma janela (O(pontos · K)); K = 16 a 32 já fica
+      muito perto da soma completa longe das bordas. Os pesos vêm da tabela
+      de tabelas_kernel, calculada uma vez por (T, dt, K, janela)
+    - 'fft': as amostras são tratadas como um período de um sinal
+      periódico e o espectro é completado com zeros (O(L log L)); a saída
+      cobre exatamente um período, de t_n[0] a t_n[0] + M·T
+    
     Parâmetros:
-    - x_n: sinal discreto (amostrado) - pode ser vetor esparso com zeros
+    - x_n: amostras compactas x(nT) (retorno de amostragem) ou, sem t_n,
+      trem de impulsos denso na grade dt (amostragem(..., trem_impulsos=True))
     - T: período de amostragem
     - dt: resolução temporal para reconstrução (padrão: 0.001s)
+    - t_n: instantes das amostras compactas (retorno de amostragem). Com
+      t_n, a grade de reconstrução vai de 0 até o último instante + T
+    - K: número de amostras do kernel truncado (None: sinc completo)
+    - janela: 'kaiser', 'hann', 'retangular' ou 'cubico' (só com K)
+    - metodo: 'sinc' ou 'fft'
+    - tamanho_bloco: máximo de pontos de saída calculados por vez
+    - max_elementos: tamanho máximo da matriz de trabalho (pontos do bloco ×
+      amostras no sinc completo, ou × K no truncado); o bloco é reduzido
+      para caber, e a memória fica fixa (~2 MB por matriz) para qualquer
+      duração do sinal
     
     Retorna:
     - x_recuperado: sinal contínuo recuperado x(t)
     - t: vetor de tempo correspondente
     """
     
-    # Extrair apenas as amostras não-zero (valores de x[n])
-    indices_amostras = []
-    valores_amostras = []
-    
-    for i in range(len(x_n)):
-        if x_n[i] != 0:
-            indices_amostras.append(i)
-            valores_amostras.append(x_n[i])
+    x_n = np.asarray(x_n)
+    if t_n is None:
+        # Trem de impulsos denso: as amostras ficam nos pontos da grade mais
+        # próximos de nT (como em amostragem), inclusive as que valem zero
+        L = len(x_n)
+        n_amostras = int(np.floor((L - 1) * dt / T + 1e-9)) + 1
+        t_amostras = np.arange(n_amostras) * T
+        x_n_valores = x_n[np.minimum(np.round(t_amostras / dt).astype(int), L - 1)]
+        t = np.arange(L) * dt
+    else:
+        t_amostras = np.asarray(t_n)
+        x_n_valores = x_n
+        t = np.arange(int(round((t_amostras[-1] + T) / dt))) * dt
     
-    # Converter índices para tempo: t = n*T
-    t_amostras = np.array(indices_amostras) * dt
-    x_n_valores = np.array(valores_amostras)
+    if metodo == 'fft':
+        return _recuperacao_fft(x_n_valores, T, dt, t_amostras[0])
+    if metodo != 'sinc':
+        raise ValueError("metodo deve ser 'sinc' ou 'fft'.")
     
-    # Criar vetor de tempo contínuo para reconstrução
-    t = np.arange(len(x_n)) * dt
+    x_recuperado = np.zeros(len(t), dtype=np.result_type(x_n_valores, float))
     
-    # Inicializar sinal recuperado
-    x_recuperado = np.zeros(len(t))
+    if K is None:
+        # Aplicar a fórmula de recuperação: x_r(t) = Σ x[n] * sinc((t-nT)/T),
+        # uma matriz (bloco × amostras) por vez
+        passo = max(1, min(tamanho_bloco, max_elementos // max(len(t_amostras), 1)))
+        for inicio in range(0, len(t), passo):
+            bloco = t[inicio:inicio + passo]
+            x_recuperado[inicio:inicio + passo] = \
+                np.sinc((bloco[:, None] - t_amostras[None, :]) / T) @ x_n_valores
+        return x_recuperado, t
     
-    # Aplicar a fórmula de recuperação: x_r(t) = Σ x[n] * sinc((t-nT)/T)
-    for n, (t_n, x_n_val) in enumerate(zip(t_amostras, x_n_valores)):
-        # Calcular h_r(t - nT) = sin(π(t-nT)/T) / (π(t-nT)/T)
-        arg = np.pi * (t - t_n) / T
-        
-        # Calcular sinc, tratando o caso t = nT (sinc(0) = 1)
-        sinc_values = np.zeros_like(arg)
-        mask = arg != 0
-        sinc_values[mask] = np.sin(arg[mask]) / arg[mask]
-        sinc_values[~mask] = 1.0  # h_r(0) = 1
-        
-        # Acumular contribuição de cada amostra
-        x_recuperado += x_n_val * sinc_values
+    # Kernel truncado: amostras uniformes t_amostras[0] + kT; cada ponto de
+    # saída usa as K amostras n com -K/2 <= u - n < K/2, u = (t - t0)/T
+    # (o suporte da tabela), ou seja, n de floor(u - K/2) + 1 a floor(u + K/2)
+    M = len(x_n_valores)
+    tabela = tabela_kernel(T, dt, K, janela)
+    K = tabela['K']
+    deslocamentos = np.arange(K)
+    passo = max(1, min(tamanho_bloco, max_elementos // len(deslocamentos)))
+    for inicio in range(0, len(t), passo):
+        u = (t[inicio:inicio + passo] - t_amostras[0]) / T
+        indices = (np.floor(u - K / 2).astype(int) + 1)[:, None] + deslocamentos[None, :]
+        validos = (indices >= 0) & (indices < M)
+        valores = np.where(validos, x_n_valores[np.clip(indices, 0, M - 1)], 0)
+        pesos = avaliar_tabela(tabela, u[:, None] - indices)
+        x_recuperado[inicio:inicio + passo] = np.sum(valores * pesos, axis=1)
     
     return x_recuperado, t
 
 
 # ========== DEMONSTRAÇÃO COMPLETA: x(t) → x[n] → x(t) ==========
 
-# 1. Criar sinal analógico original x(t)
-duracao = 1  # 1 segundo
-dt = 0.001  # resolução de 1ms
-t_original = np.arange(0, duracao, dt)
-frequencia_sinal = 5  # Hz
-x_t_original = np.sin(2 * np.pi * frequencia_sinal * t_original)
+if __name__ == "__main__":
+    # 1. Criar sinal analógico original x(t)
+    duracao = 1  # 1 segundo
+    dt = 0.001  # resolução de 1ms
+    t_original = np.arange(0, duracao, dt)
+    frequencia_sinal = 5  # Hz
+    x_t_original = np.sin(2 * np.pi * frequencia_sinal * t_original)
 
-print("=" * 60)
-print("CONVERSÃO ANALÓGICA → DIGITAL → ANALÓGICA")
-print("=" * 60)
+    print("=" * 60)
+    print("CONVERSÃO ANALÓGICA → DIGITAL → ANALÓGICA")
+    print("=" * 60)
 
-# Testar com diferentes frequências de amostragem
-fig, axes = plt.subplots(3, 1, figsize=(14, 10))
+    # Testar com diferentes frequências de amostragem
+    fig, axes = plt.subplots(3, 1, figsize=(14, 10))
 
-for idx, fs in enumerate([15, 20, 50]):
-    print(f"\n--- Teste com fs = {fs} Hz ---")
-    
-    # PASSO 1: Amostragem x(t) → x[n]
-    T = 1/fs  # Período de amostragem
-    x_n = amostragem(x_t_original, fs)
-    n_amostras = sum(1 for v in x_n if v != 0)
-    print(f"✓ Amostragem concluída: {n_amostras} amostras")
-    
-    # PASSO 2: Recuperação x[n] → x(t)
-    x_t_recuperado, t_recuperado = recuperacao_sinal(x_n, T, dt)
-    print(f"✓ Recuperação concluída")
-    
-    # Plotar
-    ax = axes[idx]
-    ax.plot(t_original, x_t_original, 'b-', label='x(t) Original', 
-            alpha=0.7, linewidth=2)
-    ax.plot(t_recuperado, x_t_recuperado, 'g--', 
-            label='x(t) Recuperado', linewidth=2, alpha=0.8)
-    
-    markerline, stemlines, baseline = ax.stem(t_original, x_n, 
-                                               linefmt='r-', 
-                                               markerfmt='ro', 
-                                               basefmt='k-', 
-                                               label=f'x[n] (fs={fs} Hz)')
-    markerline.set_alpha(0.5)
-    stemlines.set_alpha(0.5)
-    
-    ax.set_xlabel('Tempo (s)')
-    ax.set_ylabel('Amplitude')
-    ax.set_title(f'Recuperação do Sinal com fs={fs} Hz, T={T:.3f}s')
-    ax.legend(loc='upper right')
-    ax.grid(True, alpha=0.3)
-
-plt.tight_layout()
-plt.show()
-
-print("\n" + "=" * 60)
-print("Conversão completa!")
-print("=" * 60)
\ No newline at end of file
+    for idx, fs in enumerate([15, 20, 50]):
+        print(f"\n--- Teste com fs = {fs} Hz ---")
+
+        # PASSO 1: Amostragem x(t) → x[n]
+        T = 1/fs  # Período de amostragem
+        x_n, t_n = amostragem(x_t_original, fs, dt)
+        print(f"✓ Amostragem concluída: {len(x_n)} amostras")
+
+        # PASSO 2: Recuperação x[n] → x(t)
+        x_t_recuperado, t_recuperado = recuperacao_sinal(x_n, T, dt, t_n=t_n)
+        print(f"✓ Recuperação concluída")
+
+        # Kernel truncado (K = 32) e interpolação por FFT (sinal periódico em 1 s)
+        x_t_janelado, _ = recuperacao_sinal(x_n, T, dt, t_n=t_n, K=32)
+        x_t_fft, _ = recuperacao_sinal(x_n, T, dt, t_n=t_n, metodo='fft')
+        print(f"  Diferença sinc janelado (K=32) x sinc completo: "
+              f"{np.max(np.abs(x_t_janelado - x_t_recuperado)):.4f}")
+        print(f"  Erro da interpolação por FFT: {np.max(np.abs(x_t_fft - x_t_original)):.2e}")
+
+        # Plotar
+        ax = axes[idx]
+        plotar_decimado(ax, t_original, x_t_original, 'b-', label='x(t) Original', 
+                        alpha=0.7, linewidth=2)
+        plotar_decimado(ax, t_recuperado, x_t_recuperado, 'g--', 
+                        label='x(t) Recuperado', linewidth=2, alpha=0.8)
+
+        stem_decimado(ax, t_n, x_n, 
+                      linefmt='r-', 
+                      markerfmt='ro', 
+                      basefmt='k-', 
+                      label=f'x[n] (fs={fs} Hz)',
+                      alpha=0.5)
+
+        ax.set_xlabel('Tempo (s)')
+        ax.set_ylabel('Amplitude')
+        ax.set_title(f'Recuperação do Sinal com fs={fs} Hz, T={T:.3f}s')
+        ax.legend(loc='upper right')
+        ax.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    plt.show()
+
+    print("\n" + "=" * 60)
+    print("Conversão completa!")
+    print("=" * 60)
@@ -0,0 +1,124 @@
+from fractions import Fraction
+from functools import lru_cache
+import numpy as np
+from P1.importacao_tardia import modulo_tardio
+
+plt = modulo_tardio('matplotlib.pyplot')
+
+def kernel_janelado(d, K, janela='kaiser'):
+    """
+    Sinc truncado em |d| < K/2 (d em períodos de amostragem) e multiplicado
+    pela janela: 'kaiser' (β = 8), 'hann' ou 'retangular'.
+    """
+    d = np.asarray(d, dtype=float)
+    x = d / (K / 2)
+    dentro = np.abs(x) < 1
+    if janela == 'kaiser':
+        beta = 8.0
+        w = np.i0(beta * np.sqrt(np.clip(1 - x**2, 0, None))) / np.i0(beta)
+    elif janela == 'hann':
+        w = 0.5 * (1 + np.cos(np.pi * x))
+    elif janela == 'retangular':
+        w = np.ones_like(x)
+    else:
+        raise ValueError("janela deve ser 'kaiser', 'hann', 'retangular' ou 'cubico'.")
+    return np.where(dentro, np.sinc(d) * w, 0.0)
+
+
+def kernel_cubico(d):
+    """Kernel cúbico de Keys (a = -1/2), suporte |d| < 2."""
+    d = np.abs(np.asarray(d, dtype=float))
+    perto = 1.5 * d**3 - 2.5 * d**2 + 1
+    longe = -0.5 * d**3 + 2.5 * d**2 - 4 * d + 2
+    return np.where(d < 1, perto, np.where(d < 2, longe, 0.0))
+
+
+def avaliar_kernel(d, K, janela='kaiser'):
+    """Valor exato do kernel em d: kernel_cubico se janela='cubico', senão kernel_janelado."""
+    return kernel_cubico(d) if janela == 'cubico' else kernel_janelado(d, K, janela)
+
+
+def _sobreamostragem(T, dt, minimo=64, max_denominador=4096):
+    """
+    Pontos da tabela por período de amostragem. Se dt/T = p/q, as posições
+    t/T dos pontos de saída caem em múltiplos de 1/q: com um múltiplo par de
+    q, toda consulta cai exatamente numa entrada da tabela.
+    """
+    razao = Fraction(dt / T).limit_denominator(max_denominador)
+    if abs(float(razao) - dt / T) > 1e-12 * dt / T:
+        return 512
+    q = razao.denominator * (1 if razao.denominator % 2 == 0 else 2)
+    return q * -(-minimo // q)
+
+
+@lru_cache(maxsize=64)
+def tabela_kernel(T, dt, K, janela='kaiser'):
+    """
+    Tabela sobreamostrada de um kernel de interpolação, calculada uma vez
+    por (T, dt, K, janela) e guardada em cache.
+
+    Com a tabela, reconstruir ou reamostrar de novo nas mesmas taxas (como
+    no laço fs in [15, 20, 50] de recuperacao) não chama sin nem i0: cada
+    peso é uma interpolação linear entre duas entradas (avaliar_tabela). A
+    sobreamostragem é escolhida a partir de dt/T para que, quando a razão é
+    racional, as consultas caiam exatamente sobre as entradas.
+
+    Parâmetros:
+    -----------
+    T : float
+        Período de amostragem das amostras
+    dt : float
+        Passo dos pontos de saída
+    K : int
+        Número de amostras do kernel (ignorado para 'cubico', que usa 4)
+    janela : str
+        'kaiser', 'hann' ou 'retangular' (sinc janelado) ou 'cubico' (Keys)
+
+    Retorna:
+    --------
+    tabela : dict
+        'K', 'janela', 'sobreamostragem' (entradas por período T) e
+        'valores' (kernel em d = -K/2, ..., K/2, somente leitura)
+    """
+    if janela == 'cubico':
+        K = 4
+    S = _sobreamostragem(T, dt)
+    d = np.arange(K * S + 1) / S - K / 2
+    valores = avaliar_kernel(d, K, janela)
+    valores.setflags(write=False)
+    return {'K': K, 'janela': janela, 'sobreamostragem': S, 'valores': valores}
+
+
+def avaliar_tabela(tabela, d):
+    """
+    Kernel em d (em períodos de amostragem, qualquer formato) por
+    interpolação linear entre entradas da tabela; zero fora de |d| < K/2.
+    """
+    valores = tabela['valores']
+    posicao = (np.asarray(d, dtype=float) + tabela['K'] / 2) * tabela['sobreamostragem']
+    dentro = (posicao >= 0) & (posicao < len(valores) - 1)
+    i = np.clip(np.floor(posicao).astype(int), 0, len(valores) - 2)
+    fracao = posicao - i
+    return np.where(dentro, valores[i] * (1 - fracao) + valores[i + 1] * fracao, 0.0)
+
+
+if __name__ == "__main__":
+    # Mesmas taxas da demonstração de recuperacao: a tabela de cada fs é
+    # calculada uma vez e reaproveitada
+    dt = 0.001
+    for fs in [15, 20, 50, 15, 20, 50]:
+        tabela = tabela_kernel(1 / fs, dt, 32)
+        d = np.arange(-16000, 16000) * dt * fs
+        erro = np.max(np.abs(avaliar_tabela(tabela, d) - kernel_janelado(d, 32)))
+        print(f"fs = {fs} Hz: {tabela['sobreamostragem']} entradas por período, erro {erro:.1e}")
+    print(tabela_kernel.cache_info())
+
+    d = np.linspace(-17, 17, 2000)
+    for janela in ['kaiser', 'hann', 'retangular', 'cubico']:
+        plt.plot(d, avaliar_tabela(tabela_kernel(1 / 20, dt, 32, janela), d), label=janela)
+    plt.title('Kernels de Interpolação (K = 32)')
+    plt.xlabel('d (períodos de amostragem)')
+    plt.ylabel('h(d)')
+    plt.legend()
+    plt.grid(True)
+    plt.show()
@@ -1,6 +1,8 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy import signal
+from P1.importacao_tardia import modulo_tardio
+
+plt = modulo_tardio('matplotlib.pyplot')
+signal = modulo_tardio('scipy.signal')
 
 def filtro_RC(fc=None, tipo="passa-baixa", ordem=1, A=1.0, f_in=100, fase_in=0):
     """
@@ -82,5 +84,6 @@ def filtro_RC(fc=None, tipo="passa-baixa", ordem=1, A=1.0, f_in=100, fase_in=0):
     plt.show()
 
 
-# === Teste ===
-filtro_RC(A=1, f_in=2)
+if __name__ == "__main__":
+    # === Teste ===
+    filtro_RC(A=1, f_in=2)
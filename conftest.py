@@ -0,0 +1,2 @@
+# Raiz do repositório no sys.path, para os testes importarem P1 e P2
+# também quando rodados com `pytest` (e não só `python -m pytest`).
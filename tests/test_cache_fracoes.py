@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from P1.cache_fracoes import CacheDecomposicoes
+from P1.solve_eq_parciais import decomposicao_fracao_parcial
+
+
+@pytest.mark.parametrize('arquivo', [None, 'fracoes'])
+def test_consultas_nao_compartilham_estado_gravavel(tmp_path, arquivo):
+    caminho = None if arquivo is None else str(tmp_path / arquivo)
+    cache = CacheDecomposicoes(arquivo=caminho)
+    primeiro = cache.decompor(numerador=[1, 2], denominador=[1, -3, 2])
+    primeiro['decomposicao'] = 'alterado'
+    with pytest.raises(ValueError):
+        primeiro['residuos'][0] = 0
+
+    segundo = cache.decompor(numerador=[1, 2], denominador=[1, -3, 2])
+    assert segundo is not primeiro
+    assert segundo['decomposicao'] != 'alterado'
+    assert cache.estatisticas()['acertos_memoria'] == 1
+
+    if caminho is not None:
+        cache.fechar()
+        do_disco = CacheDecomposicoes(arquivo=caminho).decompor(numerador=[1, 2], denominador=[1, -3, 2])
+        assert not do_disco['residuos'].flags.writeable
+        np.testing.assert_allclose(do_disco['residuos'], segundo['residuos'])
+
+
+@pytest.mark.parametrize('pares', [
+    (dict(numerador=[1, 2], denominador=[1, -3, 2]), dict(numerador=[2, 4], denominador=[2, -6, 4])),
+    (dict(numerador=[1, -1], denominador=[1, -3, 2]), dict(numerador=[-3, 3], denominador=[-3, 9, -6])),
+    (dict(expressao="(x + 2)/(x**2 - 3*x + 2)"), dict(expressao="(2*x + 4)/(2*x**2 - 6*x + 4)")),
+    (dict(expressao="(x + 2)/(x**2 - 3*x + 2)", racional=True),
+     dict(expressao="(2*x + 4)/(2*x**2 - 6*x + 4)", racional=True)),
+    (dict(expressao="(x - 1)/(x**2 - 3*x + 2)", racional=True),
+     dict(expressao="(3*x - 3)/(3*x**2 - 9*x + 6)", racional=True)),
+    (dict(expressao="x/(x**2 + a)"), dict(expressao="(2*a*x)/(2*a*x**2 + 2*a**2)")),
+])
+def test_expressao_escalada_reaproveita_o_resultado(pares):
+    cache = CacheDecomposicoes()
+    primeiro, escalado = (cache.decompor(**argumentos) for argumentos in pares)
+    assert cache.estatisticas()['faltas'] == 1
+    for argumentos, resultado in zip(pares, (primeiro, escalado)):
+        esperado = decomposicao_fracao_parcial(**argumentos)
+        for campo in ('original_str', 'simplificada', 'denominador_fatorado',
+                      'houve_simplificacao', 'decomposicao'):
+            assert str(resultado[campo]) == str(esperado[campo])
+
+
+def test_escala_nao_gera_nova_falta():
+    cache = CacheDecomposicoes()
+    cache.decompor("2*x/(2*x**2 + 2)")
+    cache.decompor("x/(x**2 + 1)")
+    estatisticas = cache.estatisticas()
+    assert estatisticas['faltas'] == 1
+    assert estatisticas['acertos_memoria'] == 1
+
+
+def test_formatacao_diferente_reaproveita_o_resultado():
+    cache = CacheDecomposicoes()
+    cache.decompor("(x + 2)/(x**2 - 3*x + 2)")
+    cache.decompor("(x+2) / (x**2 - 3*x + 2)")
+    assert cache.estatisticas()['acertos_memoria'] == 1
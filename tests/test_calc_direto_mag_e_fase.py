@@ -0,0 +1,26 @@
+import multiprocessing
+
+import numpy as np
+from scipy import signal
+
+from P1.calc_direto_mag_e_fase import calcular_mag_fase, funcoes_mag_fase, simplificar_com_limite
+
+
+def test_valores_iguais_ao_freqz():
+    num, den = [0.038, 0.034], [1, -1.63, 0.70]
+    w = np.linspace(0, np.pi, 257)
+    _, H = signal.freqz([0] + num, den, worN=w)
+    mag, fase = calcular_mag_fase(num, den, w)
+    np.testing.assert_allclose(mag, np.abs(H), rtol=1e-12)
+    np.testing.assert_allclose(fase, np.angle(H), atol=1e-12)
+
+    mag_func, fase_func, _, _ = funcoes_mag_fase(num, den)
+    np.testing.assert_allclose(mag_func(w), mag)
+    np.testing.assert_allclose(fase_func(w), fase)
+
+
+def test_simplificar_sem_processo_restante():
+    _, _, mag_expr, _ = funcoes_mag_fase([0.038, 0.034], [1, -1.63, 0.70])
+    # Tempo curto demais: volta a expressão original
+    assert simplificar_com_limite(mag_expr, tempo_limite=1e-6) == mag_expr
+    assert multiprocessing.active_children() == []
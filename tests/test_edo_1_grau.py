@@ -0,0 +1,52 @@
+import math
+
+import numpy as np
+import pytest
+
+from P1.edo_1_grau import estatisticas_1_grau, varrer_parametros
+
+
+def _laco_escalar(taus, ks, v0s, t):
+    return np.array([[k + (v0 - k) * math.exp(-ti / tau) for ti in t]
+                     for tau, k, v0 in zip(taus, ks, v0s)])
+
+
+@pytest.fixture
+def parametros():
+    rng = np.random.default_rng(1)
+    return rng.uniform(0.5, 5, 257), rng.uniform(-1, 1, 257), rng.uniform(0, 10, 257)
+
+
+@pytest.mark.parametrize('tamanho_bloco', [1, 10, 256, 1 << 16])
+def test_varredura_igual_ao_laco_escalar(parametros, tamanho_bloco):
+    t = np.linspace(0, 10, 31)
+    esperado = _laco_escalar(*parametros, t)
+    y = varrer_parametros(*parametros, t, tamanho_bloco=tamanho_bloco)
+    np.testing.assert_allclose(y, esperado, rtol=1e-12, atol=1e-12)
+
+    maximo = varrer_parametros(*parametros, t, reducao=lambda y: np.max(np.abs(y), axis=-1),
+                               tamanho_bloco=tamanho_bloco)
+    np.testing.assert_allclose(maximo, np.max(np.abs(esperado), axis=-1), rtol=1e-12)
+
+
+def test_varredura_com_broadcasting():
+    taus = np.array([0.5, 1.0, 2.0])[:, None]
+    ks = np.array([-1.0, 0.0, 1.0, 2.0])
+    t = np.linspace(0, 3, 7)
+    y = varrer_parametros(taus, ks, 5.0, t, tamanho_bloco=5)
+    assert y.shape == (3, 4, 7)
+    for i, tau in enumerate(taus[:, 0]):
+        for j, k in enumerate(ks):
+            np.testing.assert_allclose(y[i, j], _laco_escalar([tau], [k], [5.0], t)[0], rtol=1e-12)
+
+    final = varrer_parametros(taus, ks, 5.0, t, reducao=lambda y: y[:, -1], tamanho_bloco=5)
+    np.testing.assert_allclose(final, y[..., -1])
+
+
+def test_tempo_de_acomodacao_pela_trajetoria():
+    tau, k, v0 = 2.0, 1.0, 6.0
+    estatisticas = estatisticas_1_grau(tau, k, v0, tolerancia=0.02)
+    t = np.linspace(0, 20, 200_001)
+    y = _laco_escalar([tau], [k], [v0], t)[0]
+    fora = np.abs(y - k) > 0.02 * abs(v0 - k)
+    assert t[fora][-1] == pytest.approx(estatisticas['tempo_acomodacao'], abs=1e-3)
@@ -0,0 +1,16 @@
+import numpy as np
+import pytest
+from scipy import signal
+
+from P1 import expandir_polinomio
+
+
+@pytest.mark.parametrize("ordem", [128, 200])
+def test_butterworth_ordem_alta_preserva_coeficientes_pequenos(ordem):
+    _, polos, _ = signal.butter(ordem, 0.3, output='zpk')
+    den = expandir_polinomio.expandir_raizes(polos)
+    referencia = np.real(np.poly(polos))
+    # O termo constante é ~1e-36 (ordem 128) ou ~1e-55 (ordem 200): o erro
+    # precisa ser pequeno em relação a cada coeficiente, não ao maior
+    assert np.abs(referencia[-1]) < 1e-30
+    np.testing.assert_allclose(den, referencia, rtol=1e-9, atol=0)
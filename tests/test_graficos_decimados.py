@@ -0,0 +1,73 @@
+import matplotlib
+import numpy as np
+import pytest
+
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from P1.graficos_decimados import _cor_do_formato, envelope_min_max, plotar_decimado, stem_decimado
+
+
+@pytest.mark.parametrize('fmt, cor', [('r-', 'r'), ('^r', 'r'), ('--g', 'g'), ('red', 'red'),
+                                      ('C1--', 'C1'), ('o:', 'C0')])
+def test_cor_em_qualquer_posicao_do_formato(fmt, cor):
+    assert _cor_do_formato(fmt) == cor
+
+
+def test_envelope_preserva_extremos_e_limita_tamanho():
+    rng = np.random.default_rng(0)
+    x = np.arange(100_000)
+    y = rng.normal(size=len(x))
+    y[12_345], y[67_890] = 50.0, -50.0
+    x_env, y_env = envelope_min_max(x, y, 500)
+    assert len(x_env) == len(y_env) <= 2 * 500
+    assert y_env.max() == y.max() and y_env.min() == y.min()
+    # Cada par (mínimo, máximo) é o de um trecho contíguo de y
+    assert np.all(y_env[0::2] <= y_env[1::2])
+    assert np.all(np.diff(x_env[0::2]) > 0)
+
+
+def test_envelope_de_sinal_curto_guarda_todas_as_amostras():
+    x = np.arange(10.0)
+    y = np.sin(x)
+    x_env, y_env = envelope_min_max(x, y, 100)
+    np.testing.assert_array_equal(np.unique(y_env), np.unique(y))
+
+
+def test_plotar_decimado_redecima_ao_dar_zoom():
+    fig, ax = plt.subplots()
+    x = np.arange(200_000)
+    y = np.sin(2 * np.pi * x / 1000.0)
+    y[150_000] = 5.0
+    linha = plotar_decimado(ax, x, y, max_pontos=400)
+    assert len(linha.get_xdata()) <= 400
+    assert np.max(linha.get_ydata()) == 5.0
+
+    # Zoom num trecho curto: volta a desenhar as próprias amostras
+    ax.set_xlim(1000, 1100)
+    x_vis = linha.get_xdata()
+    assert len(x_vis) <= 400
+    assert x_vis[0] <= 1000 and x_vis[-1] >= 1100
+    np.testing.assert_array_equal(linha.get_ydata(), y[x_vis])
+
+    # Zoom num trecho longo que contém o pico: decimado, com o pico
+    ax.set_xlim(100_000, 200_000)
+    assert len(linha.get_xdata()) <= 400
+    assert np.max(linha.get_ydata()) == 5.0
+    assert np.min(linha.get_xdata()) >= 100_000 - 1
+    plt.close(fig)
+
+
+def test_stem_decimado_redecima_ao_dar_zoom():
+    fig, ax = plt.subplots()
+    x = np.arange(50_000)
+    y = np.cos(x / 100.0)
+    y[40_000] = -3.0
+    hastes = stem_decimado(ax, x, y, max_pontos=200)
+    assert len(hastes.get_segments()) <= 100
+    ax.set_xlim(30_000, 50_000)
+    segmentos = hastes.get_segments()
+    assert len(segmentos) <= 100
+    assert min(s[:, 1].min() for s in segmentos) == -3.0
+    assert min(s[0, 0] for s in segmentos) >= 30_000 - 1
+    plt.close(fig)
@@ -0,0 +1,37 @@
+import json
+import os
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Importar todos os submódulos de P1 e P2 só deve custar o numpy; folga
+# grande para máquinas lentas, mas bem abaixo do ~1 s de scipy/sympy/matplotlib
+ORCAMENTO_SEGUNDOS = 1.0
+
+_SCRIPT = """
+import importlib, json, sys, time
+inicio = time.perf_counter()
+import P1, P2
+for pacote in (P1, P2):
+    for nome in pacote.__all__:
+        importlib.import_module(f'{pacote.__name__}.{nome}')
+duracao = time.perf_counter() - inicio
+pesados = sorted(m for m in ('matplotlib', 'scipy', 'sympy') if m in sys.modules)
+print(json.dumps({'duracao': duracao, 'pesados': pesados}))
+"""
+
+
+def _importar_tudo():
+    # Interpretador novo: o sys.modules do pytest já pode ter essas bibliotecas
+    saida = subprocess.run([sys.executable, '-c', _SCRIPT], cwd=RAIZ, capture_output=True,
+                           text=True, check=True, env=dict(os.environ, MPLBACKEND='Agg'))
+    return json.loads(saida.stdout.strip().splitlines()[-1])
+
+
+def test_importacao_nao_carrega_bibliotecas_pesadas():
+    assert _importar_tudo()['pesados'] == []
+
+
+def test_tempo_de_importacao():
+    assert _importar_tudo()['duracao'] < ORCAMENTO_SEGUNDOS
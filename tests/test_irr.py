@@ -0,0 +1,17 @@
+import pytest
+
+from P2.IRR import projetar_filtro_iir
+
+
+@pytest.mark.parametrize('fs_reject', [5000, 6000])
+def test_rejeicao_em_fs_2_ou_acima(fs_reject):
+    # ωs >= π: não há faixa de rejeição em [0, π] para validar
+    resultado = projetar_filtro_iir(fs=10000, fp=1000, fs_reject=fs_reject,
+                                    plotar=False, testar=False)
+    assert resultado['specs']['stopband_ok']
+    assert len(resultado['a_z']) == resultado['specs']['N'] + 1
+
+
+def test_rejeicao_abaixo_de_fs_2_validada_no_zoom():
+    resultado = projetar_filtro_iir(fs=10000, fp=1000, fs_reject=1500, plotar=False, testar=False)
+    assert resultado['specs']['stopband_ok']
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from scipy import signal
+
+from P1.lfilter import estado_inicial, filtrar_com_condicoes
+
+SISTEMAS = [
+    ([1], [1, -0.9]),
+    ([0.5, 0.5], [1, -0.8]),
+    ([0.2, 0.3, -0.1], [2, -1.2, 0.5]),
+    ([1, -1, 0.5, 0.25], [1, 0.3]),
+    ([0.1, 0.2], [1, -1.5, 0.7, -0.1]),
+]
+
+
+@pytest.mark.parametrize('b, a', SISTEMAS)
+@pytest.mark.parametrize('n_y, n_x', [(1, 0), (3, 0), (2, 1), (3, 3)])
+def test_estado_inicial_igual_ao_lfiltic(b, a, n_y, n_x):
+    rng = np.random.default_rng(2)
+    condicoes_y = rng.normal(size=(4, n_y))
+    condicoes_x = rng.normal(size=(4, n_x)) if n_x else None
+    zi = estado_inicial(b, a, condicoes_y, condicoes_x)
+    for i in range(len(condicoes_y)):
+        esperado = signal.lfiltic(b, a, condicoes_y[i], None if condicoes_x is None else condicoes_x[i])
+        np.testing.assert_allclose(zi[i], esperado, rtol=1e-12, atol=1e-14)
+
+
+@pytest.mark.parametrize('b, a', SISTEMAS)
+def test_filtrar_com_condicoes_igual_ao_lfilter(b, a):
+    rng = np.random.default_rng(3)
+    x = rng.normal(size=(5, 64))
+    condicoes_y = rng.normal(size=(5, 3))
+    condicoes_x = rng.normal(size=(5, 2))
+    y = filtrar_com_condicoes(b, a, x, condicoes_y, condicoes_x)
+    for i in range(len(x)):
+        zi = signal.lfiltic(b, a, condicoes_y[i], condicoes_x[i])
+        np.testing.assert_allclose(y[i], signal.lfilter(b, a, x[i], zi=zi)[0], rtol=1e-10, atol=1e-12)
+
+
+def test_filtrar_uma_entrada_para_varias_condicoes():
+    b, a = [0.2, 0.3, -0.1], [1, -1.2, 0.5]
+    x = np.sin(np.arange(50) / 3)
+    condicoes_y = np.array([[0.0, 0.0], [1.0, -1.0], [2.0, 0.5]])
+    y = filtrar_com_condicoes(b, a, x, condicoes_y)
+    assert y.shape == (3, 50)
+    for linha, condicoes in zip(y, condicoes_y):
+        esperado = signal.lfilter(b, a, x, zi=signal.lfiltic(b, a, condicoes))[0]
+        np.testing.assert_allclose(linha, esperado, rtol=1e-10, atol=1e-12)
+
+
+def test_sistema_sem_memoria():
+    x = np.arange(5.0)
+    np.testing.assert_allclose(filtrar_com_condicoes([2.0], [4.0], x, np.zeros(0)), x / 2)
@@ -0,0 +1,57 @@
+import multiprocessing
+import os
+
+import pytest
+
+import P1.lote_fracoes as lote_fracoes
+from P1.lote_fracoes import decompor_em_lote
+from P1.solve_eq_parciais import decomposicao_fracao_parcial
+
+LENTA = "(x**3 + 1)/(x**8 - 3.1*x**5 + 2.2*x**3 - 0.7*x + 1.3)"
+
+
+def test_tarefas_em_texto_e_dict_voltam_com_o_proprio_indice():
+    tarefas = [
+        "(x + 2)/(x**2 - 3*x + 2)",
+        {'numerador': "z", 'denominador': "z**2 - 1/4", 'variavel': 'z'},
+        {'expressao': "(x + 1)/(x**2 + 3*x + 2)", 'racional': False},
+    ]
+    resultados = dict(decompor_em_lote(tarefas, processos=2))
+    assert sorted(resultados) == [0, 1, 2]
+    assert resultados[0]['decomposicao'] == str(decomposicao_fracao_parcial(tarefas[0], racional=True)['decomposicao'])
+    assert resultados[1]['decomposicao'] == str(decomposicao_fracao_parcial(**tarefas[1], racional=True)['decomposicao'])
+    assert resultados[2]['decomposicao'] == decomposicao_fracao_parcial(**tarefas[2])['decomposicao']
+    assert not any('erro' in r or r.get('tempo_esgotado') for r in resultados.values())
+
+
+def test_tempo_esgotado_refaz_pelo_caminho_numerico():
+    resultados = dict(decompor_em_lote([LENTA, "1/(x - 1)"], tempo_limite=0.05, processos=1))
+    assert resultados[0]['tempo_esgotado'] is True
+    assert resultados[0]['metodo'] == 'numerico'
+    # O processo substituto continua com a tarefa seguinte
+    assert 'erro' not in resultados[1]
+
+
+def test_tarefa_malformada_volta_com_erro():
+    tarefas = ["(x + 1)/(", {'expressao': "1/(x - 1)", 'argumento_invalido': 1}, "1/(x - 1)"]
+    resultados = dict(decompor_em_lote(tarefas, processos=1))
+    assert 'erro' in resultados[0]
+    assert 'erro' in resultados[1]
+    assert 'erro' not in resultados[2]
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != 'fork',
+                    reason="o trabalhador só herda a função trocada com fork")
+def test_processo_que_morre_nao_conta_como_tempo_esgotado(monkeypatch):
+    original = lote_fracoes.decomposicao_fracao_parcial
+
+    def morre_na_primeira(**kwargs):
+        if kwargs.get('expressao') == "morre":
+            os._exit(3)
+        return original(**kwargs)
+
+    monkeypatch.setattr(lote_fracoes, 'decomposicao_fracao_parcial', morre_na_primeira)
+    resultados = dict(decompor_em_lote(["morre", "1/(x - 1)"], processos=1))
+    assert 'tempo_esgotado' not in resultados[0]
+    assert '3' in resultados[0]['erro']
+    assert 'erro' not in resultados[1]
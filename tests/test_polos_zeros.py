@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from P1 import polos_zeros
+
+
+def test_jury_lista_de_graus_diferentes():
+    polinomios = [[1, -0.5], [1, -0.5, 0.06], [1, -2.5, 1]]
+    esperado = [bool(np.all(np.abs(np.roots(p)) < 1)) for p in polinomios]
+    assert list(polos_zeros.teste_jury(polinomios)) == esperado == [True, True, False]
+
+
+def test_jury_polinomio_unico():
+    assert polos_zeros.teste_jury([1, -0.5, 0.06]) is True
+    assert polos_zeros.teste_jury(np.array([1, -2.5, 1])) is False
+
+
+def test_lote_2d_inteiro_nao_trunca_coeficientes():
+    raizes = polos_zeros.raizes_em_lote(np.array([[2, -3, 1]]))
+    np.testing.assert_allclose(np.sort(raizes[0].real), [0.5, 1])
+
+    polos, raio_max, estavel = polos_zeros.analisar_estabilidade_em_lote(np.array([[3, -2, -2]]))
+    assert raio_max[0] == pytest.approx(np.max(np.abs(np.roots([3, -2, -2]))))
+    assert not estavel[0]
@@ -0,0 +1,44 @@
+import numpy as np
+from P2.reamostrador import Reamostrador, reamostrar
+
+
+def _reamostrar_em_blocos(conversor, x, n_blocos):
+    saidas = [conversor.processar(bloco) for bloco in np.array_split(x, n_blocos)]
+    return np.concatenate(saidas + [conversor.finalizar()])
+
+
+def test_taxa_nao_inteira_sem_estouro():
+    # 48000/1.001 → 48000: com a razão do repr do float, p passaria de 1e15
+    fs_entrada, fs_saida, f = 48000 / 1.001, 48000, 1000
+    x = np.sin(2 * np.pi * f * np.arange(30000) / fs_entrada)
+    conversor = Reamostrador(fs_entrada, fs_saida)
+    y = _reamostrar_em_blocos(conversor, x, 37)
+
+    assert len(y) == -(-len(x) * conversor.q // conversor.p)
+    esperado = np.sin(2 * np.pi * f * np.arange(len(y)) / fs_saida)
+    assert np.max(np.abs(y - esperado)[100:-100]) < 1e-3
+    assert np.allclose(y, reamostrar(x, fs_entrada, fs_saida))
+
+
+def test_razao_menor_que_um():
+    conversor = Reamostrador(1 / 3, 1)
+    assert (conversor.p, conversor.q) == (1, 3)
+    y = _reamostrar_em_blocos(conversor, np.ones(300), 7)
+    assert len(y) == 900
+
+
+def test_fluxo_longo_conta_exata():
+    # Razão irracional: a contagem segue ceil(N·q/p) sem deriva entre blocos
+    conversor = Reamostrador(1000, 1000 * 2 ** 0.5)
+    total = sum(len(conversor.processar(np.zeros(100000))) for _ in range(20))
+    total += len(conversor.finalizar())
+    assert total == -(-2000000 * conversor.q // conversor.p)
+
+
+def test_bloco_grande_em_partes_igual_ao_inteiro():
+    x = np.random.default_rng(0).standard_normal(5000)
+    inteiro = Reamostrador(48000, 10000, max_elementos=1 << 30)
+    em_partes = Reamostrador(48000, 10000, max_elementos=500)
+    y_inteiro = np.concatenate([inteiro.processar(x), inteiro.finalizar()])
+    y_partes = np.concatenate([em_partes.processar(x), em_partes.finalizar()])
+    assert np.allclose(y_partes, y_inteiro, rtol=0, atol=1e-12)
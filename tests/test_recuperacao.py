@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from P2.amostragem import amostragem
+from P2.recuperacao import recuperacao_sinal
+from P2.tabelas_kernel import avaliar_tabela, tabela_kernel
+
+
+def test_fft_identidade_com_m_par():
+    # T == dt: nada é acrescentado e a reconstrução devolve as amostras
+    x = np.random.default_rng(0).normal(size=16)
+    y, t = recuperacao_sinal(x, 0.001, 0.001, t_n=np.arange(16) * 0.001, metodo='fft')
+    assert np.allclose(y, x)
+
+
+def test_fft_senoide_periodica():
+    t = np.arange(0, 1, 0.001)
+    x = np.sin(2 * np.pi * 5 * t)
+    x_n, t_n = amostragem(x, 20)
+    y, t_y = recuperacao_sinal(x_n, 1 / 20, 0.001, t_n=t_n, metodo='fft')
+    assert len(y) == len(x)
+    assert np.max(np.abs(y - x)) < 1e-12
+
+
+@pytest.mark.parametrize('K', [8, 9, 4])
+@pytest.mark.parametrize('fs', [15, 20, 30, 50])
+def test_kernel_truncado_igual_a_soma_direta(K, fs):
+    # Todas as amostras dentro do suporte da tabela entram, com K par ou ímpar
+    dt = 0.001
+    t = np.arange(0, 1, dt)
+    x_n, t_n = amostragem(np.sin(2 * np.pi * 3 * t) + 0.3 * np.cos(2 * np.pi * 5 * t), fs)
+    y, t_y = recuperacao_sinal(x_n, 1 / fs, dt, t_n=t_n, K=K)
+
+    tabela = tabela_kernel(1 / fs, dt, K)
+    u = (t_y - t_n[0]) * fs
+    direto = avaliar_tabela(tabela, u[:, None] - np.arange(len(x_n))[None, :]) @ x_n
+    assert np.max(np.abs(y - direto)) < 1e-12
@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from P1.regime_permanente import regime_permanente
+
+
+def test_senoide_com_polo_em_outra_frequencia():
+    # Polo duplo em z = 1 (integrador) e entrada senoidal de média nula: as
+    # raias de X fora de ±1 não são exatamente zero, mas só de arredondamento
+    P = 20
+    x = np.sin(2 * np.pi * np.arange(P) / P + 0.3)
+    b, a = [1.0], [1.0, -2.0, 1.0]
+    y = regime_permanente(b, a, x)
+    # y[n] - 2y[n-1] + y[n-2] = x[n] no regime
+    np.testing.assert_allclose(y - 2 * np.roll(y, 1) + np.roll(y, 2), x, atol=1e-9)
+
+
+def test_componente_no_polo_continua_erro():
+    with pytest.raises(ValueError):
+        regime_permanente([1.0], [1.0, -1.0], np.ones(8))
+
+
+def test_entrada_nula():
+    np.testing.assert_array_equal(regime_permanente([1.0], [1.0, -0.5], np.zeros(8)), 0)
@@ -0,0 +1,24 @@
+import numpy as np
+
+from P1.resposta_frequencia import calcular_resposta_frequencia
+
+
+def test_compativel_com_a_tupla_antiga():
+    resposta = calcular_resposta_frequencia([1, 1], [1, -0.5], N=64)
+    tupla = tuple(resposta)
+    assert len(resposta) == len(tupla) == 6
+    assert resposta[0] is resposta.w
+    assert resposta[-1] is resposta.fase_graus
+    assert all(a is b for a, b in zip(resposta[1:3], (resposta.H, resposta.mag)))
+    w, H, mag, mag_dB, fase, fase_graus = resposta
+    assert np.allclose(mag, np.abs(H))
+
+
+def test_indexar_so_calcula_o_campo_pedido():
+    resposta = calcular_resposta_frequencia([1, 1], [1, -0.5], N=64)
+    resposta[0], resposta[1]
+    assert not {'mag', 'mag_dB', 'fase', 'fase_graus'} & set(vars(resposta))
+    resposta[-1]
+    assert 'fase_graus' in vars(resposta) and 'mag_dB' not in vars(resposta)
+    resposta[2:3]
+    assert 'mag' in vars(resposta) and 'mag_dB' not in vars(resposta)
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from scipy import signal
+
+from P1.salto_recorrencia import avaliar_salto, preparar_salto, recorrencia_em
+
+SISTEMAS = [
+    ([1], [1, -0.5]),
+    ([0.2, 0.3, -0.1], [1, -1.2, 0.5]),
+    ([1, 0.5], [2, -1.5, 0.9, -0.2]),
+    ([0.5, 1, 0.25, 0.1], [1, 0.3]),
+]
+
+
+def _referencia(b, a, x, condicoes, condicoes_x):
+    if condicoes is None and condicoes_x is None:
+        return signal.lfilter(b, a, x)
+    zi = signal.lfiltic(b, a, [0.0] if condicoes is None else condicoes, condicoes_x)
+    return signal.lfilter(b, a, x, zi=zi)[0]
+
+
+@pytest.mark.parametrize('b, a', SISTEMAS)
+@pytest.mark.parametrize('entrada', [0.0, 1.5, [1.0, -2.0, 0.5, 3.0, 0.0]])
+@pytest.mark.parametrize('condicoes, condicoes_x', [
+    (None, None), ([1.0, -0.5, 0.25], None), (None, [2.0, 1.0, -1.0]), ([0.3, 0.7], [-1.0]),
+])
+def test_recorrencia_em_igual_ao_lfilter(b, a, entrada, condicoes, condicoes_x):
+    n = np.arange(300)
+    x = np.resize(np.atleast_1d(entrada), len(n)).astype(float)
+    esperado = _referencia(b, a, x, condicoes, condicoes_x)
+    y = recorrencia_em(b, a, n, entrada, condicoes, condicoes_x)
+    np.testing.assert_allclose(y, esperado, rtol=1e-9, atol=1e-12)
+
+
+def test_avaliar_salto_horizontes_esparsos_e_fora_de_ordem():
+    b, a = [0.2, 0.3, -0.1], [1, -1.2, 0.5]
+    periodo = [1.0, 0.0, -1.0]
+    salto = preparar_salto(b, a, periodo, condicoes=[2.0, 1.0], condicoes_x=[0.5])
+    x = np.resize(periodo, 5000)
+    esperado = signal.lfilter(b, a, x, zi=signal.lfiltic(b, a, [2.0, 1.0], [0.5]))[0]
+
+    n = np.array([[4999, 0], [1234, 7]])
+    np.testing.assert_allclose(avaliar_salto(salto, n), esperado[n], rtol=1e-9, atol=1e-12)
+    # As potências guardadas na primeira chamada valem para as seguintes
+    np.testing.assert_allclose(avaliar_salto(salto, 3), esperado[3], rtol=1e-9)
+
+
+def test_horizonte_negativo():
+    with pytest.raises(ValueError):
+        recorrencia_em([1], [1, -0.5], [-1])
@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+from scipy import signal
+
+from P1.solve_edo_homogenea_2_grau import raizes_com_multiplicidade, resolver_homogenea
+
+
+@pytest.mark.parametrize("raizes", [[0.5] * 4, [0.5] * 5, [0.9] * 4 + [-0.3, 0.2]])
+def test_raiz_repetida_de_multiplicidade_alta(raizes):
+    a = np.poly(raizes)
+    N = len(a) - 1
+    condicoes = np.linspace(1, -1, N)
+    n = np.arange(60)
+
+    distintas, multiplicidades = raizes_com_multiplicidade(a)
+    assert max(multiplicidades) == max(raizes.count(r) for r in raizes)
+
+    y, _ = resolver_homogenea(a, condicoes, n)
+    zi = signal.lfiltic([1], a, condicoes)
+    esperado, _ = signal.lfilter([1], a, np.zeros(len(n)), zi=zi)
+    np.testing.assert_allclose(y, esperado, rtol=1e-7, atol=1e-9 * np.max(np.abs(esperado)))
+
+
+def test_raizes_proximas_continuam_distintas():
+    _, multiplicidades = raizes_com_multiplicidade(np.poly([0.5, 0.5001]))
+    assert list(multiplicidades) == [1, 1]
@@ -0,0 +1,42 @@
+import numpy as np
+
+from P1.solve_eq_parciais import decomposicao_fracao_parcial, decomposicao_numerica
+
+
+def test_residuos_nulos_nao_aparecem_no_texto():
+    resultado = decomposicao_fracao_parcial(numerador=[1], denominador=[1, -3, 3, -1])
+    assert resultado['decomposicao'] == "1/(x - 1)**3"
+    # Os arrays continuam completos (z_inversa usa um termo por polo)
+    assert len(resultado['residuos']) == 3
+
+
+def test_caminho_numerico_devolve_texto():
+    resultado = decomposicao_fracao_parcial("(2*x + 3)/(x**2 - 1)")
+    assert resultado['metodo'] == 'numerico'
+    assert isinstance(resultado['resultado_completo'], str)
+
+
+def test_polos_proximos_pequenos_nao_sao_agrupados():
+    # 1e-5 e 2e-5 estão a menos de 1e-4 um do outro, mas são polos distintos
+    resultado = decomposicao_numerica([1], np.poly([1e-5, 2e-5]))
+    assert list(resultado['multiplicidades']) == [1, 1]
+    np.testing.assert_allclose(resultado['residuos'], [-1e5, 1e5])
+
+
+def test_polo_repetido_reconstroi_a_fracao():
+    num, den = [1, 2, 3, 4, 5, 6, 7, 8], np.poly([0.5, 0.5, 0.5, 2, 2, -1])
+    resultado = decomposicao_numerica(num, den)
+    assert list(resultado['multiplicidades']) == [1, 2, 3, 1, 1, 2]
+    x = np.array([0.37 + 0.9j, -1.3 + 0.2j, 2.1 - 0.4j])
+    soma = np.polyval(resultado['coef_polinomial'], x)
+    for r, p, m in zip(resultado['residuos'], resultado['polos'], resultado['multiplicidades']):
+        soma = soma + r / (x - p) ** m
+    np.testing.assert_allclose(soma, np.polyval(num, x) / np.polyval(den, x), rtol=1e-10)
+
+
+def test_texto_sem_partes_de_arredondamento():
+    # Os polos ±j saem de np.roots com parte real ~1e-16
+    resultado = decomposicao_numerica([1], np.poly([1j, -1j, 0.5]).real)
+    assert 'e-1' not in resultado['resultado_completo']
+    assert 'e-1' not in resultado['denominador_fatorado']
+    assert '(x - (0+1*I))' in resultado['denominador_fatorado']
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from scipy import signal
+
+from P1.z_inversa import resposta_impulso_contorno, resposta_impulso_fechada
+
+CASOS = [
+    ([1], np.poly([0.9])),
+    ([1, 0.5], np.poly([0.9] * 2)),
+    ([1], np.poly([0.9] * 3)),
+    ([1], np.poly([0.9] * 4)),
+    ([1, -0.2], np.poly([0.9] * 5)),
+    ([1, 0.3, 0.1], np.poly([0.7 + 0.5j, 0.7 - 0.5j, -0.4, 0.2]).real),
+    ([1, 2, 3, 4, 5], [1, -0.5]),
+    ([0, 0, 1], [1, -1.2, 0.5, 0, 0]),
+]
+
+
+def _referencia(num, den, n_amostras):
+    impulso = np.zeros(n_amostras)
+    impulso[0] = 1
+    return signal.lfilter(num, den, impulso)
+
+
+@pytest.mark.parametrize('num, den', CASOS)
+def test_forma_fechada_igual_ao_lfilter(num, den):
+    esperado = _referencia(num, den, 80)
+    h = resposta_impulso_fechada(num, den, np.arange(80))
+    np.testing.assert_allclose(h, esperado, rtol=0, atol=1e-8 * np.max(np.abs(esperado)))
+
+
+def test_forma_fechada_em_indices_esparsos():
+    num, den = [1], np.poly([0.9] * 4)
+    n = np.array([500, 3, 120])
+    esperado = _referencia(num, den, 501)[n]
+    np.testing.assert_allclose(resposta_impulso_fechada(num, den, n), esperado, rtol=1e-8)
+
+
+@pytest.mark.parametrize('num, den', CASOS)
+def test_contorno_igual_ao_lfilter(num, den):
+    h, info = resposta_impulso_contorno(num, den)
+    esperado = _referencia(num, den, len(h))
+    np.testing.assert_allclose(h, esperado, rtol=0, atol=1e-8 * np.max(np.abs(esperado)))